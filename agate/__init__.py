@@ -1,7 +1,7 @@
+from importlib import import_module
+
 import agate.csv_py3 as csv
-from agate.aggregations import *
 from agate.columns import Column
-from agate.computations import *
 from agate.config import get_option, set_option, set_options
 from agate.data_types import *
 from agate.exceptions import *
@@ -10,7 +10,56 @@ from agate.mapped_sequence import MappedSequence
 from agate.rows import Row
 from agate.table import Table
 from agate.tableset import TableSet
-from agate.testcase import AgateTestCase
 from agate.type_tester import TypeTester
 from agate.utils import *
 from agate.warns import DuplicateColumnWarning, NullCalculationWarning, warn_duplicate_column, warn_null_calculation
+
+# Names that are imported from these modules the first time they are used
+_lazy_names = {
+    'AgateTestCase': 'agate.testcase',
+    'PartitionedTable': 'agate.partitioned_table',
+    'Profiler': 'agate.profiler',
+    'external_sort': 'agate.external_sort',
+    'profile': 'agate.profiler',
+}
+
+# Packages whose public names are imported the first time any of them is used
+_lazy_packages = ['agate.aggregations', 'agate.computations']
+
+
+def __getattr__(name):
+    """
+    Import aggregations, computations and less commonly used classes when
+    they are first accessed (see :pep:`562`), so that :code:`import agate` is
+    fast.
+    """
+    if name == '__all__':
+        return __dir__()
+
+    if name in _lazy_names:
+        value = getattr(import_module(_lazy_names[name]), name)
+    elif name.startswith('_'):
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    else:
+        for package_name in _lazy_packages:
+            package = import_module(package_name)
+
+            if name in package.__dict__:
+                value = package.__dict__[name]
+                break
+        else:
+            raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    names = set(name for name in globals() if not name.startswith('_'))
+    names.update(_lazy_names)
+
+    for package_name in _lazy_packages:
+        names.update(name for name in vars(import_module(package_name)) if not name.startswith('_'))
+
+    return sorted(names)
@@ -15,6 +15,8 @@ with a column for each aggregation and a row for each table in the set.
 
 from agate.aggregations.all import All
 from agate.aggregations.any import Any
+from agate.aggregations.approx_count_distinct import ApproxCountDistinct
+from agate.aggregations.approx_percentiles import ApproxMedian, ApproxPercentiles
 from agate.aggregations.base import Aggregation
 from agate.aggregations.count import Count
 from agate.aggregations.deciles import Deciles
@@ -36,3 +36,15 @@ class All(Aggregation):
         data = column.values()
 
         return all(self._test(d) for d in data)
+
+    def init(self, table):
+        return True
+
+    def update(self, state, value):
+        return state and bool(self._test(value))
+
+    def merge(self, state, other):
+        return state and other
+
+    def finalize(self, state):
+        return state
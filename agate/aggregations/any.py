@@ -32,3 +32,15 @@ class Any(Aggregation):
         data = column.values()
 
         return any(self._test(d) for d in data)
+
+    def init(self, table):
+        return False
+
+    def update(self, state, value):
+        return state or bool(self._test(value))
+
+    def merge(self, state, other):
+        return state or other
+
+    def finalize(self, state):
+        return state
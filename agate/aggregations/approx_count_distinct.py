@@ -0,0 +1,56 @@
+from agate.aggregations.base import Aggregation
+from agate.data_types import Number
+from agate.sketches import HLL_MAX_PRECISION, HLL_MIN_PRECISION, HyperLogLog
+
+
+class ApproxCountDistinct(Aggregation):
+    """
+    Estimate the number of distinct non-null values in a column using a
+    :class:`.HyperLogLog` sketch.
+
+    Unlike counting :meth:`.Column.values_distinct`, which holds every
+    distinct value in memory, the sketch uses :code:`2 ** precision` bytes no
+    matter how many values it summarizes, and sketches of separate chunks of
+    data can be merged (see :meth:`.Aggregation.merge`).
+
+    The relative standard error of the estimate is about
+    :code:`1.04 / sqrt(2 ** precision)`, or 0.8% for the default precision.
+    Small counts are usually exact.
+
+    :param column_name:
+        The name of the column containing the values to be counted.
+    :param precision:
+        See :class:`.HyperLogLog`.
+    """
+    def __init__(self, column_name, precision=14):
+        if not HLL_MIN_PRECISION <= precision <= HLL_MAX_PRECISION:
+            raise ValueError('precision must be between %i and %i.' % (HLL_MIN_PRECISION, HLL_MAX_PRECISION))
+
+        self._column_name = column_name
+        self._precision = precision
+
+    def get_aggregate_data_type(self, table):
+        return Number()
+
+    def run(self, table):
+        state = self.init(table)
+
+        for value in table.columns[self._column_name].values_without_nulls():
+            state.update(value)
+
+        return self.finalize(state)
+
+    def init(self, table):
+        return HyperLogLog(self._precision)
+
+    def update(self, state, value):
+        if value is not None:
+            state.update(value)
+        return state
+
+    def merge(self, state, other):
+        state.merge(other)
+        return state
+
+    def finalize(self, state):
+        return state.count()
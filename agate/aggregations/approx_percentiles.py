@@ -0,0 +1,99 @@
+import math
+
+from agate.aggregations.base import Aggregation
+from agate.aggregations.has_nulls import HasNulls
+from agate.aggregations.percentiles import compute_percentiles
+from agate.data_types import Number
+from agate.exceptions import DataTypeError
+from agate.sketches import KLLSketch
+from agate.utils import Quantiles
+from agate.warns import warn_null_calculation
+
+
+class ApproxPercentiles(Aggregation):
+    """
+    Estimate the percentiles of a column using a :class:`.KLLSketch`.
+
+    Unlike :class:`Percentiles`, which must hold and sort every value, the
+    sketch uses a fixed amount of memory no matter how many values it
+    summarizes, and sketches of separate chunks of data can be merged (see
+    :meth:`.Aggregation.merge`).
+
+    Each percentile is computed from the estimated values at the same ranks as
+    :class:`Percentiles`. The rank of each estimated value is within
+    :code:`accuracy * n` of the exact rank with high probability, where
+    :code:`n` is the number of values. The "zeroth" and "hundredth"
+    percentiles are always exact.
+
+    This aggregation can not be applied to a :class:`.TableSet`.
+
+    :param column_name:
+        The name of a column containing :class:`.Number` data.
+    :param accuracy:
+        The normalized rank error to allow, between 0 and 1. Memory use is
+        proportional to :code:`1 / accuracy`.
+    """
+    def __init__(self, column_name, accuracy=0.01):
+        if not 0 < accuracy < 1:
+            raise ValueError('accuracy must be greater than 0 and less than 1.')
+
+        self._column_name = column_name
+        self._accuracy = accuracy
+        self._k = int(math.ceil(2 / accuracy))
+
+    def validate(self, table):
+        column = table.columns[self._column_name]
+
+        if not isinstance(column.data_type, Number):
+            raise DataTypeError('%s can only be applied to columns containing Number data.' % self)
+
+        has_nulls = HasNulls(self._column_name).run(table)
+
+        if has_nulls:
+            warn_null_calculation(self, column)
+
+    def run(self, table):
+        """
+        :returns:
+            An instance of :class:`Quantiles`.
+        """
+        state = self.init(table)
+
+        for value in table.columns[self._column_name].values_without_nulls():
+            state.update(value)
+
+        return self.finalize(state)
+
+    def init(self, table):
+        return KLLSketch(self._k)
+
+    def update(self, state, value):
+        if value is not None:
+            state.update(value)
+        return state
+
+    def merge(self, state, other):
+        state.merge(other)
+        return state
+
+    def finalize(self, state):
+        return Quantiles(compute_percentiles(state, select=KLLSketch.values_at))
+
+
+class ApproxMedian(ApproxPercentiles):
+    """
+    Estimate the median of a column using a :class:`.KLLSketch`.
+
+    See :class:`ApproxPercentiles` for implementation details and error
+    bounds.
+
+    :param column_name:
+        The name of a column containing :class:`.Number` data.
+    :param accuracy:
+        See :class:`ApproxPercentiles`.
+    """
+    def get_aggregate_data_type(self, table):
+        return Number()
+
+    def finalize(self, state):
+        return compute_percentiles(state, (50,), select=KLLSketch.values_at)[0]
@@ -12,6 +12,14 @@ class Aggregation:  # pragma: no cover
     :meth:`.Aggregation.run` are of the type specified by
     :meth:`.Aggregation.get_aggregate_data_type`. This can be ensured by using
     the :meth:`.DataType.cast` method. See :class:`.Summary` for an example.
+
+    Aggregations may optionally support incremental execution by implementing
+    :meth:`.Aggregation.init`, :meth:`.Aggregation.update`,
+    :meth:`.Aggregation.merge` and :meth:`.Aggregation.finalize`. This allows
+    methods such as :meth:`.Table.group_aggregate` to compute them in a single
+    pass over the rows, without first building a :class:`.Table` for each
+    group, and allows partial results computed from separate chunks of data
+    (for example, in parallel) to be combined.
     """
     def __str__(self):
         """
@@ -31,6 +39,14 @@ class Aggregation:  # pragma: no cover
         """
         raise UnsupportedAggregationError()
 
+    def get_column_name(self):
+        """
+        Get the name of the column this aggregation summarizes, or
+        :code:`None` if it is not applied to a single column, such as
+        :class:`.Count` with no arguments.
+        """
+        return getattr(self, '_column_name', None)
+
     def validate(self, table):
         """
         Perform any checks necessary to verify this aggregation can run on the
@@ -44,3 +60,68 @@ class Aggregation:  # pragma: no cover
         Execute this aggregation on a given column and return the result.
         """
         raise NotImplementedError()
+
+    def init(self, table):
+        """
+        Create the initial state for computing this aggregation incrementally.
+
+        The table is provided only so that its column names and types may be
+        inspected. Its rows will be passed to :meth:`update` separately.
+
+        Aggregations that do not support incremental execution should not
+        implement this method, in which case it raises
+        :class:`.UnsupportedAggregationError`.
+        """
+        raise UnsupportedAggregationError()
+
+    def update(self, state, value):
+        """
+        Add a single value to the state created by :meth:`init` and return the
+        new state.
+
+        :code:`value` is the value of this aggregation's column for one row.
+        For aggregations that are not applied to a column, such as
+        :class:`.Count` with no arguments, it is the :class:`.Row` itself.
+        """
+        raise NotImplementedError()
+
+    def merge(self, state, other):
+        """
+        Combine two states returned by :meth:`update` and return the combined
+        state. :code:`state` must have been computed from values that precede
+        those used to compute :code:`other`.
+        """
+        raise NotImplementedError()
+
+    def finalize(self, state):
+        """
+        Compute the result of this aggregation from a state returned by
+        :meth:`update`. The result must be the same as :meth:`run` would
+        return for the same values.
+        """
+        raise NotImplementedError()
+
+
+def _defining_class(cls, name):
+    """
+    Get the class in the method resolution order of :code:`cls` that defines
+    the attribute :code:`name`.
+    """
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return klass
+
+
+def _supports_incremental(aggregation):
+    """
+    Check whether an aggregation implements the incremental protocol. A
+    subclass that overrides :meth:`.Aggregation.run` without also overriding
+    :meth:`.Aggregation.finalize` does not, because its incremental methods
+    would not compute the same result.
+    """
+    cls = type(aggregation)
+
+    if _defining_class(cls, 'init') is Aggregation:
+        return False
+
+    return issubclass(_defining_class(cls, 'finalize'), _defining_class(cls, 'run'))
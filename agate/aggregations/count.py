@@ -31,3 +31,19 @@ class Count(Aggregation):
                 return table.columns[self._column_name].values().count(self._value)
             return len(table.columns[self._column_name].values_without_nulls())
         return len(table.rows)
+
+    def init(self, table):
+        return 0
+
+    def update(self, state, value):
+        if self._column_name is not None:
+            if self._value is not default:
+                return state + 1 if value == self._value else state
+            return state + 1 if value is not None else state
+        return state + 1
+
+    def merge(self, state, other):
+        return state + other
+
+    def finalize(self, state):
+        return state
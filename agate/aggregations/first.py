@@ -1,4 +1,5 @@
 from agate.aggregations.base import Aggregation
+from agate.utils import default
 
 
 class First(Aggregation):
@@ -37,3 +38,21 @@ class First(Aggregation):
             return data[0]
 
         return next(d for d in data if self._test(d))
+
+    def init(self, table):
+        return default
+
+    def update(self, state, value):
+        if state is default and (self._test is None or self._test(value)):
+            return value
+        return state
+
+    def merge(self, state, other):
+        if state is default:
+            return other
+        return state
+
+    def finalize(self, state):
+        if state is default:
+            raise ValueError('No values pass the given test.')
+        return state
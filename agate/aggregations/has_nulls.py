@@ -16,4 +16,16 @@ class HasNulls(Aggregation):
         return Boolean()
 
     def run(self, table):
-        return None in table.columns[self._column_name].values()
+        return table.columns[self._column_name].has_nulls()
+
+    def init(self, table):
+        return False
+
+    def update(self, state, value):
+        return state or value is None
+
+    def merge(self, state, other):
+        return state or other
+
+    def finalize(self, state):
+        return state
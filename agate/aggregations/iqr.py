@@ -1,6 +1,6 @@
 from agate.aggregations.base import Aggregation
 from agate.aggregations.has_nulls import HasNulls
-from agate.aggregations.percentiles import Percentiles
+from agate.aggregations.percentiles import column_percentiles
 from agate.data_types import Number
 from agate.exceptions import DataTypeError
 from agate.warns import warn_null_calculation
@@ -15,7 +15,6 @@ class IQR(Aggregation):
     """
     def __init__(self, column_name):
         self._column_name = column_name
-        self._percentiles = Percentiles(column_name)
 
     def get_aggregate_data_type(self, table):
         return Number()
@@ -32,7 +31,9 @@ class IQR(Aggregation):
             warn_null_calculation(self, column)
 
     def run(self, table):
-        percentiles = self._percentiles.run(table)
+        column = table.columns[self._column_name]
+
+        lower, upper = column_percentiles(column, (25, 75))
 
-        if percentiles[75] is not None and percentiles[25] is not None:
-            return percentiles[75] - percentiles[25]
+        if upper is not None and lower is not None:
+            return upper - lower
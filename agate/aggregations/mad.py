@@ -1,9 +1,9 @@
 from agate.aggregations.base import Aggregation
 from agate.aggregations.has_nulls import HasNulls
 from agate.aggregations.median import Median
+from agate.aggregations.percentiles import compute_percentiles
 from agate.data_types import Number
 from agate.exceptions import DataTypeError
-from agate.utils import median
 from agate.warns import warn_null_calculation
 
 
@@ -36,7 +36,7 @@ class MAD(Aggregation):
     def run(self, table):
         column = table.columns[self._column_name]
 
-        data = column.values_without_nulls_sorted()
+        data = column.values_without_nulls()
         if data:
             m = self._median.run(table)
-            return median(tuple(abs(n - m) for n in data))
+            return compute_percentiles([abs(n - m) for n in data], (50,))[0]
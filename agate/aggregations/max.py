@@ -34,3 +34,17 @@ class Max(Aggregation):
         data = column.values_without_nulls()
         if data:
             return max(data)
+
+    def init(self, table):
+        return None
+
+    def update(self, state, value):
+        if value is not None and (state is None or value > state):
+            return value
+        return state
+
+    def merge(self, state, other):
+        return self.update(state, other)
+
+    def finalize(self, state):
+        return state
@@ -41,3 +41,17 @@ class MaxLength(Aggregation):
             return Decimal('0')
 
         return Decimal(max(lens))
+
+    def init(self, table):
+        return 0
+
+    def update(self, state, value):
+        if value is not None and len(value) > state:
+            return len(value)
+        return state
+
+    def merge(self, state, other):
+        return max(state, other)
+
+    def finalize(self, state):
+        return Decimal(state)
@@ -1,7 +1,7 @@
 from agate.aggregations.base import Aggregation
 from agate.data_types import Number
 from agate.exceptions import DataTypeError
-from agate.utils import max_precision
+from agate.utils import max_precision, significant_places
 
 
 class MaxPrecision(Aggregation):
@@ -27,3 +27,20 @@ class MaxPrecision(Aggregation):
         column = table.columns[self._column_name]
 
         return max_precision(column.values_without_nulls())
+
+    def init(self, table):
+        return (1, 0)
+
+    def update(self, state, value):
+        value_places = significant_places(value)
+
+        if value_places is None:
+            return state
+
+        return (max(state[0], value_places[0]), max(state[1], value_places[1]))
+
+    def merge(self, state, other):
+        return (max(state[0], other[0]), max(state[1], other[1]))
+
+    def finalize(self, state):
+        return max_precision((), *state)
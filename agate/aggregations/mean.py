@@ -40,3 +40,21 @@ class Mean(Aggregation):
         if data:
             sum_total = self._sum.run(table)
             return sum_total / len(data)
+
+    def init(self, table):
+        return [self._sum.init(table), 0]
+
+    def update(self, state, value):
+        if value is not None:
+            state[0] += value
+            state[1] += 1
+        return state
+
+    def merge(self, state, other):
+        state[0] += other[0]
+        state[1] += other[1]
+        return state
+
+    def finalize(self, state):
+        if state[1]:
+            return state[0] / state[1]
@@ -1,6 +1,6 @@
 from agate.aggregations.base import Aggregation
 from agate.aggregations.has_nulls import HasNulls
-from agate.aggregations.percentiles import Percentiles
+from agate.aggregations.percentiles import column_percentiles
 from agate.data_types import Number
 from agate.exceptions import DataTypeError
 from agate.warns import warn_null_calculation
@@ -18,7 +18,6 @@ class Median(Aggregation):
     """
     def __init__(self, column_name):
         self._column_name = column_name
-        self._percentiles = Percentiles(column_name)
 
     def get_aggregate_data_type(self, table):
         return Number()
@@ -35,6 +34,6 @@ class Median(Aggregation):
             warn_null_calculation(self, column)
 
     def run(self, table):
-        percentiles = self._percentiles.run(table)
+        column = table.columns[self._column_name]
 
-        return percentiles[50]
+        return column_percentiles(column, (50,))[0]
@@ -4,10 +4,96 @@ from agate.aggregations.base import Aggregation
 from agate.aggregations.has_nulls import HasNulls
 from agate.data_types import Number
 from agate.exceptions import DataTypeError
-from agate.utils import Quantiles
+from agate.utils import Quantiles, nth_smallest
 from agate.warns import warn_null_calculation
 
 
+def compute_percentiles(data, percentiles=range(101), select=nth_smallest):
+    """
+    Compute percentiles of a sequence of values using the method described by
+    :class:`Percentiles`.
+
+    Only the values needed for the requested percentiles are located (see
+    :func:`.nth_smallest`), so computing a few percentiles does not require
+    sorting the data.
+
+    :param data:
+        A sequence of values, which must not contain nulls.
+    :param percentiles:
+        A sequence of integer percentiles from 0 to 100.
+    :param select:
+        A function that takes :code:`data` and a sequence of indices and
+        returns the values at those indices in the sorted data. Defaults to
+        :func:`.nth_smallest`.
+    :returns:
+        A list of values in the same order as :code:`percentiles`, or of
+        :code:`None` if there is no data.
+    """
+    length = len(data)
+
+    if not length:
+        return [None for percentile in percentiles]
+
+    bounds = []
+
+    for percentile in percentiles:
+        # Zeroth percentile is first datum
+        if percentile == 0:
+            bounds.append((1, 1))
+        # Hundredth percentile is final datum
+        elif percentile == 100:
+            bounds.append((length, length))
+        else:
+            k = length * (float(percentile) / 100)
+
+            low = max(1, int(math.ceil(k)))
+            high = min(length, int(math.floor(k + 1)))
+
+            bounds.append((low, high))
+
+    indices = sorted(set(i - 1 for bound in bounds for i in bound))
+    values = dict(zip(indices, select(data, indices)))
+
+    quantiles = []
+
+    for low, high in bounds:
+        # No remainder
+        if low == high:
+            value = values[low - 1]
+        # Remainder
+        else:
+            value = (values[low - 1] + values[high - 1]) / 2
+
+        quantiles.append(value)
+
+    return quantiles
+
+
+def column_percentiles(column, percentiles=range(101)):
+    """
+    Compute percentiles of the non-null values of a :class:`.Column` using
+    :func:`compute_percentiles`.
+
+    If the column's cache is enabled (for instance, when several aggregations
+    are applied by :meth:`.Table.aggregate`), the values are sorted once, using
+    the column's shared :meth:`.Column.sort_order`, and each percentile is
+    read from the sorted values. Otherwise only the values needed are located.
+
+    :param column:
+        A :class:`.Column`.
+    :param percentiles:
+        See :func:`compute_percentiles`.
+    """
+    if column.cache_enabled:
+        return compute_percentiles(column.values_without_nulls_sorted(), percentiles, select=_select_sorted)
+
+    return compute_percentiles(column.values_without_nulls(), percentiles)
+
+
+def _select_sorted(data_sorted, indices):
+    return [data_sorted[i] for i in indices]
+
+
 class Percentiles(Aggregation):
     """
     Divide a column into 100 equal-size groups using the "CDF" method.
@@ -47,30 +133,4 @@ class Percentiles(Aggregation):
         """
         column = table.columns[self._column_name]
 
-        data = column.values_without_nulls_sorted()
-
-        if not data:
-            return Quantiles([None for percentile in range(101)])
-
-        # Zeroth percentile is first datum
-        quantiles = [data[0]]
-
-        for percentile in range(1, 100):
-            k = len(data) * (float(percentile) / 100)
-
-            low = max(1, int(math.ceil(k)))
-            high = min(len(data), int(math.floor(k + 1)))
-
-            # No remainder
-            if low == high:
-                value = data[low - 1]
-            # Remainder
-            else:
-                value = (data[low - 1] + data[high - 1]) / 2
-
-            quantiles.append(value)
-
-        # Hundredth percentile is final datum
-        quantiles.append(data[-1])
-
-        return Quantiles(quantiles)
+        return Quantiles(column_percentiles(column))
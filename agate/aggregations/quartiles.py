@@ -1,6 +1,6 @@
 from agate.aggregations.base import Aggregation
 from agate.aggregations.has_nulls import HasNulls
-from agate.aggregations.percentiles import Percentiles
+from agate.aggregations.percentiles import column_percentiles
 from agate.data_types import Number
 from agate.exceptions import DataTypeError
 from agate.utils import Quantiles
@@ -42,6 +42,6 @@ class Quartiles(Aggregation):
         :returns:
             An instance of :class:`Quantiles`.
         """
-        percentiles = Percentiles(self._column_name).run(table)
+        column = table.columns[self._column_name]
 
-        return Quantiles([percentiles[i] for i in range(0, 101, 25)])
+        return Quantiles(column_percentiles(column, range(0, 101, 25)))
@@ -38,6 +38,20 @@ class StDev(Aggregation):
         if variance is not None:
             return variance.sqrt()
 
+    def init(self, table):
+        return self._variance.init(table)
+
+    def update(self, state, value):
+        return self._variance.update(state, value)
+
+    def merge(self, state, other):
+        return self._variance.merge(state, other)
+
+    def finalize(self, state):
+        variance = self._variance.finalize(state)
+        if variance is not None:
+            return variance.sqrt()
+
 
 class PopulationStDev(StDev):
     """
@@ -70,3 +84,17 @@ class PopulationStDev(StDev):
         variance = self._population_variance.run(table)
         if variance is not None:
             return variance.sqrt()
+
+    def init(self, table):
+        return self._population_variance.init(table)
+
+    def update(self, state, value):
+        return self._population_variance.update(state, value)
+
+    def merge(self, state, other):
+        return self._population_variance.merge(state, other)
+
+    def finalize(self, state):
+        variance = self._population_variance.finalize(state)
+        if variance is not None:
+            return variance.sqrt()
@@ -35,3 +35,22 @@ class Sum(Aggregation):
             start = datetime.timedelta()
 
         return sum(column.values_without_nulls(), start)
+
+    def init(self, table):
+        data_type = table.column_types[table.column_names.index(self._column_name)]
+
+        if isinstance(data_type, TimeDelta):
+            return datetime.timedelta()
+
+        return 0
+
+    def update(self, state, value):
+        if value is not None:
+            return state + value
+        return state
+
+    def merge(self, state, other):
+        return state + other
+
+    def finalize(self, state):
+        return state
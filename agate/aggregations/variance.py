@@ -41,6 +41,43 @@ class Variance(Aggregation):
             mean = self._mean.run(table)
             return sum((n - mean) ** 2 for n in data) / (len(data) - 1)
 
+    def init(self, table):
+        """
+        Variance is computed incrementally with Welford's algorithm, and
+        states are merged with Chan's parallel algorithm, so the state does
+        not grow with the number of rows. The state is a list of the count,
+        the running mean and the running sum of squared differences from the
+        mean.
+
+        Because the mean is updated with each value, rather than computed
+        once, the result may differ from :meth:`run` in the least significant
+        digits.
+        """
+        return [0, 0, 0]
+
+    def update(self, state, value):
+        if value is not None:
+            state[0] += 1
+            delta = value - state[1]
+            state[1] += delta / state[0]
+            state[2] += delta * (value - state[1])
+        return state
+
+    def merge(self, state, other):
+        count = state[0] + other[0]
+
+        if count and other[0]:
+            delta = other[1] - state[1]
+            state[1] += delta * other[0] / count
+            state[2] += other[2] + delta ** 2 * state[0] * other[0] / count
+            state[0] = count
+
+        return state
+
+    def finalize(self, state):
+        if state[0]:
+            return state[2] / (state[0] - 1)
+
 
 class PopulationVariance(Variance):
     """
@@ -76,3 +113,7 @@ class PopulationVariance(Variance):
         if data:
             mean = self._mean.run(table)
             return sum((n - mean) ** 2 for n in data) / len(data)
+
+    def finalize(self, state):
+        if state[0]:
+            return state[2] / state[0]
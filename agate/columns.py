@@ -5,8 +5,11 @@ parent :class:`.Table`, columns depend on knowledge of both their position in
 the parent (column name, data type) as well as the rows that contain their data.
 """
 
+import sys
+from functools import wraps
+
 from agate.mapped_sequence import MappedSequence
-from agate.utils import NullOrder, memoize
+from agate.utils import NullOrder, argsort
 
 
 def null_handler(k):
@@ -19,6 +22,61 @@ def null_handler(k):
     return k
 
 
+def sizeof(objects, seen):
+    """
+    Sum the sizes in bytes of objects, as reported by :func:`sys.getsizeof`,
+    counting each object only once.
+
+    :code:`None` and booleans are not counted, because they are shared by the
+    whole interpreter.
+
+    :param objects:
+        An iterable of objects.
+    :param seen:
+        A set of the ids of objects that have already been counted, to which
+        the ids of these objects are added.
+    """
+    total = 0
+    getsizeof = sys.getsizeof
+
+    for obj in objects:
+        if obj is None or obj is True or obj is False:
+            continue
+
+        key = id(obj)
+
+        if key not in seen:
+            seen.add(key)
+            total += getsizeof(obj)
+
+    return total
+
+
+def cached(func):
+    """
+    Decorator for :class:`Column` methods that take no arguments. If the
+    column's cache has been enabled (see :meth:`Column.enable_cache`) the
+    result is computed once and reused, otherwise it is computed every time.
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(self):
+        cache = self._cache
+
+        if cache is None:
+            return func(self)
+
+        try:
+            return cache[name]
+        except KeyError:
+            value = cache[name] = func(self)
+
+            return value
+
+    return wrapper
+
+
 class Column(MappedSequence):
     """
     Proxy access to column data. Instances of :class:`Column` should
@@ -39,7 +97,7 @@ class Column(MappedSequence):
     :param row_names:
         An optional list of row names (keys) for this column.
     """
-    __slots__ = ['_index', '_name', '_data_type', '_rows', '_row_names']
+    __slots__ = ['_index', '_name', '_data_type', '_rows', '_row_names', '_cache']
 
     def __init__(self, index, name, data_type, rows, row_names=None):
         self._index = index
@@ -47,6 +105,7 @@ class Column(MappedSequence):
         self._data_type = data_type
         self._rows = rows
         self._keys = row_names
+        self._cache = None
 
     def __getstate__(self):
         """
@@ -73,6 +132,7 @@ class Column(MappedSequence):
         self._data_type = data['_data_type']
         self._rows = data['_rows']
         self._keys = data['_keys']
+        self._cache = None
 
     @property
     def index(self):
@@ -95,37 +155,125 @@ class Column(MappedSequence):
         """
         return self._data_type
 
-    @memoize
+    @property
+    def cache_enabled(self):
+        """
+        Whether this column's cache has been enabled. See
+        :meth:`enable_cache`.
+        """
+        return self._cache is not None
+
+    def enable_cache(self):
+        """
+        Cache the values and derived sequences (such as sorted values) of
+        this column the first time they are computed, instead of recomputing
+        them every time they are accessed.
+
+        This uses additional memory for as long as the column exists, so it
+        is used for short-lived columns, such as those created by
+        :meth:`.Table.aggregate` when applying several aggregations.
+        """
+        if self._cache is None:
+            self._cache = {}
+
+    def memory_usage(self, deep=True):
+        """
+        Get the number of bytes used by this column's values and cache.
+
+        The values are stored in the table's rows, so they are shared with any
+        table that shares those rows, such as one created by
+        :meth:`.Table.where`. See :meth:`.Table.memory_usage`.
+
+        :param deep:
+            If :code:`True`, count the values themselves, such as each
+            :class:`decimal.Decimal` and :class:`str`. Otherwise, only count
+            the sequences in this column's cache (see :meth:`enable_cache`).
+        :returns:
+            An :class:`int`.
+        """
+        return self._memory_usage(deep, set())
+
+    def _memory_usage(self, deep, seen):
+        """
+        Count the bytes used by this column, skipping objects that have
+        already been counted. See :func:`sizeof`.
+        """
+        total = 0
+
+        if deep:
+            index = self._index
+            total += sizeof((row._values[index] for row in self._rows), seen)
+
+        if self._cache:
+            for value in self._cache.values():
+                total += sizeof([value], seen)
+
+                if deep and isinstance(value, (tuple, list)):
+                    total += sizeof(value, seen)
+
+        return total
+
+    @cached
     def values(self):
         """
         Get the values in this column, as a tuple.
         """
         return tuple(row[self._index] for row in self._rows)
 
-    @memoize
+    @cached
     def values_distinct(self):
         """
         Get the distinct values in this column, as a tuple.
         """
         return tuple(set(self.values()))
 
-    @memoize
+    @cached
     def values_without_nulls(self):
         """
         Get the values in this column with any null values removed.
         """
         return tuple(d for d in self.values() if d is not None)
 
-    @memoize
+    @cached
+    def has_nulls(self):
+        """
+        Check if this column contains any null values.
+        """
+        # Test by identity, since testing membership compares every value
+        # for equality with None, which is slow for Decimal values.
+        return any(d is None for d in self.values())
+
+    @cached
     def values_sorted(self):
         """
         Get the values in this column sorted.
         """
-        return sorted(self.values(), key=null_handler)
+        data = self.values_without_nulls_sorted()
+
+        return data + [None] * (len(self.values()) - len(data))
 
-    @memoize
+    @cached
     def values_without_nulls_sorted(self):
         """
         Get the values in this column with any null values removed and sorted.
+
+        If this column's cache is enabled, this is derived from
+        :meth:`sort_order`, so that the values are only sorted once.
+        """
+        if self._cache is None:
+            return sorted(self.values_without_nulls())
+
+        values = self.values()
+
+        return [values[i] for i in self.sort_order()[:len(self.values_without_nulls())]]
+
+    @cached
+    def sort_order(self):
+        """
+        Get the indices of the rows of this column in sorted order, with nulls
+        last and ties in their original order. See :func:`.utils.argsort`.
+
+        This order is shared by :meth:`.Table.order_by`, :class:`.Rank` and
+        the quantile aggregations when this column's cache is enabled.
         """
-        return sorted(self.values_without_nulls(), key=null_handler)
+        return argsort(self.values())
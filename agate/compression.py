@@ -0,0 +1,145 @@
+"""
+This module contains the functions that agate uses to open files that may be
+compressed with gzip, bz2 or lzma. The compression of a file is inferred from
+its extension, unless a :code:`compression` argument is given to the method
+reading or writing it.
+
+Compressed files are decompressed by the background thread of a
+:class:`.ThreadedReader`, which reads blocks of decompressed data ahead of the
+thread that parses them, and compressed by that of a :class:`.ThreadedWriter`.
+Data is never decompressed to disk.
+"""
+
+import importlib
+import io
+import os
+from collections import OrderedDict
+
+from agate.config import get_option
+from agate.threaded_io import ThreadedReader, ThreadedWriter
+
+#: The supported compressions, which are also the names of the modules that
+#: implement them, and the extensions of the files written with them
+COMPRESSIONS = OrderedDict([
+    ('gzip', '.gz'),
+    ('bz2', '.bz2'),
+    ('lzma', '.xz'),
+])
+
+#: Compressions, by the extensions of the files they are inferred from
+COMPRESSION_EXTENSIONS = OrderedDict([
+    ('.gz', 'gzip'),
+    ('.bz2', 'bz2'),
+    ('.xz', 'lzma'),
+    ('.lzma', 'lzma'),
+])
+
+
+def infer_compression(path, compression='infer'):
+    """
+    Get the compression of a file.
+
+    :param path:
+        Filepath, or file-like object.
+    :param compression:
+        One of :data:`COMPRESSIONS`, :code:`None` for no compression, or
+        :code:`'infer'` to infer it from the extension of :code:`path`.
+    :returns:
+        One of :data:`COMPRESSIONS`, or :code:`None`.
+    """
+    if compression == 'infer':
+        if not isinstance(path, (str, os.PathLike)):
+            return None
+
+        return COMPRESSION_EXTENSIONS.get(os.path.splitext(os.fspath(path))[1].lower())
+
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError('compression must be one of %s, None or "infer".' % ', '.join(COMPRESSIONS))
+
+    return compression
+
+
+def add_extension(path, compression):
+    """
+    Add the extension of a compression to a filepath.
+
+    :param compression:
+        One of :data:`COMPRESSIONS`, or :code:`None` or :code:`'infer'` to
+        add no extension.
+    """
+    compression = infer_compression(None, compression)
+
+    if compression is None:
+        return path
+
+    return path + COMPRESSIONS[compression]
+
+
+def strip_extension(path):
+    """
+    Remove the extension of a compression, if any, from a filepath.
+    """
+    root, ext = os.path.splitext(path)
+
+    if ext.lower() in COMPRESSION_EXTENSIONS:
+        return root
+
+    return path
+
+
+def open_input(path, encoding='utf-8', compression='infer'):
+    """
+    Open a filepath for reading text, decompressing it if it is compressed.
+    The file is read by a :class:`.ThreadedReader`, unless the
+    :code:`read_ahead` option is :code:`0`.
+
+    :param path:
+        Filepath to read.
+    :param encoding:
+        Character encoding of the file.
+    :param compression:
+        See :func:`infer_compression`.
+    """
+    compression = infer_compression(path, compression)
+
+    if not get_option('read_ahead'):
+        if compression is None:
+            return open(path, encoding=encoding)
+
+        return importlib.import_module(compression).open(path, 'rt', encoding=encoding)
+
+    if compression is None:
+        f = open(path, 'rb', buffering=0)
+    else:
+        f = importlib.import_module(compression).open(path, 'rb')
+
+    return io.TextIOWrapper(io.BufferedReader(ThreadedReader(f)), encoding=encoding)
+
+
+def open_output(path, encoding=None, compression='infer'):
+    """
+    Open a filepath for writing text, compressing it if necessary. The file
+    is written by a :class:`.ThreadedWriter`, unless the :code:`write_behind`
+    option is :code:`0`.
+
+    :param path:
+        Filepath to write.
+    :param encoding:
+        Character encoding of the file.
+    :param compression:
+        See :func:`infer_compression`.
+    """
+    compression = infer_compression(path, compression)
+
+    if not get_option('write_behind'):
+        if compression is None:
+            return open(path, 'w', encoding=encoding)
+
+        return importlib.import_module(compression).open(path, 'wt', encoding=encoding)
+
+    if compression is None:
+        f = open(path, 'wb', buffering=0)
+    else:
+        f = importlib.import_module(compression).open(path, 'wb')
+
+    return io.TextIOWrapper(ThreadedWriter(f), encoding=encoding)
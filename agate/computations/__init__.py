@@ -9,13 +9,27 @@ There are a variety of basic computations, such as :class:`.Change` and
 :class:`Formula` computation to apply an arbitrary function to the row.
 If this still isn't flexible enough, it's simple to create a custom computation
 class by inheriting from :class:`Computation`.
+
+Computations can also be written as an :class:`.Expression`, such as
+:code:`col('price') * col('quantity')`, which is evaluated one column at a
+time. See :func:`.col`.
+
+Window computations, such as :class:`.RollingMean` and :class:`.Lag`, compute
+each value from the rows around it. See :class:`.Window`.
 """
 
 from agate.computations.base import Computation
 from agate.computations.change import Change
+from agate.computations.cumulative_sum import CumulativeSum
+from agate.computations.expression import Expression, col, lit
 from agate.computations.formula import Formula
+from agate.computations.lag import Lag
+from agate.computations.lead import Lead
 from agate.computations.percent import Percent
 from agate.computations.percent_change import PercentChange
 from agate.computations.percentile_rank import PercentileRank
 from agate.computations.rank import Rank
+from agate.computations.rolling import Rolling, RollingMax, RollingMean, RollingMin, RollingSum
+from agate.computations.row_number import RowNumber
 from agate.computations.slug import Slug
+from agate.computations.window import Window
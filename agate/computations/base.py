@@ -8,6 +8,9 @@ class Computation:  # pragma: no cover
     :meth:`.Computation.run` are of the type specified by
     :meth:`.Computation.get_computed_data_type`. This can be ensured by using
     the :meth:`.DataType.cast` method. See :class:`.Formula` for an example.
+
+    Computations that calculate each row's value independently of other rows
+    should also implement :meth:`.Computation.get_row_function`.
     """
     def __str__(self):
         """
@@ -36,3 +39,17 @@ class Computation:  # pragma: no cover
         When invoked with a table, returns a sequence of new column values.
         """
         raise NotImplementedError()
+
+    def get_row_function(self, table):
+        """
+        Optionally return a function that takes a single :class:`.Row` of the
+        provided table and returns the new value for that row.
+
+        If this is implemented, :meth:`.Table.compute` calls the function for
+        each row as it builds the new rows, instead of calling :meth:`run`, so
+        that several computations can be applied in a single pass over the
+        rows. Computations whose values depend on other rows (for example,
+        :class:`.Percent`) should not implement this method, in which case it
+        returns :code:`None`.
+        """
+        return None
@@ -0,0 +1,37 @@
+from agate.computations.window import Window
+from agate.data_types import Number
+from agate.exceptions import DataTypeError
+
+
+class CumulativeSum(Window):
+    """
+    Calculate the running total of the values in a column.
+
+    Null values are not added to the total, and their result is null.
+
+    :param column_name:
+        The name of a column containing :class:`.Number` data.
+    :param order_by:
+        See :class:`.Window`.
+    """
+    def get_computed_data_type(self, table):
+        return Number()
+
+    def validate(self, table):
+        column = table.columns[self._column_name]
+
+        if not isinstance(column.data_type, Number):
+            raise DataTypeError('CumulativeSum column must contain Number data.')
+
+    def compute_window(self, values):
+        new_column = []
+        total = 0
+
+        for value in values:
+            if value is None:
+                new_column.append(None)
+            else:
+                total += value
+                new_column.append(total)
+
+        return new_column
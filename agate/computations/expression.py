@@ -0,0 +1,455 @@
+import datetime
+import operator
+from decimal import Decimal
+
+from agate.computations.base import Computation
+from agate.data_types import Boolean, Date, DateTime, Number, Text, TimeDelta
+from agate.exceptions import DataTypeError
+
+
+class Expression(Computation):
+    """
+    An expression built from columns and values, such as
+    :code:`col('price') * col('quantity') > 100`.
+
+    Expressions are created with :func:`.col` and :func:`.lit`, and combined
+    with Python's arithmetic (:code:`+`, :code:`-`, :code:`*`, :code:`/`,
+    :code:`//`, :code:`%`, :code:`**`) and comparison operators. Use
+    :code:`&`, :code:`|` and :code:`~` rather than :code:`and`, :code:`or`
+    and :code:`not` to combine conditions, and wrap each condition in
+    parentheses, since :code:`&` binds more tightly than comparisons.
+
+    An expression is a :class:`.Computation`, so it can be passed to
+    :meth:`.Table.compute`. It can also be passed to :meth:`.Table.where`
+    instead of a function. In both cases it is evaluated one column at a time,
+    rather than one row at a time, which avoids calling a Python function and
+    looking up each value by name for every row.
+
+    An expression may also be called with a :class:`.Row` (or any mapping of
+    column names to values) to evaluate it for a single row. This allows it to
+    be used anywhere a function of a row is accepted, such as the
+    :code:`test` of :meth:`.TableSet.having`.
+
+    If any value in an arithmetic operation or comparison is null, the result
+    is null. :code:`&`, :code:`|` and :code:`~` treat null as :code:`False`.
+    Use :meth:`is_null` to test for nulls.
+    """
+    def __str__(self):
+        return self._repr()
+
+    def __repr__(self):
+        return '<agate.Expression: %s>' % self._repr()
+
+    def __bool__(self):
+        raise TypeError('Expressions can not be used as booleans. Use &, | and ~ instead of and, or and not.')
+
+    def __call__(self, row):
+        """
+        Evaluate this expression for a single row.
+        """
+        raise NotImplementedError()
+
+    def _repr(self):
+        raise NotImplementedError()
+
+    def evaluate(self, table):
+        """
+        Evaluate this expression for every row in a table.
+
+        :returns:
+            A :class:`list` of values.
+        """
+        raise NotImplementedError()
+
+    def get_data_type(self, table):
+        """
+        Get the data type of the values produced by this expression for a
+        given table. Raises :class:`.DataTypeError` if an operation is not
+        supported for the types of its operands.
+        """
+        raise NotImplementedError()
+
+    def get_computed_data_type(self, table):
+        return self.get_data_type(table)
+
+    def validate(self, table):
+        self.get_data_type(table)
+
+    def run(self, table):
+        return self.evaluate(table)
+
+    def is_null(self):
+        """
+        Test whether values are null.
+        """
+        return _IsNull(self)
+
+    def is_in(self, values):
+        """
+        Test whether values are in a collection of values.
+        """
+        return _IsIn(self, values)
+
+    def __add__(self, other):
+        return _Arithmetic('+', self, other)
+
+    def __radd__(self, other):
+        return _Arithmetic('+', other, self)
+
+    def __sub__(self, other):
+        return _Arithmetic('-', self, other)
+
+    def __rsub__(self, other):
+        return _Arithmetic('-', other, self)
+
+    def __mul__(self, other):
+        return _Arithmetic('*', self, other)
+
+    def __rmul__(self, other):
+        return _Arithmetic('*', other, self)
+
+    def __truediv__(self, other):
+        return _Arithmetic('/', self, other)
+
+    def __rtruediv__(self, other):
+        return _Arithmetic('/', other, self)
+
+    def __floordiv__(self, other):
+        return _Arithmetic('//', self, other)
+
+    def __rfloordiv__(self, other):
+        return _Arithmetic('//', other, self)
+
+    def __mod__(self, other):
+        return _Arithmetic('%', self, other)
+
+    def __rmod__(self, other):
+        return _Arithmetic('%', other, self)
+
+    def __pow__(self, other):
+        return _Arithmetic('**', self, other)
+
+    def __rpow__(self, other):
+        return _Arithmetic('**', other, self)
+
+    def __neg__(self):
+        return _Arithmetic('*', self, -1)
+
+    def __eq__(self, other):
+        return _Comparison('==', self, other)
+
+    def __ne__(self, other):
+        return _Comparison('!=', self, other)
+
+    def __lt__(self, other):
+        return _Comparison('<', self, other)
+
+    def __le__(self, other):
+        return _Comparison('<=', self, other)
+
+    def __gt__(self, other):
+        return _Comparison('>', self, other)
+
+    def __ge__(self, other):
+        return _Comparison('>=', self, other)
+
+    def __and__(self, other):
+        return _Logical('&', self, other)
+
+    def __rand__(self, other):
+        return _Logical('&', other, self)
+
+    def __or__(self, other):
+        return _Logical('|', self, other)
+
+    def __ror__(self, other):
+        return _Logical('|', other, self)
+
+    def __invert__(self):
+        return _Not(self)
+
+    __hash__ = Computation.__hash__
+
+
+def col(column_name):
+    """
+    Create an :class:`.Expression` that refers to the values of a column.
+
+    :param column_name:
+        The name of a column.
+    """
+    return _Column(column_name)
+
+
+def lit(value):
+    """
+    Create an :class:`.Expression` for a constant value. Values combined with
+    an expression using an operator are converted automatically, so this is
+    only necessary when neither operand is an expression.
+
+    :code:`float` values are converted to :class:`decimal.Decimal`, since
+    :class:`.Number` columns contain :class:`decimal.Decimal` values.
+
+    :param value:
+        Any value.
+    """
+    if isinstance(value, Expression):
+        return value
+
+    if isinstance(value, float):
+        value = Decimal(repr(value))
+
+    return _Literal(value)
+
+
+class _Column(Expression):
+    def __init__(self, column_name):
+        self._column_name = column_name
+
+    def __call__(self, row):
+        return row[self._column_name]
+
+    def _repr(self):
+        return 'col(%r)' % self._column_name
+
+    def evaluate(self, table):
+        return table.columns[self._column_name].values()
+
+    def get_data_type(self, table):
+        return table.columns[self._column_name].data_type
+
+
+class _Literal(Expression):
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self, row):
+        return self.value
+
+    def _repr(self):
+        return repr(self.value)
+
+    def evaluate(self, table):
+        return [self.value] * len(table.rows)
+
+    def get_data_type(self, table):
+        value = self.value
+
+        if isinstance(value, bool):
+            return Boolean()
+        elif isinstance(value, (Decimal, int)):
+            return Number()
+        elif isinstance(value, str):
+            return Text()
+        elif isinstance(value, datetime.datetime):
+            return DateTime()
+        elif isinstance(value, datetime.date):
+            return Date()
+        elif isinstance(value, datetime.timedelta):
+            return TimeDelta()
+
+        return None
+
+
+class _Operation(Expression):
+    """
+    An operation on two expressions, which is null if either value is null.
+    """
+    operators = {}
+
+    def __init__(self, symbol, left, right):
+        self._symbol = symbol
+        self._op = self.operators[symbol]
+        self._left = lit(left)
+        self._right = lit(right)
+
+    def __call__(self, row):
+        a = self._left(row)
+        b = self._right(row)
+
+        if a is None or b is None:
+            return None
+
+        return self._op(a, b)
+
+    def _repr(self):
+        return '(%s %s %s)' % (self._left._repr(), self._symbol, self._right._repr())
+
+    def evaluate(self, table):
+        op = self._op
+
+        # Loops specialized for constants avoid zipping a list of copies
+        if isinstance(self._right, _Literal):
+            b = self._right.value
+
+            if b is None:
+                return [None] * len(table.rows)
+
+            return [None if a is None else op(a, b) for a in self._left.evaluate(table)]
+
+        if isinstance(self._left, _Literal):
+            a = self._left.value
+
+            if a is None:
+                return [None] * len(table.rows)
+
+            return [None if b is None else op(a, b) for b in self._right.evaluate(table)]
+
+        return [
+            None if a is None or b is None else op(a, b)
+            for a, b in zip(self._left.evaluate(table), self._right.evaluate(table))
+        ]
+
+
+class _Arithmetic(_Operation):
+    operators = {
+        '+': operator.add,
+        '-': operator.sub,
+        '*': operator.mul,
+        '/': operator.truediv,
+        '//': operator.floordiv,
+        '%': operator.mod,
+        '**': operator.pow,
+    }
+
+    def get_data_type(self, table):
+        left = self._left.get_data_type(table)
+        right = self._right.get_data_type(table)
+        symbol = self._symbol
+
+        # A null constant takes the type of the other operand
+        if left is None:
+            left = right
+        elif right is None:
+            right = left
+
+        dates = (Date, DateTime)
+
+        if isinstance(left, Number) and isinstance(right, Number):
+            return left
+        elif isinstance(left, Text) and isinstance(right, Text) and symbol == '+':
+            return left
+        elif isinstance(left, dates) and type(left) is type(right) and symbol == '-':
+            return TimeDelta()
+        elif isinstance(left, dates) and isinstance(right, TimeDelta) and symbol in ('+', '-'):
+            return left
+        elif isinstance(left, TimeDelta) and isinstance(right, dates) and symbol == '+':
+            return right
+        elif isinstance(left, TimeDelta) and isinstance(right, TimeDelta) and symbol in ('+', '-'):
+            return left
+        elif isinstance(left, TimeDelta) and isinstance(right, Number) and symbol in ('*', '/', '//'):
+            return left
+        elif isinstance(left, Number) and isinstance(right, TimeDelta) and symbol == '*':
+            return right
+
+        raise DataTypeError('The %s operator can not be applied to %s and %s data.' % (
+            symbol, type(left).__name__, type(right).__name__
+        ))
+
+
+class _Comparison(_Operation):
+    operators = {
+        '==': operator.eq,
+        '!=': operator.ne,
+        '<': operator.lt,
+        '<=': operator.le,
+        '>': operator.gt,
+        '>=': operator.ge,
+    }
+
+    def get_data_type(self, table):
+        self._left.get_data_type(table)
+        self._right.get_data_type(table)
+
+        return Boolean()
+
+
+class _Logical(Expression):
+    def __init__(self, symbol, left, right):
+        self._symbol = symbol
+        self._left = lit(left)
+        self._right = lit(right)
+
+    def __call__(self, row):
+        if self._symbol == '&':
+            return bool(self._left(row)) and bool(self._right(row))
+
+        return bool(self._left(row)) or bool(self._right(row))
+
+    def _repr(self):
+        return '(%s %s %s)' % (self._left._repr(), self._symbol, self._right._repr())
+
+    def evaluate(self, table):
+        left = self._left.evaluate(table)
+        right = self._right.evaluate(table)
+
+        if self._symbol == '&':
+            return [bool(a) and bool(b) for a, b in zip(left, right)]
+
+        return [bool(a) or bool(b) for a, b in zip(left, right)]
+
+    def get_data_type(self, table):
+        self._left.get_data_type(table)
+        self._right.get_data_type(table)
+
+        return Boolean()
+
+
+class _Not(Expression):
+    def __init__(self, operand):
+        self._operand = operand
+
+    def __call__(self, row):
+        return not self._operand(row)
+
+    def _repr(self):
+        return '~%s' % self._operand._repr()
+
+    def evaluate(self, table):
+        return [not a for a in self._operand.evaluate(table)]
+
+    def get_data_type(self, table):
+        self._operand.get_data_type(table)
+
+        return Boolean()
+
+
+class _IsNull(Expression):
+    def __init__(self, operand):
+        self._operand = operand
+
+    def __call__(self, row):
+        return self._operand(row) is None
+
+    def _repr(self):
+        return '%s.is_null()' % self._operand._repr()
+
+    def evaluate(self, table):
+        return [a is None for a in self._operand.evaluate(table)]
+
+    def get_data_type(self, table):
+        self._operand.get_data_type(table)
+
+        return Boolean()
+
+
+class _IsIn(Expression):
+    def __init__(self, operand, values):
+        self._operand = operand
+        self._values = frozenset(values)
+
+    def __call__(self, row):
+        return self._operand(row) in self._values
+
+    def _repr(self):
+        return '%s.is_in(%r)' % (self._operand._repr(), sorted(self._values, key=repr))
+
+    def evaluate(self, table):
+        values = self._values
+
+        return [a in values for a in self._operand.evaluate(table)]
+
+    def get_data_type(self, table):
+        self._operand.get_data_type(table)
+
+        return Boolean()
@@ -24,14 +24,18 @@ class Formula(Computation):
         return self._data_type
 
     def run(self, table):
-        new_column = []
+        func = self.get_row_function(table)
 
-        for row in table.rows:
-            v = self._func(row)
+        return [func(row) for row in table.rows]
 
-            if self._cast:
-                v = self._data_type.cast(v)
+    def get_row_function(self, table):
+        if not self._cast:
+            return self._func
 
-            new_column.append(v)
+        func = self._func
+        cast = self._data_type.cast
 
-        return new_column
+        def formula(row):
+            return cast(func(row))
+
+        return formula
@@ -0,0 +1,34 @@
+from agate.computations.window import Window
+
+
+class Lag(Window):
+    """
+    Get the value of a column from a previous row.
+
+    :param column_name:
+        The name of a column.
+    :param offset:
+        The number of rows before the current row.
+    :param default:
+        The value for rows with no row at that offset. Defaults to
+        :code:`None`.
+    :param order_by:
+        See :class:`.Window`.
+    """
+    def __init__(self, column_name, offset=1, default=None, order_by=None):
+        super().__init__(column_name, order_by=order_by)
+
+        if offset < 0:
+            raise ValueError('offset must not be negative.')
+
+        self._offset = offset
+        self._default = default
+
+    def get_computed_data_type(self, table):
+        return table.columns[self._column_name].data_type
+
+    def compute_window(self, values):
+        values = list(values)
+        offset = min(self._offset, len(values))
+
+        return [self._default] * offset + values[:len(values) - offset]
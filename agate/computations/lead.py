@@ -0,0 +1,22 @@
+from agate.computations.lag import Lag
+
+
+class Lead(Lag):
+    """
+    Get the value of a column from a following row.
+
+    :param column_name:
+        The name of a column.
+    :param offset:
+        The number of rows after the current row.
+    :param default:
+        The value for rows with no row at that offset. Defaults to
+        :code:`None`.
+    :param order_by:
+        See :class:`.Window`.
+    """
+    def compute_window(self, values):
+        values = list(values)
+        offset = min(self._offset, len(values))
+
+        return values[offset:] + [self._default] * offset
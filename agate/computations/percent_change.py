@@ -42,15 +42,22 @@ class PercentChange(Computation):
         :returns:
             :class:`decimal.Decimal`
         """
-        new_column = []
+        percent_change = self.get_row_function(table)
 
-        for row in table.rows:
-            before = row[self._before_column_name]
-            after = row[self._after_column_name]
+        return [percent_change(row) for row in table.rows]
+
+    def get_row_function(self, table):
+        before_index = table.columns[self._before_column_name].index
+        after_index = table.columns[self._after_column_name].index
+
+        def percent_change(row):
+            values = row.values()
+            before = values[before_index]
+            after = values[after_index]
 
             if before is not None and after is not None:
-                new_column.append((after - before) / before * 100)
-            else:
-                new_column.append(None)
+                return (after - before) / before * 100
+
+            return None
 
-        return new_column
+        return percent_change
@@ -26,9 +26,4 @@ class PercentileRank(Rank):
         """
         percentiles = Percentiles(self._column_name).run(table)
 
-        new_column = []
-
-        for row in table.rows:
-            new_column.append(percentiles.locate(row[self._column_name]))
-
-        return new_column
+        return [percentiles.locate(d) for d in table.columns[self._column_name].values()]
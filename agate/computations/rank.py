@@ -3,29 +3,49 @@ from functools import cmp_to_key
 
 from agate.computations.base import Computation
 from agate.data_types import Number
+from agate.utils import argsort
+
+#: Supported tie-breaking methods for :class:`Rank`
+RANK_METHODS = ('min', 'dense', 'ordinal', 'average')
 
 
 class Rank(Computation):
     """
     Calculate rank order of the values in a column.
 
-    Uses the "competition" ranking method: if there are four values and the
-    middle two are tied, then the output will be `[1, 2, 2, 4]`.
+    By default uses the "competition" ranking method: if there are four values
+    and the middle two are tied, then the output will be `[1, 2, 2, 4]`.
 
     Null values will always be ranked last.
 
+    Ranks are assigned by position after sorting the indices of the rows by
+    value (see :meth:`.Column.sort_order`), so the sorted order can be shared
+    with other computations when the column's cache is enabled.
+
     :param column_name:
         The name of the column to rank.
     :param comparer:
         An optional comparison function. If not specified ranking will be
-        ascending, with nulls ranked last.
+        ascending, with nulls ranked last. Values for which the function
+        returns :code:`0` are tied.
     :param reverse:
         Reverse sort order before ranking.
+    :param method:
+        How to rank tied values. :code:`'min'` gives each the lowest rank of
+        the group, for example `[1, 2, 2, 4]`. :code:`'dense'` does the same
+        but leaves no gaps after a tie: `[1, 2, 2, 3]`. :code:`'ordinal'`
+        ranks tied values in the order of their rows: `[1, 2, 3, 4]`.
+        :code:`'average'` gives each the mean rank of the group:
+        `[1, 2.5, 2.5, 4]`.
     """
-    def __init__(self, column_name, comparer=None, reverse=None):
+    def __init__(self, column_name, comparer=None, reverse=None, method='min'):
+        if method not in RANK_METHODS:
+            raise ValueError('method must be one of: %s.' % ', '.join(RANK_METHODS))
+
         self._column_name = column_name
         self._comparer = comparer
         self._reverse = reverse
+        self._method = method
 
     def get_computed_data_type(self, table):
         return Number()
@@ -33,34 +53,67 @@ class Rank(Computation):
     def run(self, table):
         """
         :returns:
-            :class:`int`
+            :class:`decimal.Decimal`
         """
         column = table.columns[self._column_name]
+        values = column.values()
 
         if self._comparer:
-            data_sorted = sorted(column.values(), key=cmp_to_key(self._comparer))
-            if self._reverse:
-                data_sorted.reverse()
+            key = cmp_to_key(self._comparer)
+            keys = [key(v) for v in values]
+            # Sorting in reverse, rather than reversing afterwards, keeps ties
+            # in the order of their rows
+            order = sorted(range(len(values)), key=keys.__getitem__, reverse=bool(self._reverse))
+
+            comparer = self._comparer
+
+            def tied(a, b):
+                return comparer(a, b) == 0
         else:
-            non_nulls = list(column.values_without_nulls_sorted())
             if self._reverse:
-                non_nulls.reverse()
-            data_sorted = non_nulls + [None] * (len(column.values()) - len(non_nulls))
+                # Nulls are ranked last even in reverse
+                order = argsort(values, reverse=True)
+                nulls = len(values) - len(column.values_without_nulls())
+                order = order[nulls:] + order[:nulls]
+            else:
+                order = column.sort_order()
+
+            def tied(a, b):
+                return a == b
+
+        new_column = [None] * len(values)
+        method = self._method
+
+        if method == 'ordinal':
+            for position, i in enumerate(order, 1):
+                new_column[i] = Decimal(position)
+
+            return new_column
+
+        start = 0
+        dense = 0
+        length = len(order)
 
-        ranks = {}
-        rank = 0
+        # Assign one rank to each run of tied values
+        while start < length:
+            first = values[order[start]]
+            end = start + 1
 
-        for c in data_sorted:
-            rank += 1
+            while end < length and tied(values[order[end]], first):
+                end += 1
 
-            if c in ranks:
-                continue
+            dense += 1
 
-            ranks[c] = Decimal(rank)
+            if method == 'min':
+                rank = Decimal(start + 1)
+            elif method == 'dense':
+                rank = Decimal(dense)
+            else:
+                rank = Decimal(start + 1 + end) / 2
 
-        new_column = []
+            for i in order[start:end]:
+                new_column[i] = rank
 
-        for row in table.rows:
-            new_column.append(ranks[row[self._column_name]])
+            start = end
 
         return new_column
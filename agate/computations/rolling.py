@@ -0,0 +1,168 @@
+from collections import deque
+
+from agate.computations.window import Window
+from agate.data_types import Date, DateTime, Number, TimeDelta
+from agate.exceptions import DataTypeError
+
+
+class Rolling(Window):
+    """
+    Base class for computations over a sliding window of rows, ending with
+    the current row. Each value is computed in constant time from the
+    previous one, so the time taken does not depend on the size of the window.
+
+    Null values are ignored. The result for a row is null if its window
+    contains fewer than :code:`min_periods` non-null values, which by default
+    includes the first :code:`window - 1` rows.
+
+    :param column_name:
+        The name of the column to compute values from.
+    :param window:
+        The number of rows in each window.
+    :param min_periods:
+        The minimum number of non-null values needed to compute a value.
+        Defaults to :code:`window`.
+    :param order_by:
+        See :class:`.Window`.
+    """
+    def __init__(self, column_name, window, min_periods=None, order_by=None):
+        super().__init__(column_name, order_by=order_by)
+
+        if window < 1:
+            raise ValueError('window must be at least 1.')
+
+        if min_periods is None:
+            min_periods = window
+        elif not 1 <= min_periods <= window:
+            raise ValueError('min_periods must be between 1 and window.')
+
+        self._window = window
+        self._min_periods = min_periods
+
+    def validate(self, table):
+        column = table.columns[self._column_name]
+
+        if not isinstance(column.data_type, Number):
+            raise DataTypeError('%s column must contain Number data.' % self.__class__.__name__)
+
+    def get_computed_data_type(self, table):
+        return Number()
+
+
+class RollingSum(Rolling):
+    """
+    Calculate the sum of the values in a sliding window of rows.
+
+    See :class:`.Rolling` for details.
+    """
+    def compute_window(self, values):
+        return [total for total, count in _rolling_sums(values, self._window, self._min_periods)]
+
+
+class RollingMean(Rolling):
+    """
+    Calculate the mean of the values in a sliding window of rows.
+
+    See :class:`.Rolling` for details.
+    """
+    def compute_window(self, values):
+        return [
+            None if total is None else total / count
+            for total, count in _rolling_sums(values, self._window, self._min_periods)
+        ]
+
+
+class RollingMin(Rolling):
+    """
+    Calculate the minimum of the values in a sliding window of rows.
+
+    This computation can be applied to columns containing :class:`.Date`,
+    :class:`.DateTime`, :class:`.Number` or :class:`.TimeDelta` data. See
+    :class:`.Rolling` for details.
+    """
+    def validate(self, table):
+        column = table.columns[self._column_name]
+
+        if not isinstance(column.data_type, (Date, DateTime, Number, TimeDelta)):
+            raise DataTypeError('%s column must contain Date, DateTime, Number or TimeDelta data.'
+                                % self.__class__.__name__)
+
+    def get_computed_data_type(self, table):
+        return table.columns[self._column_name].data_type
+
+    def compute_window(self, values):
+        return _rolling_extremes(values, self._window, self._min_periods, lambda a, b: a <= b)
+
+
+class RollingMax(RollingMin):
+    """
+    Calculate the maximum of the values in a sliding window of rows.
+
+    This computation can be applied to columns containing :class:`.Date`,
+    :class:`.DateTime`, :class:`.Number` or :class:`.TimeDelta` data. See
+    :class:`.Rolling` for details.
+    """
+    def compute_window(self, values):
+        return _rolling_extremes(values, self._window, self._min_periods, lambda a, b: a >= b)
+
+
+def _rolling_sums(values, window, min_periods):
+    """
+    Yield the sum and count of the non-null values in each window, or
+    :code:`(None, count)` if there are too few values.
+    """
+    total = 0
+    count = 0
+
+    for i, value in enumerate(values):
+        if value is not None:
+            total += value
+            count += 1
+
+        if i >= window:
+            old = values[i - window]
+
+            if old is not None:
+                total -= old
+                count -= 1
+
+        if count >= min_periods:
+            yield total, count
+        else:
+            yield None, count
+
+
+def _rolling_extremes(values, window, min_periods, keep):
+    """
+    Find the extreme value in each window using a monotonic deque of indices,
+    whose values are ordered so that the extreme value is always first.
+
+    :param keep:
+        A function which returns :code:`True` if a value should be kept in
+        the deque ahead of a newer value.
+    """
+    results = []
+    indices = deque()
+    count = 0
+
+    for i, value in enumerate(values):
+        if value is not None:
+            while indices and not keep(values[indices[-1]], value):
+                indices.pop()
+
+            indices.append(i)
+            count += 1
+
+        if i >= window:
+            if values[i - window] is not None:
+                count -= 1
+
+            if indices and indices[0] <= i - window:
+                indices.popleft()
+
+        if count >= min_periods:
+            results.append(values[indices[0]])
+        else:
+            results.append(None)
+
+    return results
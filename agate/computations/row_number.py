@@ -0,0 +1,22 @@
+from decimal import Decimal
+
+from agate.computations.window import Window
+from agate.data_types import Number
+
+
+class RowNumber(Window):
+    """
+    Number each row, starting from one.
+
+    :param order_by:
+        See :class:`.Window`. If not specified, rows are numbered in the
+        order of the table.
+    """
+    def __init__(self, order_by=None):
+        super().__init__(None, order_by=order_by)
+
+    def get_computed_data_type(self, table):
+        return Number()
+
+    def compute_window(self, values):
+        return [Decimal(i) for i in range(1, len(values) + 1)]
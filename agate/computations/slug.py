@@ -2,7 +2,7 @@ from agate.aggregations.has_nulls import HasNulls
 from agate.computations.base import Computation
 from agate.data_types import Text
 from agate.exceptions import DataTypeError
-from agate.utils import issequence, slugify
+from agate.utils import issequence, slugify, slugify_function
 
 
 class Slug(Computation):
@@ -46,16 +46,36 @@ class Slug(Computation):
         :returns:
             :class:`string`
         """
-        new_column = []
+        new_column = [self._get_value(row) for row in table.rows]
 
-        for row in table.rows:
-            if issequence(self._column_name):
-                column_value = ''
-                for column_name in self._column_name:
-                    column_value = column_value + ' ' + row[column_name]
+        return slugify(new_column, ensure_unique=self._ensure_unique, **self._slug_args)
 
-                new_column.append(column_value)
-            else:
-                new_column.append(row[self._column_name])
+    def get_row_function(self, table):
+        # Unique slugs depend on the values of other rows
+        if self._ensure_unique:
+            return None
 
-        return slugify(new_column, ensure_unique=self._ensure_unique, **self._slug_args)
+        func = slugify_function(**self._slug_args)
+
+        if issequence(self._column_name):
+            get_value = self._get_value
+
+            def slug(row):
+                return func(get_value(row))
+        else:
+            column_name = self._column_name
+
+            def slug(row):
+                return func(row[column_name])
+
+        return slug
+
+    def _get_value(self, row):
+        if issequence(self._column_name):
+            column_value = ''
+            for column_name in self._column_name:
+                column_value = column_value + ' ' + row[column_name]
+
+            return column_value
+
+        return row[self._column_name]
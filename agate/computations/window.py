@@ -0,0 +1,68 @@
+from agate.computations.base import Computation
+from agate.utils import issequence
+
+
+class Window(Computation):
+    """
+    Base class for computations whose value for each row depends on the rows
+    before or after it, such as :class:`.RollingMean` and :class:`.Lag`.
+
+    By default rows are processed in the order of the table. If
+    :code:`order_by` is specified, the rows are processed in that order
+    instead, and each value is returned in the position of its row in the
+    table, so the table itself does not need to be sorted first.
+
+    To compute a window separately for each group of a :class:`.TableSet`,
+    pass the computation to :meth:`.TableSet.compute`.
+
+    Subclasses implement :meth:`compute_window`.
+
+    :param column_name:
+        The name of the column to compute values from, or :code:`None` if
+        the computation does not use a column (see :class:`.RowNumber`).
+    :param order_by:
+        Either the name of a single column to order rows by, a sequence of
+        such names, or a :class:`function` that takes a row and returns a
+        value to order by. See :meth:`.Table.order_by`.
+    """
+    def __init__(self, column_name, order_by=None):
+        self._column_name = column_name
+        self._order_by = order_by
+
+    def compute_window(self, values):
+        """
+        Compute new values from the values of the column, in window order.
+
+        :param values:
+            A sequence of values, or of :code:`None` for each row if this
+            computation does not use a column.
+        :returns:
+            A :class:`list` of new values in the same order.
+        """
+        raise NotImplementedError()
+
+    def run(self, table):
+        if self._column_name is None:
+            values = [None] * len(table.rows)
+        else:
+            values = table.columns[self._column_name].values()
+
+        if self._order_by is None:
+            return self.compute_window(values)
+
+        if hasattr(self._order_by, '__call__') or issequence(self._order_by):
+            from agate.table.order_by import make_sort_key
+
+            sort_key = make_sort_key(self._order_by)
+            rows = table.rows
+            order = sorted(range(len(rows)), key=lambda i: sort_key(rows[i]))
+        else:
+            order = table.columns[self._order_by].sort_order()
+
+        results = self.compute_window([values[i] for i in order])
+        new_column = [None] * len(results)
+
+        for i, value in zip(order, results):
+            new_column[i] = value
+
+        return new_column
@@ -30,14 +30,23 @@ configuration.
 +-------------------------+------------------------------------------+-----------------------------------------+
 | number_truncation_chars | Characters for truncated number values   | '…'                                     |
 +-------------------------+------------------------------------------+-----------------------------------------+
+| executor                | Executor for :class:`.TableSet` methods  | None                                    |
++-------------------------+------------------------------------------+-----------------------------------------+
+| io_block_size           | Bytes read or written by I/O threads     | 65536                                   |
++-------------------------+------------------------------------------+-----------------------------------------+
+| read_ahead              | Blocks read ahead of parsing, or 0       | 8                                       |
++-------------------------+------------------------------------------+-----------------------------------------+
+| write_behind            | Blocks left to be written, or 0          | 8                                       |
++-------------------------+------------------------------------------+-----------------------------------------+
 
 """
 
-from babel.core import default_locale
+#: Placeholder for options whose default is computed when first used
+_DEFERRED = object()
 
 _options = {
-    #: Default locale for number formatting
-    'default_locale': default_locale('LC_NUMERIC') or 'en_US',
+    #: Default locale for number formatting, found with Babel when first used
+    'default_locale': _DEFERRED,
     #: Character to render for horizontal lines
     'horizontal_line_char': '-',
     #: Character to render for vertical lines
@@ -58,6 +67,16 @@ _options = {
     'text_truncation_chars': '...',
     #: Characters for truncated number values
     'number_truncation_chars': '…',
+    #: Executor used to apply TableSet operations to each table
+    'executor': None,
+    #: Number of bytes read or written at a time by background I/O threads
+    'io_block_size': 64 * 1024,
+    #: Number of blocks a background thread may read ahead of the parser, or
+    #: 0 to read files in the calling thread
+    'read_ahead': 8,
+    #: Number of blocks that may wait to be written by a background thread,
+    #: or 0 to write files in the calling thread
+    'write_behind': 8,
 }
 
 
@@ -68,7 +87,25 @@ def get_option(key):
     :param key:
         The name of the configuration option.
     """
-    return _options[key]
+    value = _options[key]
+
+    if value is _DEFERRED:
+        value = _options[key] = _get_default(key)
+
+    return value
+
+
+def _get_default(key):
+    """
+    Compute the default value of an option whose default is deferred, so
+    that its dependencies are not imported until they are needed.
+    """
+    if key == 'default_locale':
+        from babel.core import default_locale
+
+        return default_locale('LC_NUMERIC') or 'en_US'
+
+    raise KeyError(key)
 
 
 def set_option(key, value):
@@ -1,7 +1,7 @@
 import locale
+import threading
 from datetime import date, datetime, time
-
-import parsedatetime
+from functools import lru_cache
 
 from agate.data_types.base import DataType
 from agate.exceptions import CastError
@@ -9,6 +9,42 @@ from agate.exceptions import CastError
 ZERO_DT = datetime.combine(date.min, time.min)
 
 
+@lru_cache(maxsize=None)
+def _get_constants(locale):
+    """
+    Get the parsedatetime Constants for a locale. They are created once per
+    process and shared by every :class:`Date` and :class:`.DateTime`.
+    """
+    import parsedatetime
+
+    return parsedatetime.Constants(localeID=locale)
+
+
+_local = threading.local()
+
+
+def _get_parser(locale):
+    """
+    Get the parsedatetime Calendar for a locale. A Calendar keeps a stack of
+    parsing contexts, so it is shared by every data type in the same thread,
+    rather than the whole process.
+    """
+    try:
+        parsers = _local.parsers
+    except AttributeError:
+        parsers = _local.parsers = {}
+
+    try:
+        return parsers[locale]
+    except KeyError:
+        import parsedatetime
+
+        parser = parsedatetime.Calendar(constants=_get_constants(locale), version=parsedatetime.VERSION_CONTEXT_STYLE)
+        parsers[locale] = parser
+
+        return parser
+
+
 class Date(DataType):
     """
     Data representing dates alone.
@@ -26,28 +62,21 @@ class Date(DataType):
         self.date_format = date_format
         self.locale = locale
 
-        self._constants = parsedatetime.Constants(localeID=self.locale)
-        self._parser = parsedatetime.Calendar(constants=self._constants, version=parsedatetime.VERSION_CONTEXT_STYLE)
-
-    def __getstate__(self):
+    @property
+    def _constants(self):
         """
-        Return state values to be pickled. Exclude _constants and _parser because parsedatetime
-        cannot be pickled.
+        The parsedatetime Constants for this type's locale.
         """
-        odict = self.__dict__.copy()
-        del odict['_constants']
-        del odict['_parser']
-        return odict
+        return _get_constants(self.locale)
 
-    def __setstate__(self, ndict):
+    @property
+    def _parser(self):
         """
-        Restore state from the unpickled state values. Set _constants to an instance
-        of the parsedatetime Constants class, and _parser to an instance
-        of the parsedatetime Calendar class.
+        The parsedatetime Calendar used to parse dates that do not match a
+        format. It is only created (and parsedatetime imported) when it is
+        first used.
         """
-        self.__dict__.update(ndict)
-        self._constants = parsedatetime.Constants(localeID=self.locale)
-        self._parser = parsedatetime.Calendar(constants=self._constants, version=parsedatetime.VERSION_CONTEXT_STYLE)
+        return _get_parser(self.locale)
 
     def cast(self, d):
         """
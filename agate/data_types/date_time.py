@@ -1,10 +1,8 @@
 import datetime
 import locale
 
-import isodate
-import parsedatetime
-
 from agate.data_types.base import DataType
+from agate.data_types.date import _get_constants, _get_parser
 from agate.exceptions import CastError
 
 
@@ -28,32 +26,29 @@ class DateTime(DataType):
         self.timezone = timezone
         self.locale = locale
 
-        now = datetime.datetime.now()
-        self._source_time = datetime.datetime(
-            now.year, now.month, now.day, 0, 0, 0, 0, None
-        )
-        self._constants = parsedatetime.Constants(localeID=self.locale)
-        self._parser = parsedatetime.Calendar(constants=self._constants, version=parsedatetime.VERSION_CONTEXT_STYLE)
+    @property
+    def _constants(self):
+        """
+        The parsedatetime Constants for this type's locale.
+        """
+        return _get_constants(self.locale)
 
-    def __getstate__(self):
+    @property
+    def _parser(self):
         """
-        Return state values to be pickled. Exclude _parser because parsedatetime
-        cannot be pickled.
+        The parsedatetime Calendar used to parse datetimes that do not match
+        a format. It is only created (and parsedatetime imported) when it is
+        first used.
         """
-        odict = self.__dict__.copy()
-        del odict['_constants']
-        del odict['_parser']
-        return odict
+        return _get_parser(self.locale)
 
-    def __setstate__(self, ndict):
+    @property
+    def _source_time(self):
         """
-        Restore state from the unpickled state values. Set _constants to an instance
-        of the parsedatetime Constants class, and _parser to an instance
-        of the parsedatetime Calendar class.
+        The start of the current day, relative to which natural language
+        dates are parsed.
         """
-        self.__dict__.update(ndict)
-        self._constants = parsedatetime.Constants(localeID=self.locale)
-        self._parser = parsedatetime.Calendar(constants=self._constants, version=parsedatetime.VERSION_CONTEXT_STYLE)
+        return datetime.datetime.combine(datetime.date.today(), datetime.time.min)
 
     def cast(self, d):
         """
@@ -92,14 +87,17 @@ class DateTime(DataType):
 
             return dt
 
+        parser = self._parser
+        source_time = self._source_time
+
         try:
-            (_, _, _, _, matched_text), = self._parser.nlp(d, sourceTime=self._source_time)
+            (_, _, _, _, matched_text), = parser.nlp(d, sourceTime=source_time)
         except Exception:
             matched_text = None
         else:
-            value, ctx = self._parser.parseDT(
+            value, ctx = parser.parseDT(
                 d,
-                sourceTime=self._source_time,
+                sourceTime=source_time,
                 tzinfo=self.timezone
             )
 
@@ -108,6 +106,8 @@ class DateTime(DataType):
             if matched_text == d and ctx.hasDate and not ctx.hasTime:
                 return datetime.datetime.combine(value.date(), datetime.time.min)
 
+        import isodate
+
         try:
             dt = isodate.parse_datetime(d)
 
@@ -1,7 +1,6 @@
 import warnings
 from decimal import Decimal, InvalidOperation
-
-from babel.core import Locale
+from functools import lru_cache
 
 from agate.data_types.base import DataType
 from agate.exceptions import CastError
@@ -14,6 +13,31 @@ POSITIVE = Decimal('1')
 NEGATIVE = Decimal('-1')
 
 
+@lru_cache(maxsize=None)
+def _get_locale(locale):
+    """
+    Get a Babel locale and its group and decimal symbols. They are looked up
+    once per process and shared by every :class:`Number`.
+
+    :returns:
+        A :code:`(locale, group_symbol, decimal_symbol)` tuple.
+    """
+    from babel.core import Locale
+
+    locale = Locale.parse(locale)
+
+    # Suppress Babel warning on Python 3.6
+    # See #665
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+
+        # Babel 2.14 support.
+        # https://babel.pocoo.org/en/latest/changelog.html#possibly-backwards-incompatible-changes
+        number_symbols = locale.number_symbols.get('latn', locale.number_symbols)
+
+        return locale, number_symbols.get('group', ','), number_symbols.get('decimal', '.')
+
+
 class Number(DataType):
     """
     Data representing numbers.
@@ -36,20 +60,28 @@ class Number(DataType):
                  currency_symbols=DEFAULT_CURRENCY_SYMBOLS, no_leading_zeroes=None, **kwargs):
         super().__init__(**kwargs)
 
-        self.locale = Locale.parse(locale)
+        self.locale, default_group_symbol, default_decimal_symbol = _get_locale(locale)
         self.currency_symbols = currency_symbols
         self.no_leading_zeroes = no_leading_zeroes
+        self.group_symbol = group_symbol or default_group_symbol
+        self.decimal_symbol = decimal_symbol or default_decimal_symbol
 
-        # Suppress Babel warning on Python 3.6
-        # See #665
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
+    def __getstate__(self):
+        """
+        Return state values to be pickled. The locale is pickled by its
+        identifier, rather than with all of its data.
+        """
+        odict = self.__dict__.copy()
+        odict['locale'] = str(self.locale)
+        return odict
 
-            # Babel 2.14 support.
-            # https://babel.pocoo.org/en/latest/changelog.html#possibly-backwards-incompatible-changes
-            number_symbols = self.locale.number_symbols.get('latn', self.locale.number_symbols)
-            self.group_symbol = group_symbol or number_symbols.get('group', ',')
-            self.decimal_symbol = decimal_symbol or number_symbols.get('decimal', '.')
+    def __setstate__(self, ndict):
+        """
+        Restore state from the unpickled state values. The locale is looked up
+        in this process's cache.
+        """
+        self.__dict__.update(ndict)
+        self.locale = _get_locale(self.locale)[0]
 
     def cast(self, d):
         """
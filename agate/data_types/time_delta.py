@@ -1,7 +1,5 @@
 import datetime
 
-import pytimeparse
-
 from agate.data_types.base import DataType
 from agate.exceptions import CastError
 
@@ -29,6 +27,8 @@ class TimeDelta(DataType):
         else:
             raise CastError('Can not parse value "%s" as timedelta.' % d)
 
+        import pytimeparse
+
         try:
             seconds = pytimeparse.parse(d)
         except AttributeError:
@@ -0,0 +1,196 @@
+"""
+This module contains :func:`external_sort`, which sorts CSV files that are too
+large to be loaded into a single :class:`.Table`.
+
+The input is read in bounded "runs" of rows. Each run is loaded into a
+:class:`.Table`, sorted with :meth:`.Table.order_by` and spilled to a temporary
+file. The sorted runs are then merged into the output file, so that only one
+run (plus one batch of rows per run while merging) is ever held in memory.
+"""
+
+import heapq
+import itertools
+import os
+import pickle
+import tempfile
+
+from agate.rows import Row
+from agate.table.order_by import make_sort_key
+
+#: Number of rows pickled together when a run is spilled to disk
+SPILL_BATCH_SIZE = 1000
+
+
+def _spill(rows, spill_dir):
+    """
+    Write a sorted sequence of rows to a temporary file as pickled batches of
+    value tuples.
+    """
+    f = tempfile.TemporaryFile(dir=spill_dir)
+
+    batch = []
+
+    for row in rows:
+        batch.append(row.values())
+
+        if len(batch) == SPILL_BATCH_SIZE:
+            pickle.dump(batch, f, pickle.HIGHEST_PROTOCOL)
+            batch = []
+
+    if batch:
+        pickle.dump(batch, f, pickle.HIGHEST_PROTOCOL)
+
+    f.seek(0)
+
+    return f
+
+
+def _unspill(f, column_names):
+    """
+    Read back the rows written by :func:`_spill`, one batch at a time.
+    """
+    while True:
+        try:
+            batch = pickle.load(f)
+        except EOFError:
+            break
+
+        for values in batch:
+            yield Row(values, column_names)
+
+
+def external_sort(path, key, out_path, reverse=False, column_names=None, column_types=None, header=True,
+                  run_size=100000, spill_dir=None, encoding='utf-8', **kwargs):
+    """
+    Sort a CSV file that does not fit in memory, writing the result to a new
+    CSV file.
+
+    The output is identical to loading the file with :meth:`.Table.from_csv`,
+    sorting it with :meth:`.Table.order_by` and saving it with
+    :meth:`.Table.to_csv`, including the ordering of null values.
+
+    If :code:`column_types` is not specified, types are inferred from the
+    first run and reused for every subsequent run. If later rows can not be
+    cast to those types a :class:`.CastError` will be raised, in which case
+    the types should be given explicitly.
+
+    :code:`kwargs` will be passed through to the CSV reader.
+
+    :param path:
+        Filepath or file-like object from which to read CSV data.
+    :param key:
+        See :meth:`.Table.order_by`.
+    :param out_path:
+        Filepath or file-like object to write the sorted CSV to.
+    :param reverse:
+        See :meth:`.Table.order_by`.
+    :param column_names:
+        See :meth:`.Table.__init__`.
+    :param column_types:
+        See :meth:`.Table.__init__`.
+    :param header:
+        See :meth:`.Table.from_csv`.
+    :param run_size:
+        The maximum number of rows to hold in memory at once. Each run of this
+        many rows is sorted and written to a temporary file before merging.
+    :param spill_dir:
+        The directory in which to create temporary files. Defaults to the
+        platform's temporary directory.
+    :param encoding:
+        See :meth:`.Table.from_csv`.
+    """
+    from agate import csv
+    from agate.table import Table
+
+    if run_size < 1:
+        raise ValueError('run_size must be a positive integer.')
+
+    close = False
+    runs = []
+
+    try:
+        if hasattr(path, 'read'):
+            f = path
+        else:
+            f = open(path, encoding=encoding)
+            close = True
+
+        reader = csv.reader(f, header=header, **kwargs)
+
+        if header:
+            try:
+                names = next(reader)
+            except StopIteration:
+                names = []
+
+            if column_names is None:
+                column_names = names
+
+        table = None
+
+        while True:
+            rows = list(itertools.islice(reader, run_size))
+
+            if table is not None:
+                if not rows:
+                    break
+
+                runs.append(_spill(table.rows, spill_dir))
+                table = None
+
+            table = Table(rows, column_names, column_types).order_by(key, reverse=reverse)
+            column_names = table.column_names
+            column_types = table.column_types
+
+            if len(rows) < run_size:
+                break
+    finally:
+        if close:
+            f.close()
+
+    try:
+        if runs:
+            sources = [_unspill(run, column_names) for run in runs]
+            sources.append(iter(table.rows))
+
+            rows = heapq.merge(*sources, key=make_sort_key(key), reverse=reverse)
+        else:
+            rows = table.rows
+
+        _write(rows, column_names, column_types, out_path)
+    finally:
+        for run in runs:
+            run.close()
+
+
+def _write(rows, column_names, column_types, out_path):
+    """
+    Write a sequence of rows to CSV the same way as :meth:`.Table.to_csv`.
+    """
+    from agate import csv
+
+    close = True
+    f = None
+
+    try:
+        if hasattr(out_path, 'write'):
+            f = out_path
+            close = False
+        else:
+            dirpath = os.path.dirname(out_path)
+
+            if dirpath and not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+
+            f = open(out_path, 'w')
+
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(column_names)
+
+        csv_funcs = [c.csvify for c in column_types]
+
+        for row in rows:
+            writer.writerow(tuple(csv_funcs[i](d) for i, d in enumerate(row)))
+    finally:
+        if close and f is not None:
+            f.close()
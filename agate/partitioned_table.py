@@ -0,0 +1,497 @@
+"""
+This module contains the :class:`PartitionedTable` class, which holds data
+that is too large to process as a single :class:`.Table` as a sequence of
+smaller tables ("chunks") with identical columns.
+
+Operations that work row by row, such as :meth:`PartitionedTable.where` and
+:meth:`PartitionedTable.compute`, are applied to each chunk in turn (or in
+parallel, see :meth:`PartitionedTable.with_executor`). Aggregations are
+computed for each chunk and then merged, and sorting merges sorted chunks, so
+that only a bounded number of chunks need to be loaded at once.
+"""
+
+import copy
+import heapq
+import itertools
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial
+
+from agate import utils
+from agate.compression import open_output
+from agate.exceptions import UnsupportedAggregationError
+from agate.external_sort import _spill, _unspill
+from agate.table import Table
+from agate.table.from_csv import open_csv
+from agate.table.group_aggregate import _prepare_incremental, _update_incremental
+from agate.table.order_by import make_sort_key
+from agate.table.to_json import _write_json
+from agate.tableset.with_executor import _call_method, _get_executor, _map
+
+#: Default number of rows in each chunk read by :meth:`PartitionedTable.from_csv`
+DEFAULT_CHUNK_ROWS = 100000
+
+#: Number of chunks submitted to an executor at once
+EXECUTOR_BATCH_SIZE = (os.cpu_count() or 1) * 2
+
+
+class _DiskChunk:
+    """
+    A chunk that has been written to a temporary file by :func:`._spill`.
+    """
+    __slots__ = ['file', 'length']
+
+    def __init__(self, table, spill_dir):
+        self.file = _spill(table._rows, spill_dir)
+        self.length = len(table._rows)
+
+    def __len__(self):
+        return self.length
+
+    def iter_rows(self, column_names):
+        self.file.seek(0)
+
+        return _unspill(self.file, column_names)
+
+
+class PartitionedTable:
+    """
+    A sequence of :class:`.Table` instances ("chunks") with identical columns,
+    which are processed as if they were a single table.
+
+    Chunks may be kept in memory, or written to temporary files and loaded one
+    at a time when they are needed. Row names are not supported.
+
+    Methods that apply an operation to each chunk return a new
+    :class:`PartitionedTable` with the same storage. Note that
+    :class:`.Computation` instances are also applied to each chunk, so
+    computations that depend on other rows, such as :class:`.Percent` or
+    :class:`.Rank`, will be relative to each chunk.
+
+    :param chunks:
+        A sequence of :class:`.Table` instances. There must be at least one,
+        though it may be empty.
+    :param on_disk:
+        If :code:`True`, each chunk is written to a temporary file, rather
+        than being kept in memory.
+    :param spill_dir:
+        The directory in which to create temporary files. Defaults to the
+        platform's temporary directory.
+    :param _is_fork:
+        Used internally to skip validating that the chunks have the same
+        columns.
+    """
+    def __init__(self, chunks, on_disk=False, spill_dir=None, _is_fork=False):
+        self._on_disk = on_disk
+        self._spill_dir = spill_dir
+        self._executor = None
+        self._chunks = []
+        self._column_names = None
+        self._column_types = None
+
+        for table in chunks:
+            if self._column_names is None:
+                self._column_names = table.column_names
+                self._column_types = table.column_types
+            elif not _is_fork:
+                column_types = itertools.zip_longest(table.column_types, self._column_types)
+
+                if any(not isinstance(a, type(b)) for a, b in column_types):
+                    raise ValueError('Not all chunks have the same column types!')
+
+                if table.column_names != self._column_names:
+                    raise ValueError('Not all chunks have the same column names!')
+
+            if on_disk:
+                self._chunks.append(_DiskChunk(table, spill_dir))
+            else:
+                self._chunks.append(table)
+
+        if self._column_names is None:
+            raise ValueError('PartitionedTable requires at least one chunk.')
+
+    def __len__(self):
+        """
+        The total number of rows in all chunks.
+        """
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def __iter__(self):
+        """
+        Iterate over the rows of every chunk.
+        """
+        for chunk in self._chunks:
+            yield from self._iter_chunk_rows(chunk)
+
+    @property
+    def column_names(self):
+        """
+        Get this table's column names.
+
+        :returns:
+            A :class:`tuple` of strings.
+        """
+        return self._column_names
+
+    @property
+    def column_types(self):
+        """
+        Get this table's column types.
+
+        :returns:
+            A :class:`tuple` of :class:`.DataType` instances.
+        """
+        return self._column_types
+
+    @property
+    def rows(self):
+        """
+        Get an iterator over the rows of every chunk. Unlike
+        :attr:`.Table.rows` this can only be iterated once.
+
+        :returns:
+            An iterator of :class:`.Row` instances.
+        """
+        return iter(self)
+
+    def iter_chunks(self):
+        """
+        Iterate over the chunks of this table, loading each from disk if
+        necessary.
+
+        :returns:
+            An iterator of :class:`.Table` instances.
+        """
+        for chunk in self._chunks:
+            if isinstance(chunk, _DiskChunk):
+                yield Table(
+                    list(chunk.iter_rows(self._column_names)), self._column_names, self._column_types, _is_fork=True
+                )
+            else:
+                yield chunk
+
+    def _iter_chunk_rows(self, chunk):
+        if isinstance(chunk, _DiskChunk):
+            return chunk.iter_rows(self._column_names)
+
+        return iter(chunk._rows)
+
+    def _fork(self, chunks):
+        """
+        Create a new :class:`PartitionedTable` with the same storage and
+        executor as this one.
+        """
+        table = PartitionedTable(chunks, self._on_disk, self._spill_dir, _is_fork=True)
+        table._executor = self._executor
+
+        return table
+
+    def _map_chunks(self, func):
+        """
+        Call a function on each chunk, using this table's executor if it has
+        one, and yield the results in order. Only a bounded number of chunks
+        are loaded at once.
+        """
+        executor = _get_executor(self)
+        batch_size = 1 if executor is None else EXECUTOR_BATCH_SIZE
+        chunks = self.iter_chunks()
+
+        while True:
+            batch = list(itertools.islice(chunks, batch_size))
+
+            if not batch:
+                break
+
+            yield from _map(executor, func, batch)
+
+    def _proxy(self, method_name, *args, **kwargs):
+        """
+        Call a :class:`.Table` method on each chunk and return a new
+        :class:`PartitionedTable` of the results.
+        """
+        return self._fork(self._map_chunks(partial(_call_method, method_name, args, kwargs)))
+
+    def with_executor(self, executor):
+        """
+        Create a new :class:`PartitionedTable` that processes its chunks using
+        an executor. See :meth:`.TableSet.with_executor`.
+
+        :param executor:
+            A :class:`concurrent.futures.Executor`, or :code:`None` to
+            process chunks serially.
+        :returns:
+            A new :class:`PartitionedTable`.
+        """
+        table = copy.copy(self)
+        table._executor = executor
+
+        return table
+
+    def compute(self, *args, **kwargs):
+        """
+        Calls :meth:`.Table.compute` on each chunk.
+        """
+        return self._proxy('compute', *args, **kwargs)
+
+    def exclude(self, *args, **kwargs):
+        """
+        Calls :meth:`.Table.exclude` on each chunk.
+        """
+        return self._proxy('exclude', *args, **kwargs)
+
+    def select(self, *args, **kwargs):
+        """
+        Calls :meth:`.Table.select` on each chunk.
+        """
+        return self._proxy('select', *args, **kwargs)
+
+    def where(self, *args, **kwargs):
+        """
+        Calls :meth:`.Table.where` on each chunk.
+        """
+        return self._proxy('where', *args, **kwargs)
+
+    def aggregate(self, aggregations):
+        """
+        Apply one or more :class:`.Aggregation` instances to this table.
+
+        Each aggregation is computed for each chunk using the incremental
+        protocol (see :meth:`.Aggregation.init`), and the results are combined
+        with :meth:`.Aggregation.merge`. Aggregations that do not support it,
+        such as :class:`.Median`, raise :class:`.UnsupportedAggregationError`.
+        (:class:`.ApproxMedian` may be used instead.)
+
+        Aggregations are validated once, against this table's column names and
+        types, rather than against each chunk, so no warnings are raised for
+        null values.
+
+        :param aggregations:
+            See :meth:`.Table.aggregate`.
+        :returns:
+            See :meth:`.Table.aggregate`.
+        """
+        if utils.issequence(aggregations):
+            names = [name for name, aggregation in aggregations]
+            aggs = [aggregation for name, aggregation in aggregations]
+        else:
+            aggs = [aggregations]
+
+        sample = Table([], self._column_names, self._column_types)
+        incremental, fallback = _prepare_incremental(sample, aggs)
+
+        if fallback:
+            raise UnsupportedAggregationError(
+                '%s can not be applied to a PartitionedTable, because it does not support incremental '
+                'aggregation.' % fallback[0][1]
+            )
+
+        states = None
+
+        for chunk_states in self._map_chunks(partial(_aggregate_chunk, incremental)):
+            if states is None:
+                states = chunk_states
+            else:
+                states = [aggregation.merge(a, b) for aggregation, a, b in zip(aggs, states, chunk_states)]
+
+        results = [aggregation.finalize(state) for aggregation, state in zip(aggs, states)]
+
+        if utils.issequence(aggregations):
+            return OrderedDict(zip(names, results))
+
+        return results[0]
+
+    def order_by(self, key, reverse=False):
+        """
+        Create a new :class:`PartitionedTable` sorted by a key.
+
+        Each chunk is sorted with :meth:`.Table.order_by` and the sorted chunks
+        are merged. The result has chunks of the same size as the largest
+        chunk in this table.
+
+        :param key:
+            See :meth:`.Table.order_by`.
+        :param reverse:
+            See :meth:`.Table.order_by`.
+        :returns:
+            A new :class:`PartitionedTable`.
+        """
+        sorted_table = self._proxy('order_by', key, reverse=reverse)
+        chunk_rows = max(1, max(len(chunk) for chunk in self._chunks))
+
+        rows = heapq.merge(
+            *[sorted_table._iter_chunk_rows(chunk) for chunk in sorted_table._chunks],
+            key=make_sort_key(key),
+            reverse=reverse
+        )
+
+        return self._fork(_chunk(rows, self._column_names, self._column_types, chunk_rows, _is_fork=True))
+
+    def to_table(self):
+        """
+        Combine all chunks into a single :class:`.Table`.
+
+        :returns:
+            A new :class:`.Table`.
+        """
+        return Table(list(self), self._column_names, self._column_types, _is_fork=True)
+
+    def to_csv(self, path, compression='infer', **kwargs):
+        """
+        Write this table to a CSV, one chunk at a time. See
+        :meth:`.Table.to_csv`.
+
+        :param path:
+            Filepath or file-like object to write to.
+        :param compression:
+            See :meth:`.Table.to_csv`.
+        """
+        from agate import csv
+
+        if 'lineterminator' not in kwargs:
+            kwargs['lineterminator'] = '\n'
+
+        with _open_output(path, compression) as f:
+            writer = csv.writer(f, **kwargs)
+            writer.writerow(self._column_names)
+
+            csv_funcs = [c.csvify for c in self._column_types]
+
+            for row in self:
+                writer.writerow(tuple(csv_funcs[i](d) for i, d in enumerate(row)))
+
+    def to_json(self, path, key=None, newline=False, indent=None, compression='infer', **kwargs):
+        """
+        Write this table to JSON, one chunk at a time. The output is identical
+        to :meth:`.Table.to_json`.
+
+        :param path:
+            File path or file-like object to write to.
+        :param key:
+            See :meth:`.Table.to_json`.
+        :param newline:
+            See :meth:`.Table.to_json`.
+        :param indent:
+            See :meth:`.Table.to_json`.
+        :param compression:
+            See :meth:`.Table.to_json`.
+        """
+        if key is not None and newline:
+            raise ValueError('key and newline may not be specified together.')
+
+        if newline and indent is not None:
+            raise ValueError('newline and indent may not be specified together.')
+
+        with _open_output(path, compression) as f:
+            _write_json(f, self, self._column_types, key, newline, indent, **kwargs)
+
+    @classmethod
+    def from_csv(cls, path, column_names=None, column_types=None, skip_lines=0, header=True, sniff_limit=0,
+                 encoding='utf-8', row_limit=None, chunk_rows=DEFAULT_CHUNK_ROWS, on_disk=False, spill_dir=None,
+                 compression='infer', **kwargs):
+        """
+        Create a new :class:`PartitionedTable` from a CSV, reading it in chunks.
+
+        If :code:`column_types` is not specified, types are inferred from the
+        first chunk and reused for every subsequent chunk. If later rows can
+        not be cast to those types a :class:`.CastError` will be raised, in
+        which case the types should be given explicitly.
+
+        :code:`kwargs` will be passed through to the CSV reader.
+
+        :param path:
+            See :meth:`.Table.from_csv`.
+        :param column_names:
+            See :meth:`.Table.__init__`.
+        :param column_types:
+            See :meth:`.Table.__init__`.
+        :param skip_lines:
+            See :meth:`.Table.from_csv`.
+        :param header:
+            See :meth:`.Table.from_csv`.
+        :param sniff_limit:
+            See :meth:`.Table.from_csv`.
+        :param encoding:
+            See :meth:`.Table.from_csv`.
+        :param row_limit:
+            See :meth:`.Table.from_csv`.
+        :param chunk_rows:
+            The maximum number of rows in each chunk.
+        :param on_disk:
+            See :class:`PartitionedTable`.
+        :param spill_dir:
+            See :class:`PartitionedTable`.
+        :param compression:
+            See :meth:`.Table.from_csv`.
+        :returns:
+            A new :class:`PartitionedTable`.
+        """
+        if chunk_rows < 1:
+            raise ValueError('chunk_rows must be a positive integer.')
+
+        with open_csv(path, column_names, skip_lines, header, sniff_limit, encoding, row_limit, compression,
+                      **kwargs) as csv_data:
+            column_names, rows = csv_data
+
+            return cls(_chunk(rows, column_names, column_types, chunk_rows), on_disk, spill_dir)
+
+
+def _aggregate_chunk(incremental, table):
+    """
+    Compute the incremental state of a sequence of aggregations, as returned
+    by :func:`_prepare_incremental`, for one chunk.
+    """
+    states = [aggregation.init(table) for i, aggregation, index in incremental]
+
+    for row in table._rows:
+        _update_incremental(incremental, states, row)
+
+    return states
+
+
+def _chunk(rows, column_names, column_types, chunk_rows, _is_fork=False):
+    """
+    Split an iterator of rows into tables of at most :code:`chunk_rows` rows.
+    The first table is always yielded, even if it is empty. If column types
+    are not specified, they are inferred from it.
+
+    Rows must be :class:`.Row` instances if :code:`_is_fork` is
+    :code:`True`, otherwise sequences of raw values.
+    """
+    rows = iter(rows)
+    first = True
+
+    while True:
+        batch = list(itertools.islice(rows, chunk_rows))
+
+        if not batch and not first:
+            break
+
+        table = Table(batch, column_names, column_types, _is_fork=_is_fork)
+        column_names = table.column_names
+        column_types = table.column_types
+        first = False
+
+        yield table
+
+        if len(batch) < chunk_rows:
+            break
+
+
+@contextmanager
+def _open_output(path, compression='infer'):
+    """
+    Open a path for writing, creating its directory if necessary, or use a
+    file-like object as is. Only files opened from a path are closed.
+    """
+    if hasattr(path, 'write'):
+        yield path
+        return
+
+    dirpath = os.path.dirname(path)
+
+    if dirpath and not os.path.exists(dirpath):
+        os.makedirs(dirpath)
+
+    with open_output(path, compression=compression) as f:
+        yield f
@@ -0,0 +1,397 @@
+"""
+This module contains a profiler for agate pipelines. While it is running,
+every call to a :class:`.Table` or :class:`.TableSet` method, and to the
+:code:`run` method of an :class:`.Aggregation` or :class:`.Computation`, is
+timed and recorded in a tree that follows the call chain. For example, a
+call to :meth:`.TableSet.aggregate` contains a call to
+:meth:`.Table.aggregate` for each table, which in turn contains a call to the
+:code:`run` method of each aggregation.
+
+.. code-block:: python
+
+    with agate.profile() as profiler:
+        totals = table.group_by('state').aggregate([('total', agate.Sum('amount'))])
+
+    profiler.print_tree()
+    profiler.to_folded('pipeline.folded')
+
+Methods are only instrumented while a profiler is running, so profiling has
+no cost otherwise.
+"""
+
+import functools
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+
+from agate.utils import LazyMethod
+
+#: The profiler that is currently running, if any
+_running = None
+
+_lock = threading.Lock()
+
+
+class ProfileNode:
+    """
+    A single call recorded by a :class:`Profiler`.
+
+    :param name:
+        The name of the method called, such as :code:`Table.where` or
+        :code:`Sum.run`.
+    :param rows_in:
+        The number of rows in the table (or in all of the tables of the table
+        set) the method was called on, if any.
+    """
+    def __init__(self, name, rows_in=None):
+        #: The name of the method called
+        self.name = name
+        #: The wall time of the call in seconds, including any calls it made
+        self.time = 0
+        #: The number of rows in the table or table set the method was called on
+        self.rows_in = rows_in
+        #: The number of rows in the table or table set returned, if any
+        self.rows_out = None
+        #: The number of columns in the table or table set returned, or else
+        #: in the table or table set the method was called on
+        self.columns = None
+        #: The net number of bytes allocated during the call, as measured by
+        #: :mod:`tracemalloc`, or :code:`None` if memory was not traced
+        self.memory = None
+        #: The calls made during this call, in order
+        self.children = []
+
+    @property
+    def self_time(self):
+        """
+        The wall time of the call in seconds, excluding the calls it made.
+        """
+        return max(self.time - sum(child.time for child in self.children), 0)
+
+    def to_dict(self):
+        """
+        Convert this call and the calls it made to a dictionary.
+        """
+        return OrderedDict([
+            ('name', self.name),
+            ('time', self.time),
+            ('self_time', self.self_time),
+            ('rows_in', self.rows_in),
+            ('rows_out', self.rows_out),
+            ('columns', self.columns),
+            ('memory', self.memory),
+            ('children', [child.to_dict() for child in self.children]),
+        ])
+
+
+class Profiler:
+    """
+    Record the calls made to agate methods while it is running. Use
+    :func:`profile` to run a profiler for the duration of a :code:`with`
+    block, or call :meth:`start` and :meth:`stop`.
+
+    Only one profiler can run at a time. Calls made in every thread are
+    recorded. Calls made by worker processes, such as those of a
+    :class:`concurrent.futures.ProcessPoolExecutor`, are not.
+
+    :class:`.Computation` instances that :meth:`.Table.compute` evaluates row
+    by row (see :meth:`.Computation.get_row_function`) do not call their
+    :code:`run` method, so their time is included in that of
+    :meth:`.Table.compute`.
+
+    :param memory:
+        If :code:`True`, record the net number of bytes allocated by each call
+        using :mod:`tracemalloc`. This makes the profiled code considerably
+        slower.
+    """
+    def __init__(self, memory=True):
+        self._memory = memory
+        self._started_tracing = False
+        self._originals = []
+        self._local = threading.local()
+
+        #: The calls made while the profiler was running that were not made by
+        #: another recorded call, as :class:`ProfileNode` instances
+        self.calls = []
+
+    def __enter__(self):
+        self.start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """
+        Start recording calls.
+        """
+        global _running
+
+        with _lock:
+            if _running is not None:
+                raise ValueError('Another profiler is already running.')
+
+            _running = self
+
+        if self._memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        from agate.aggregations import Aggregation
+        from agate.computations import Computation
+        from agate.table import Table
+        from agate.tableset import TableSet
+
+        for cls in (Table, TableSet):
+            self._instrument_methods(cls)
+
+        for base in (Aggregation, Computation):
+            for cls in _subclasses(base):
+                self._instrument_run(cls)
+
+    def stop(self):
+        """
+        Stop recording calls.
+        """
+        global _running
+
+        for cls, name, value in reversed(self._originals):
+            setattr(cls, name, value)
+
+        self._originals = []
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        with _lock:
+            if _running is self:
+                _running = None
+
+    def _instrument_methods(self, cls):
+        """
+        Wrap each public method of :class:`.Table` or :class:`.TableSet`.
+        """
+        for name, value in list(vars(cls).items()):
+            if name.startswith('_'):
+                continue
+
+            # Import methods that have not been used yet
+            if isinstance(value, LazyMethod):
+                value.load()
+                value = vars(cls)[name]
+
+            label = '%s.%s' % (cls.__name__, name)
+
+            if isinstance(value, classmethod):
+                wrapper = classmethod(self._wrap(value.__func__, lambda args, label=label: label, 0))
+            elif callable(value):
+                wrapper = self._wrap(value, lambda args, label=label: label, 0)
+            else:
+                continue
+
+            self._originals.append((cls, name, value))
+            setattr(cls, name, wrapper)
+
+    def _instrument_run(self, cls):
+        """
+        Wrap the :code:`run` method of an :class:`.Aggregation` or
+        :class:`.Computation`, if it defines one.
+        """
+        if 'run' not in vars(cls):
+            return
+
+        value = vars(cls)['run']
+
+        self._originals.append((cls, 'run', value))
+        setattr(cls, 'run', self._wrap(value, lambda args: '%s.run' % type(args[0]).__name__, 1))
+
+    def _wrap(self, func, get_name, source_index):
+        """
+        Wrap a function so that its calls are recorded.
+
+        :param get_name:
+            A function that returns the name of the call from its positional
+            arguments.
+        :param source_index:
+            The index of the positional argument that is the table or table
+            set the call operates on.
+        """
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            source = args[source_index] if len(args) > source_index else None
+
+            return self._call(get_name(args), source, func, args, kwargs)
+
+        return wrapper
+
+    def _call(self, name, source, func, args, kwargs):
+        try:
+            stack = self._local.stack
+        except AttributeError:
+            stack = self._local.stack = []
+
+        node = ProfileNode(name, _count_rows(source))
+
+        if stack:
+            stack[-1].children.append(node)
+        else:
+            self.calls.append(node)
+
+        stack.append(node)
+        memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        start = time.perf_counter()
+
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            node.time = time.perf_counter() - start
+
+            if memory is not None and tracemalloc.is_tracing():
+                node.memory = tracemalloc.get_traced_memory()[0] - memory
+
+            stack.pop()
+
+        node.rows_out = _count_rows(result)
+        node.columns = _count_columns(result)
+
+        if node.columns is None:
+            node.columns = _count_columns(source)
+
+        return result
+
+    def to_dict(self):
+        """
+        Convert the recorded calls to a list of dictionaries.
+        """
+        return [node.to_dict() for node in self.calls]
+
+    def to_json(self, path, indent=4):
+        """
+        Write the recorded calls to a file as JSON: a list of objects with the
+        attributes of each :class:`ProfileNode`, and a :code:`children` list.
+
+        :param path:
+            Filepath or file-like object to write to.
+        :param indent:
+            The number of spaces to indent nested objects.
+        """
+        if hasattr(path, 'write'):
+            json.dump(self.to_dict(), path, indent=indent)
+        else:
+            with open(path, 'w') as f:
+                json.dump(self.to_dict(), f, indent=indent)
+
+    def to_folded(self, path):
+        """
+        Write the recorded calls to a file in the "folded" (or "collapsed")
+        stack format read by flame graph tools, such as `FlameGraph
+        <https://github.com/brendangregg/FlameGraph>`_ and `speedscope
+        <https://www.speedscope.app/>`_. Each line is a call chain separated
+        by semicolons, followed by the time spent in the last call, excluding
+        the calls it made, in microseconds.
+
+        :param path:
+            Filepath or file-like object to write to.
+        """
+        stacks = OrderedDict()
+
+        def fold(node, prefix):
+            chain = prefix + node.name
+            stacks[chain] = stacks.get(chain, 0) + node.self_time
+
+            for child in node.children:
+                fold(child, chain + ';')
+
+        for node in self.calls:
+            fold(node, '')
+
+        lines = ['%s %i\n' % (chain, round(seconds * 1000000)) for chain, seconds in stacks.items()]
+
+        if hasattr(path, 'write'):
+            path.writelines(lines)
+        else:
+            with open(path, 'w') as f:
+                f.writelines(lines)
+
+    def print_tree(self, output=sys.stdout):
+        """
+        Print the recorded calls as an indented tree, with the time, rows,
+        columns and memory of each call.
+
+        :param output:
+            The output to print to.
+        """
+        def write(node, depth):
+            parts = ['%s%s' % ('  ' * depth, node.name), '%.3f ms' % (node.time * 1000)]
+
+            if node.rows_in is not None or node.rows_out is not None:
+                parts.append('rows %s -> %s' % (
+                    '-' if node.rows_in is None else node.rows_in,
+                    '-' if node.rows_out is None else node.rows_out
+                ))
+
+            if node.columns is not None:
+                parts.append('columns %i' % node.columns)
+
+            if node.memory is not None:
+                parts.append('memory %i B' % node.memory)
+
+            output.write('  '.join(parts) + '\n')
+
+            for child in node.children:
+                write(child, depth + 1)
+
+        for node in self.calls:
+            write(node, 0)
+
+
+def profile(memory=True):
+    """
+    Create a :class:`Profiler` to use in a :code:`with` block. Calls are
+    recorded until the block ends.
+
+    :param memory:
+        See :class:`Profiler`.
+    """
+    return Profiler(memory=memory)
+
+
+def _subclasses(cls):
+    """
+    Find a class and all of its subclasses.
+    """
+    classes = [cls]
+
+    for subclass in cls.__subclasses__():
+        for c in _subclasses(subclass):
+            if c not in classes:
+                classes.append(c)
+
+    return classes
+
+
+def _count_rows(value):
+    from agate.table import Table
+    from agate.tableset import TableSet
+
+    if isinstance(value, Table):
+        return len(value._rows)
+    elif isinstance(value, TableSet):
+        return sum(_count_rows(table) for table in value._values)
+
+    return None
+
+
+def _count_columns(value):
+    from agate.table import Table
+    from agate.tableset import TableSet
+
+    if isinstance(value, (Table, TableSet)):
+        return len(value._column_names)
+
+    return None
@@ -0,0 +1,306 @@
+"""
+This module contains probabilistic data structures ("sketches") which
+summarize a stream of values in a small, fixed amount of memory. They are used
+to implement approximate aggregations, such as :class:`.ApproxPercentiles`,
+which can be computed incrementally and merged across chunks of data.
+"""
+
+import datetime
+import hashlib
+import math
+from bisect import bisect_right
+from decimal import Decimal
+
+#: Ratio between the capacities of adjacent levels of a :class:`KLLSketch`
+KLL_CAPACITY_RATIO = 2 / 3
+
+#: Minimum capacity of any level of a :class:`KLLSketch`
+KLL_MIN_CAPACITY = 8
+
+#: Smallest precision supported by :class:`HyperLogLog`
+HLL_MIN_PRECISION = 4
+
+#: Largest precision supported by :class:`HyperLogLog`
+HLL_MAX_PRECISION = 18
+
+_LCG_MULTIPLIER = 6364136223846793005
+_LCG_INCREMENT = 1442695040888963407
+_LCG_MASK = 2 ** 64 - 1
+
+
+class KLLSketch:
+    """
+    A quantile sketch using the algorithm described by Karnin, Lang and
+    Liberty in `Optimal Quantile Approximation in Streams
+    <https://arxiv.org/abs/1603.05346>`_.
+
+    Values are added to a buffer ("compactor"). When it is full, it is sorted
+    and every other value is promoted to the next level, where it stands for
+    two values. Higher levels have larger capacities, so the number of values
+    retained grows only logarithmically with the number of values added.
+
+    Compaction chooses between the odd and even values with a pseudo-random
+    sequence that is seeded identically for every sketch, so results are
+    reproducible.
+
+    :param k:
+        The capacity of the highest level. The normalized rank error of a
+        query is proportional to :code:`1 / k`, and the memory used is
+        proportional to :code:`k`.
+    """
+    __slots__ = ['_k', '_compactors', '_capacities', '_size', '_max_size', '_count', '_seed', '_min', '_max']
+
+    def __init__(self, k=200):
+        self._k = k
+        self._compactors = [[]]
+        self._capacities = []
+        self._size = 0
+        self._max_size = 0
+        self._count = 0
+        self._seed = 0
+        self._min = None
+        self._max = None
+
+        self._update_capacities()
+
+    def __len__(self):
+        """
+        The number of values added to this sketch.
+        """
+        return self._count
+
+    def _update_capacities(self):
+        """
+        Recompute the capacity of each level, which depends on the number of
+        levels.
+        """
+        height = len(self._compactors)
+
+        self._capacities = [
+            max(KLL_MIN_CAPACITY, int(math.ceil(self._k * KLL_CAPACITY_RATIO ** (height - level - 1))))
+            for level in range(height)
+        ]
+        self._max_size = sum(self._capacities)
+
+    def _coin(self):
+        self._seed = (self._seed * _LCG_MULTIPLIER + _LCG_INCREMENT) & _LCG_MASK
+
+        return self._seed >> 63
+
+    def update(self, value):
+        """
+        Add a value to this sketch. The value must not be null.
+        """
+        self._compactors[0].append(value)
+        self._size += 1
+        self._count += 1
+
+        if self._min is None or value < self._min:
+            self._min = value
+
+        if self._max is None or value > self._max:
+            self._max = value
+
+        if self._size >= self._max_size:
+            self._compress()
+
+    def merge(self, other):
+        """
+        Add all of the values summarized by another sketch to this one.
+        """
+        while len(self._compactors) < len(other._compactors):
+            self._compactors.append([])
+
+        for level, compactor in enumerate(other._compactors):
+            self._compactors[level].extend(compactor)
+
+        self._size += other._size
+        self._count += other._count
+
+        if other._count:
+            if self._min is None or other._min < self._min:
+                self._min = other._min
+
+            if self._max is None or other._max > self._max:
+                self._max = other._max
+
+        self._update_capacities()
+        self._compress()
+
+    def _compress(self):
+        while self._size >= self._max_size:
+            for level, compactor in enumerate(self._compactors):
+                if len(compactor) >= self._capacities[level]:
+                    break
+            else:
+                break
+
+            if level + 1 == len(self._compactors):
+                self._compactors.append([])
+                self._update_capacities()
+
+            compactor.sort()
+
+            # An odd value out stays at this level, which keeps the total
+            # weight equal to the number of values added.
+            if len(compactor) % 2:
+                kept = [compactor.pop()]
+            else:
+                kept = []
+
+            promoted = compactor[self._coin()::2]
+
+            self._compactors[level] = kept
+            self._compactors[level + 1].extend(promoted)
+            self._size -= len(compactor) - len(promoted)
+
+    def values_at(self, indices):
+        """
+        Estimate the values that would be at the given indices if all of the
+        values added to this sketch were sorted. The first and last indices
+        are always exact.
+
+        :param indices:
+            A sequence of indices from :code:`0` to :code:`len(sketch) - 1`.
+        :returns:
+            A list of values in the same order as :code:`indices`.
+        """
+        items = []
+
+        for level, compactor in enumerate(self._compactors):
+            weight = 2 ** level
+
+            for value in compactor:
+                items.append((value, weight))
+
+        items.sort(key=lambda item: item[0])
+
+        ranks = []
+        total = 0
+
+        for value, weight in items:
+            total += weight
+            ranks.append(total)
+
+        results = []
+
+        for i in indices:
+            if i < 0 or i >= self._count:
+                raise IndexError('Index %i is out of range.' % i)
+            elif i == 0:
+                results.append(self._min)
+            elif i == self._count - 1:
+                results.append(self._max)
+            else:
+                results.append(items[bisect_right(ranks, i)][0])
+
+        return results
+
+
+class HyperLogLog:
+    """
+    A distinct count sketch using the algorithm described by Flajolet et al.
+    in `HyperLogLog: the analysis of a near-optimal cardinality estimation
+    algorithm <https://algo.inria.fr/flajolet/Publications/FlFuGaMe07.pdf>`_.
+
+    Each value is hashed (see :func:`stable_hash`). The first
+    :code:`precision` bits of the hash select one of :code:`2 ** precision`
+    registers, which records the longest run of leading zeros seen in the
+    remaining bits. The number of distinct values is estimated from the
+    harmonic mean of the registers. Small counts are estimated by "linear
+    counting" of the empty registers instead.
+
+    The relative standard error of the estimate is about
+    :code:`1.04 / sqrt(2 ** precision)`, and the sketch uses
+    :code:`2 ** precision` bytes.
+
+    :param precision:
+        The number of bits used to select a register, from 4 to 18.
+    """
+    __slots__ = ['_precision', '_registers']
+
+    def __init__(self, precision=14):
+        if not HLL_MIN_PRECISION <= precision <= HLL_MAX_PRECISION:
+            raise ValueError('precision must be between %i and %i.' % (HLL_MIN_PRECISION, HLL_MAX_PRECISION))
+
+        self._precision = precision
+        self._registers = bytearray(2 ** precision)
+
+    def update(self, value):
+        """
+        Add a value to this sketch. The value must not be null.
+        """
+        x = stable_hash(value)
+        bits = 64 - self._precision
+        index = x >> bits
+        rank = bits - (x & ((1 << bits) - 1)).bit_length() + 1
+
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def merge(self, other):
+        """
+        Add all of the values summarized by another sketch to this one. Both
+        sketches must have the same precision.
+        """
+        if other._precision != self._precision:
+            raise ValueError('Can not merge HyperLogLog sketches with different precisions.')
+
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+    def count(self):
+        """
+        Estimate the number of distinct values added to this sketch.
+
+        :returns:
+            An :class:`int`.
+        """
+        m = len(self._registers)
+
+        if m == 16:
+            alpha = 0.673
+        elif m == 32:
+            alpha = 0.697
+        elif m == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / m)
+
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self._registers)
+        zeros = self._registers.count(0)
+
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+
+        return int(round(estimate))
+
+
+def stable_hash(value):
+    """
+    Hash a value to a 64-bit integer that is the same in every process and
+    on every platform, unlike :func:`hash`.
+
+    Values that agate considers equal hash equally. For example,
+    :code:`Decimal('1.0')` and :code:`Decimal('1')`.
+    """
+    if isinstance(value, str):
+        key = 's' + value
+    elif isinstance(value, bool):
+        key = 'b' + str(value)
+    elif isinstance(value, (Decimal, int, float)):
+        if value == 0:
+            key = 'n0'
+        else:
+            key = 'n' + str(Decimal(value).normalize())
+    elif isinstance(value, datetime.datetime):
+        key = 't' + value.isoformat()
+    elif isinstance(value, datetime.date):
+        key = 'd' + value.isoformat()
+    elif isinstance(value, datetime.timedelta):
+        key = 'D%i,%i,%i' % (value.days, value.seconds, value.microseconds)
+    else:
+        key = 'r' + repr(value)
+
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+
+    return int.from_bytes(digest, 'big')
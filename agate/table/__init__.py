@@ -17,8 +17,10 @@ sequences can be accessed either by numeric index or by name. (In the case of
 rows, row names are optional.)
 """
 
+import datetime
 import sys
 import warnings
+from decimal import Decimal
 from io import StringIO
 from itertools import chain
 
@@ -180,6 +182,22 @@ class Table:
 
         self._columns = MappedSequence(new_columns, self._column_names)
 
+    def __reduce__(self):
+        """
+        Pickle this table compactly. The column names, column types and row
+        names are pickled once, and the values are pickled by column rather
+        than as :class:`.Row` instances. Columns of
+        :class:`decimal.Decimal` and :class:`datetime.date` values are
+        pickled as a single string and as a list of integers, respectively.
+        The rows are created again when the table is unpickled.
+        """
+        columns = [
+            _pack_column([row._values[i] for row in self._rows])
+            for i in range(len(self._column_names))
+        ]
+
+        return (_unpickle, (len(self._rows), columns, self._column_names, self._column_types, self._row_names))
+
     def __str__(self):
         """
         Print the table's structure using :meth:`.Table.print_structure`.
@@ -299,68 +317,88 @@ class Table:
         self.to_json(sys.stdout, **kwargs)
 
 
-from agate.table.aggregate import aggregate
-from agate.table.bar_chart import bar_chart
-from agate.table.bins import bins
-from agate.table.column_chart import column_chart
-from agate.table.compute import compute
-from agate.table.denormalize import denormalize
-from agate.table.distinct import distinct
-from agate.table.exclude import exclude
-from agate.table.find import find
-from agate.table.from_csv import from_csv
-from agate.table.from_fixed import from_fixed
-from agate.table.from_json import from_json
-from agate.table.from_object import from_object
-from agate.table.group_by import group_by
-from agate.table.homogenize import homogenize
-from agate.table.join import join
-from agate.table.limit import limit
-from agate.table.line_chart import line_chart
-from agate.table.merge import merge
-from agate.table.normalize import normalize
-from agate.table.order_by import order_by
-from agate.table.pivot import pivot
-from agate.table.print_bars import print_bars
-from agate.table.print_html import print_html
-from agate.table.print_structure import print_structure
-from agate.table.print_table import print_table
-from agate.table.rename import rename
-from agate.table.scatterplot import scatterplot
-from agate.table.select import select
-from agate.table.to_csv import to_csv
-from agate.table.to_json import to_json
-from agate.table.where import where
-
-Table.aggregate = aggregate
-Table.bar_chart = bar_chart
-Table.bins = bins
-Table.column_chart = column_chart
-Table.compute = compute
-Table.denormalize = denormalize
-Table.distinct = distinct
-Table.exclude = exclude
-Table.find = find
-Table.from_csv = from_csv
-Table.from_fixed = from_fixed
-Table.from_json = from_json
-Table.from_object = from_object
-Table.group_by = group_by
-Table.homogenize = homogenize
-Table.join = join
-Table.limit = limit
-Table.line_chart = line_chart
-Table.merge = merge
-Table.normalize = normalize
-Table.order_by = order_by
-Table.pivot = pivot
-Table.print_bars = print_bars
-Table.print_html = print_html
-Table.print_structure = print_structure
-Table.print_table = print_table
-Table.rename = rename
-Table.scatterplot = scatterplot
-Table.select = select
-Table.to_csv = to_csv
-Table.to_json = to_json
-Table.where = where
+def _pack_column(values):
+    """
+    Encode a column's values for pickling.
+
+    :returns:
+        A :code:`(kind, data)` tuple to pass to :func:`_unpack_column`.
+    """
+    if all(type(v) is Decimal or v is None for v in values):
+        return ('decimal', '\x00'.join('' if v is None else str(v) for v in values))
+
+    if all(type(v) is datetime.date or v is None for v in values):
+        return ('date', [None if v is None else v.toordinal() for v in values])
+
+    return (None, values)
+
+
+def _unpack_column(kind, data):
+    """
+    Decode a column's values encoded by :func:`_pack_column`.
+    """
+    if kind == 'decimal':
+        return [None if s == '' else Decimal(s) for s in data.split('\x00')]
+
+    if kind == 'date':
+        fromordinal = datetime.date.fromordinal
+
+        return [None if v is None else fromordinal(v) for v in data]
+
+    return data
+
+
+def _unpickle(length, columns, column_names, column_types, row_names):
+    """
+    Create a table from the state pickled by :meth:`Table.__reduce__`.
+    """
+    if not length:
+        rows = []
+    elif columns:
+        rows = zip(*[_unpack_column(kind, data) for kind, data in columns])
+    else:
+        rows = [()] * length
+
+    rows = [Row(values, column_names) for values in rows]
+
+    return Table(rows, column_names, column_types, row_names=row_names, _is_fork=True)
+
+
+# Methods are imported from their modules the first time they are used
+__getattr__ = utils.attach_lazy_methods(Table, {
+    'aggregate': 'agate.table.aggregate',
+    'bar_chart': 'agate.table.bar_chart',
+    'bins': 'agate.table.bins',
+    'column_chart': 'agate.table.column_chart',
+    'compute': 'agate.table.compute',
+    'denormalize': 'agate.table.denormalize',
+    'distinct': 'agate.table.distinct',
+    'exclude': 'agate.table.exclude',
+    'find': 'agate.table.find',
+    'from_csv': 'agate.table.from_csv',
+    'from_fixed': 'agate.table.from_fixed',
+    'from_json': 'agate.table.from_json',
+    'from_object': 'agate.table.from_object',
+    'group_aggregate': 'agate.table.group_aggregate',
+    'group_by': 'agate.table.group_by',
+    'homogenize': 'agate.table.homogenize',
+    'iter_groups': 'agate.table.iter_groups',
+    'join': 'agate.table.join',
+    'limit': 'agate.table.limit',
+    'line_chart': 'agate.table.line_chart',
+    'memory_usage': 'agate.table.memory_usage',
+    'merge': 'agate.table.merge',
+    'normalize': 'agate.table.normalize',
+    'order_by': 'agate.table.order_by',
+    'pivot': 'agate.table.pivot',
+    'print_bars': 'agate.table.print_bars',
+    'print_html': 'agate.table.print_html',
+    'print_structure': 'agate.table.print_structure',
+    'print_table': 'agate.table.print_table',
+    'rename': 'agate.table.rename',
+    'scatterplot': 'agate.table.scatterplot',
+    'select': 'agate.table.select',
+    'to_csv': 'agate.table.to_csv',
+    'to_json': 'agate.table.to_json',
+    'where': 'agate.table.where',
+})
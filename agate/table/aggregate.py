@@ -7,6 +7,11 @@ def aggregate(self, aggregations):
     """
     Apply one or more :class:`.Aggregation` instances to this table.
 
+    When a sequence of aggregations is applied, the values of each column (and
+    derived sequences, such as the sorted values without nulls) are computed
+    once and shared by all of the aggregations, rather than being recomputed
+    by each of them.
+
     :param aggregations:
         A single :class:`.Aggregation` instance or a sequence of tuples in the
         format :code:`(name, aggregation)`, where each :code:`aggregation` is
@@ -19,11 +24,21 @@ def aggregate(self, aggregations):
     if utils.issequence(aggregations):
         results = OrderedDict()
 
+        table = self
+
+        if len(aggregations) > 1:
+            # A private fork, so that its cached column data is discarded
+            # as soon as the aggregations are complete.
+            table = self._fork(self._rows)
+
+            for column in table._columns:
+                column.enable_cache()
+
         for name, agg in aggregations:
-            agg.validate(self)
+            agg.validate(table)
 
         for name, agg in aggregations:
-            results[name] = agg.run(self)
+            results[name] = agg.run(table)
 
         return results
 
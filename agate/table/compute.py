@@ -1,5 +1,6 @@
-from collections import OrderedDict
 from copy import copy
+from itertools import repeat
+from operator import itemgetter
 
 from agate.rows import Row
 
@@ -9,6 +10,10 @@ def compute(self, computations, replace=False):
     Create a new table by applying one or more :class:`.Computation` instances
     to each row.
 
+    Computations that calculate each row's value independently of other rows
+    (see :meth:`.Computation.get_row_function`) are applied together in a
+    single pass over the rows. Any others are run first, one column at a time.
+
     :param computations:
         A sequence of pairs of new column names and :class:`.Computation`
         instances.
@@ -18,11 +23,21 @@ def compute(self, computations, replace=False):
     :returns:
         A new :class:`.Table`.
     """
+    table = self
+
+    if len(computations) > 1:
+        # A private fork, so that column data shared by the computations,
+        # such as the sorted order of a column, is cached while they run.
+        table = self._fork(self._rows)
+
+        for column in table._columns:
+            column.enable_cache()
+
     column_names = list(copy(self._column_names))
     column_types = list(copy(self._column_types))
 
     for new_column_name, computation in computations:
-        new_column_type = computation.get_computed_data_type(self)
+        new_column_type = computation.get_computed_data_type(table)
 
         if new_column_name in column_names:
             if not replace:
@@ -36,28 +51,57 @@ def compute(self, computations, replace=False):
             column_names.append(new_column_name)
             column_types.append(new_column_type)
 
-        computation.validate(self)
+        computation.validate(table)
 
-    new_columns = OrderedDict()
+    row_functions = []
+    new_columns = []
+    computed = []
 
     for new_column_name, computation in computations:
-        new_columns[new_column_name] = computation.run(self)
+        func = computation.get_row_function(table)
+
+        if func is None:
+            computed.append((new_column_name, False, len(new_columns)))
+            new_columns.append(computation.run(table))
+        else:
+            computed.append((new_column_name, True, len(row_functions)))
+            row_functions.append(func)
+
+    # Each row is built from its existing values, followed by the values of
+    # the row functions and then the values of the column computations. Map
+    # each output column to its position in that sequence. Later computations
+    # with the same name take precedence.
+    sources = dict((column_name, i) for i, column_name in enumerate(self._column_names))
+    offset = len(self._column_names)
+
+    for new_column_name, is_row_function, i in computed:
+        if is_row_function:
+            sources[new_column_name] = offset + i
+        else:
+            sources[new_column_name] = offset + len(row_functions) + i
+
+    indexes = [sources[column_name] for column_name in column_names]
+    getter = None if indexes == list(range(len(indexes))) else itemgetter(*indexes)
+
+    if new_columns:
+        new_values = zip(*new_columns)
+    else:
+        new_values = repeat(())
 
     new_rows = []
 
-    for i, row in enumerate(self._rows):
-        # Slow version if using replace
-        if replace:
-            values = []
-
-            for j, column_name in enumerate(column_names):
-                if column_name in new_columns:
-                    values.append(new_columns[column_name][i])
-                else:
-                    values.append(row[j])
-        # Faster version if not using replace
+    for row, values in zip(self._rows, new_values):
+        if row_functions:
+            values = row.values() + tuple([func(row) for func in row_functions]) + values
         else:
-            values = row.values() + tuple(c[i] for c in new_columns.values())
+            values = row.values() + values
+
+        if getter is not None:
+            values = getter(values)
+
+            # itemgetter returns a bare value for a single column
+            if len(indexes) == 1:
+                values = (values,)
 
         new_rows.append(Row(values, column_names))
 
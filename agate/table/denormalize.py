@@ -73,7 +73,7 @@ def denormalize(self, key=None, property_column='property', value_column='value'
     elif not utils.issequence(key):
         key = [key]
 
-    field_names = []
+    field_names = OrderedDict()
     row_data = OrderedDict()
 
     for row in self.rows:
@@ -85,8 +85,7 @@ def denormalize(self, key=None, property_column='property', value_column='value'
         f = str(row[property_column])
         v = row[value_column]
 
-        if f not in field_names:
-            field_names.append(f)
+        field_names[f] = True
 
         row_data[row_key][f] = v
 
@@ -96,6 +95,7 @@ def denormalize(self, key=None, property_column='property', value_column='value'
         else:
             default_value = None
 
+    field_names = list(field_names)
     new_column_names = key + field_names
 
     new_rows = []
@@ -1,11 +1,12 @@
 import io
 import itertools
 import sys
+from contextlib import contextmanager
 
 
 @classmethod
 def from_csv(cls, path, column_names=None, column_types=None, row_names=None, skip_lines=0, header=True, sniff_limit=0,
-             encoding='utf-8', row_limit=None, **kwargs):
+             encoding='utf-8', row_limit=None, chunk_rows=None, compression='infer', **kwargs):
     """
     Create a new table from a CSV.
 
@@ -39,17 +40,53 @@ def from_csv(cls, path, column_names=None, column_types=None, row_names=None, sk
         encoding specified.
     :param row_limit:
         Limit how many rows of data will be read.
+    :param chunk_rows:
+        If specified, read the CSV in chunks of this many rows and return a
+        :class:`.PartitionedTable` instead of a :class:`.Table`. See
+        :meth:`.PartitionedTable.from_csv`.
+    :param compression:
+        The compression of the file: :code:`'gzip'`, :code:`'bz2'`,
+        :code:`'lzma'` or :code:`None`. By default, it is inferred from the
+        extension of :code:`path`. See :mod:`agate.compression`.
     """
-    from agate import csv
     from agate.table import Table
 
+    if chunk_rows is not None:
+        from agate.partitioned_table import PartitionedTable
+
+        if row_names is not None:
+            raise ValueError('row_names can not be specified together with chunk_rows.')
+
+        return PartitionedTable.from_csv(
+            path, column_names, column_types, skip_lines=skip_lines, header=header, sniff_limit=sniff_limit,
+            encoding=encoding, row_limit=row_limit, chunk_rows=chunk_rows, compression=compression, **kwargs
+        )
+
+    with open_csv(path, column_names, skip_lines, header, sniff_limit, encoding, row_limit, compression,
+                  **kwargs) as csv_data:
+        column_names, rows = csv_data
+
+        return Table(rows, column_names, column_types, row_names=row_names)
+
+
+@contextmanager
+def open_csv(path, column_names=None, skip_lines=0, header=True, sniff_limit=0, encoding='utf-8', row_limit=None,
+             compression='infer', **kwargs):
+    """
+    Open a CSV for reading the same way as :meth:`.Table.from_csv`, yielding
+    a tuple of the column names and an iterator of rows of raw values. The file
+    is closed on exit, if it was opened from a path.
+    """
+    from agate import csv
+    from agate.compression import open_input
+
     close = False
 
     try:
         if hasattr(path, 'read'):
             f = path
         else:
-            f = open(path, encoding=encoding)
+            f = open_input(path, encoding, compression)
 
             close = True
 
@@ -74,6 +111,10 @@ def from_csv(cls, path, column_names=None, column_types=None, row_names=None, sk
                 # input, up to 65536. This assumes that users don't sniff more than 64 KiB.
                 # https://docs.python.org/3/library/io.html#io.BufferedReader.peek
                 sample = f.buffer.peek(sniff_limit).decode(encoding, 'ignore')[:sniff_limit]  # reads *bytes*
+            elif not f.seekable():
+                # Compressed files can't seek, so complete the last line of the sample and read it again first.
+                sample = f.read(sniff_limit)
+                handle = itertools.chain(io.StringIO(sample + f.readline()), f)
             else:
                 offset = f.tell()
                 sample = f.read(sniff_limit)  # reads *characters*
@@ -101,7 +142,7 @@ def from_csv(cls, path, column_names=None, column_types=None, row_names=None, sk
         else:
             rows = itertools.islice(reader, row_limit)
 
-        return Table(rows, column_names, column_types, row_names=row_names)
+        yield column_names, rows
     finally:
         if close:
             f.close()
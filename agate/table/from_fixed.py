@@ -3,7 +3,7 @@ from agate import fixed, utils
 
 @classmethod
 def from_fixed(cls, path, schema_path, column_names=utils.default, column_types=None, row_names=None, encoding='utf-8',
-               schema_encoding='utf-8'):
+               schema_encoding='utf-8', compression='infer'):
     """
     Create a new table from a fixed-width file and a CSV schema.
 
@@ -29,7 +29,11 @@ def from_fixed(cls, path, schema_path, column_names=utils.default, column_types=
         Character encoding of the schema file. Note: if passing in a file
         handle it is assumed you have already opened it with the correct
         encoding specified.
+    :param compression:
+        The compression of the fixed-width file. See :meth:`.Table.from_csv`.
+        The schema file's compression is always inferred from its extension.
     """
+    from agate.compression import open_input
     from agate.table import Table
 
     close_f = False
@@ -38,13 +42,13 @@ def from_fixed(cls, path, schema_path, column_names=utils.default, column_types=
 
     try:
         if not hasattr(path, 'read'):
-            f = open(path, encoding=encoding)
+            f = open_input(path, encoding, compression)
             close_f = True
         else:
             f = path
 
         if not hasattr(schema_path, 'read'):
-            schema_f = open(schema_path, encoding=schema_encoding)
+            schema_f = open_input(schema_path, schema_encoding)
             close_schema_f = True
         else:
             schema_f = path
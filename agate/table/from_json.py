@@ -4,7 +4,8 @@ from decimal import Decimal
 
 
 @classmethod
-def from_json(cls, path, row_names=None, key=None, newline=False, column_types=None, encoding='utf-8', **kwargs):
+def from_json(cls, path, row_names=None, key=None, newline=False, column_types=None, encoding='utf-8',
+              compression='infer', **kwargs):
     """
     Create a new table from a JSON file.
 
@@ -32,7 +33,10 @@ def from_json(cls, path, row_names=None, key=None, newline=False, column_types=N
         UTF-8. You can override this by using any encoding supported by your Python's open() function
         if :code:`path` is a filepath. If passing in a file handle, it is assumed you have already opened it with the
         correct encoding specified.
+    :param compression:
+        See :meth:`.Table.from_csv`.
     """
+    from agate.compression import open_input
     from agate.table import Table
 
     if key is not None and newline:
@@ -48,7 +52,7 @@ def from_json(cls, path, row_names=None, key=None, newline=False, column_types=N
                 for line in path:
                     js.append(json.loads(line, object_pairs_hook=OrderedDict, parse_float=Decimal, **kwargs))
             else:
-                f = open(path, encoding=encoding)
+                f = open_input(path, encoding, compression)
                 close = True
 
                 for line in f:
@@ -57,7 +61,7 @@ def from_json(cls, path, row_names=None, key=None, newline=False, column_types=N
             if hasattr(path, 'read'):
                 js = json.load(path, object_pairs_hook=OrderedDict, parse_float=Decimal, **kwargs)
             else:
-                f = open(path, encoding=encoding)
+                f = open_input(path, encoding, compression)
                 close = True
 
                 js = json.load(f, object_pairs_hook=OrderedDict, parse_float=Decimal, **kwargs)
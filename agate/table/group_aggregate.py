@@ -0,0 +1,186 @@
+from collections import OrderedDict
+
+from agate.aggregations.base import _supports_incremental
+from agate.exceptions import UnsupportedAggregationError
+from agate.table.iter_groups import _make_group_keys
+
+
+def group_aggregate(self, key, aggregations, key_name=None, key_type=None):
+    """
+    Group this table and apply one or more :class:`.Aggregation` instances to
+    each group, in a single pass over the rows.
+
+    The result is the same as calling :meth:`.Table.group_by` (once for each
+    key) followed by :meth:`.TableSet.aggregate`, but no intermediate
+    :class:`.Table` or :class:`.TableSet` is created for aggregations that
+    support incremental execution (see :meth:`.Aggregation.init`). Any other
+    aggregations are run on a :class:`.Table` of each group's rows, as usual.
+
+    Note that :class:`.Variance`, :class:`.StDev` and their population
+    equivalents are computed incrementally using Welford's algorithm, so their
+    results may differ from :meth:`.Aggregation.run` in the least significant
+    digits.
+
+    :param key:
+        Either the name of a column from this table to group by, a
+        :class:`function` that takes a row and returns a value to group by, or
+        a sequence of such names and functions, which is equivalent to
+        grouping by each of them in turn.
+    :param aggregations:
+        A list of tuples in the format :code:`(new_column_name, aggregation)`,
+        where each :code:`aggregation` is an instance of :class:`.Aggregation`.
+    :param key_name:
+        See :meth:`.Table.group_by`. This argument is not valid when
+        :code:`key` is a sequence.
+    :param key_type:
+        See :meth:`.Table.group_by`. This argument is not valid when
+        :code:`key` is a sequence.
+    :returns:
+        A new :class:`.Table`.
+    """
+    from agate.table import Table
+
+    key_names, key_types, key_getters = _make_group_keys(self, key, key_name, key_type)
+
+    column_names = list(key_names)
+    column_types = list(key_types)
+
+    for new_column_name, aggregation in aggregations:
+        column_names.append(new_column_name)
+        column_types.append(aggregation.get_aggregate_data_type(self))
+
+    output = [list(group_key) + results for group_key, results in _aggregate_groups(self, key_getters, aggregations)]
+
+    if len(key_names) == 1:
+        row_names = key_names[0]
+    else:
+        def row_names(r):
+            return tuple(r[n] for n in key_names)
+
+    return Table(output, column_names, column_types, row_names=row_names)
+
+
+def _aggregate_groups(table, key_getters, aggregations):
+    """
+    Group the rows of a table with one or more key functions (as returned by
+    :code:`_make_group_keys`) and aggregate each group in a single pass.
+
+    :returns:
+        A list of :code:`(group_key, results)` tuples, where each
+        :code:`group_key` is a tuple of group names and :code:`results` is a
+        list of the results of the aggregations. Groups are in the same order
+        as chained calls to :meth:`.Table.group_by`.
+    """
+    # Aggregations that support the incremental protocol are updated row by
+    # row. The others are run on a forked table of each group's rows.
+    incremental, fallback = _prepare_incremental(table, [aggregation for name, aggregation in aggregations])
+
+    # Nested dictionaries preserve the order in which each group (and each
+    # subgroup within it) is first encountered, the same as chained group_by.
+    groups = OrderedDict()
+    last = len(key_getters) - 1
+
+    for row in table._rows:
+        level = groups
+
+        for depth, getter in enumerate(key_getters):
+            group_name = getter(row)
+
+            if depth == last:
+                break
+
+            if group_name not in level:
+                level[group_name] = OrderedDict()
+
+            level = level[group_name]
+
+        try:
+            states, rows = level[group_name]
+        except KeyError:
+            states = [aggregation.init(table) for i, aggregation, index in incremental]
+            rows = [] if fallback else None
+            level[group_name] = (states, rows)
+
+        _update_incremental(incremental, states, row)
+
+        if rows is not None:
+            rows.append(row)
+
+    output = []
+
+    for group_key, (states, rows) in _walk(groups, last):
+        results = [None] * len(aggregations)
+
+        for j, (i, aggregation, index) in enumerate(incremental):
+            results[i] = aggregation.finalize(states[j])
+
+        if fallback:
+            group_table = table._fork(rows)
+
+            for i, aggregation in fallback:
+                aggregation.validate(group_table)
+
+            for i, aggregation in fallback:
+                results[i] = aggregation.run(group_table)
+
+        output.append((group_key, results))
+
+    return output
+
+
+def _prepare_incremental(table, aggregations):
+    """
+    Split a sequence of aggregations into those that support the incremental
+    protocol, which are validated against :code:`table`, and the others.
+
+    :returns:
+        A tuple of two lists: :code:`(i, aggregation, index)` for each
+        aggregation that supports the protocol, where :code:`i` is its position
+        in :code:`aggregations` and :code:`index` is the index of its column,
+        or :code:`None` if it is applied to whole rows; and
+        :code:`(i, aggregation)` for the others.
+    """
+    incremental = []
+    fallback = []
+
+    for i, aggregation in enumerate(aggregations):
+        if _supports_incremental(aggregation):
+            try:
+                aggregation.init(table)
+            except UnsupportedAggregationError:
+                pass
+            else:
+                aggregation.validate(table)
+
+                column_name = aggregation.get_column_name()
+                index = None if column_name is None else table._columns[column_name].index
+
+                incremental.append((i, aggregation, index))
+                continue
+
+        fallback.append((i, aggregation))
+
+    return incremental, fallback
+
+
+def _update_incremental(incremental, states, row):
+    """
+    Update the states of aggregations returned by :func:`_prepare_incremental`
+    with a row.
+    """
+    values = row.values()
+
+    for j, (i, aggregation, index) in enumerate(incremental):
+        states[j] = aggregation.update(states[j], row if index is None else values[index])
+
+
+def _walk(groups, depth, prefix=()):
+    """
+    Yield :code:`(key, value)` pairs from nested group dictionaries, where
+    each key is a tuple of the group names at each level.
+    """
+    for group_name, value in groups.items():
+        if depth == 0:
+            yield prefix + (group_name,), value
+        else:
+            yield from _walk(value, depth - 1, prefix + (group_name,))
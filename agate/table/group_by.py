@@ -1,6 +1,6 @@
 from collections import OrderedDict
 
-from agate.data_types import Text
+from agate.table.iter_groups import _make_group_keys
 from agate.tableset import TableSet
 
 
@@ -11,53 +11,78 @@ def group_by(self, key, key_name=None, key_type=None):
     Note that group names will always be coerced to a string, regardless of the
     format of the input column.
 
+    If :code:`key` is a sequence, the result is the same as calling
+    :meth:`.Table.group_by` with each key in turn: a :class:`.TableSet` of
+    nested :class:`.TableSet` instances, with a :class:`.Table` for each
+    unique combination of keys at the deepest level. The rows are grouped by
+    every key in a single pass, and only the tables at the deepest level are
+    created.
+
     :param key:
-        Either the name of a column from the this table to group by, or a
-        :class:`function` that takes a row and returns a value to group by.
+        Either the name of a column from the this table to group by, a
+        :class:`function` that takes a row and returns a value to group by,
+        or a sequence of such names and functions.
     :param key_name:
         A name that describes the grouped properties. Defaults to the
         column name that was grouped on or "group" if grouping with a key
-        function. See :class:`.TableSet` for more.
+        function. See :class:`.TableSet` for more. This argument is not
+        valid when :code:`key` is a sequence.
     :param key_type:
         An instance of any subclass of :class:`.DataType`. If not provided
-        it will default to a :class`.Text`.
+        it will default to a :class`.Text`. This argument is not valid when
+        :code:`key` is a sequence.
     :returns:
         A :class:`.TableSet` mapping where the keys are unique values from
         the :code:`key` and the values are new :class:`.Table` instances
         containing the grouped rows.
     """
-    key_is_row_function = hasattr(key, '__call__')
+    key_names, key_types, key_getters = _make_group_keys(self, key, key_name, key_type)
 
-    if key_is_row_function:
-        key_name = key_name or 'group'
-        key_type = key_type or Text()
-    else:
-        column = self._columns[key]
+    # Nested dictionaries preserve the order in which each group (and each
+    # subgroup within it) is first encountered, the same as chained group_by.
+    groups = OrderedDict()
+    last = len(key_getters) - 1
 
-        key_name = key_name or column.name
-        key_type = key_type or column.data_type
+    if last == 0:
+        get_group_name = key_getters[0]
 
-    groups = OrderedDict()
+        for row in self._rows:
+            group_name = get_group_name(row)
 
-    for row in self._rows:
-        if key_is_row_function:
-            group_name = key(row)
-        else:
-            group_name = row[column.name]
+            try:
+                groups[group_name].append(row)
+            except KeyError:
+                groups[group_name] = [row]
+    else:
+        for row in self._rows:
+            level = groups
 
-        group_name = key_type.cast(group_name)
+            for depth, getter in enumerate(key_getters):
+                group_name = getter(row)
 
-        if group_name not in groups:
-            groups[group_name] = []
+                if depth == last:
+                    break
 
-        groups[group_name].append(row)
+                try:
+                    level = level[group_name]
+                except KeyError:
+                    subgroups = level[group_name] = OrderedDict()
+                    level = subgroups
+
+            try:
+                level[group_name].append(row)
+            except KeyError:
+                level[group_name] = [row]
 
     if not groups:
-        return TableSet([self._fork([])], [], key_name=key_name, key_type=key_type)
+        return TableSet([self._fork([])], [], key_name=key_names[0], key_type=key_types[0])
 
-    output = OrderedDict()
+    def build(level, depth):
+        if depth == last:
+            tables = [self._fork(rows) for rows in level.values()]
+        else:
+            tables = [build(subgroups, depth + 1) for subgroups in level.values()]
 
-    for group, rows in groups.items():
-        output[group] = self._fork(rows)
+        return TableSet(tables, level.keys(), key_name=key_names[depth], key_type=key_types[depth], _is_fork=True)
 
-    return TableSet(output.values(), output.keys(), key_name=key_name, key_type=key_type)
+    return build(groups, 0)
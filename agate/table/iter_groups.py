@@ -0,0 +1,121 @@
+from collections import OrderedDict
+from itertools import groupby
+
+from agate import utils
+from agate.data_types import Text
+
+
+def iter_groups(self, key, key_type=None, presorted=False):
+    """
+    Iterate over the groups of rows that have the same key, yielding a new
+    :class:`.Table` for each group as it is needed.
+
+    This is equivalent to iterating over the items of :meth:`.Table.group_by`,
+    but no :class:`.TableSet` is created, and the table for each group is
+    only created when it is reached.
+
+    If the rows are already sorted (or otherwise grouped) by the key, use
+    :code:`presorted=True`. Each run of consecutive rows with the same key is
+    then yielded as soon as it ends, so only one group's rows are collected
+    at a time. If a key appears in more than one run, each run is yielded
+    as a separate group.
+
+    :param key:
+        Either the name of a column from this table to group by, or a
+        :class:`function` that takes a row and returns a value to group by.
+    :param key_type:
+        See :meth:`.Table.group_by`.
+    :param presorted:
+        If :code:`True`, group consecutive rows with the same key instead of
+        collecting every row before yielding any groups.
+    :returns:
+        An iterator of :code:`(group_name, table)` tuples.
+    """
+    key_type, get_group_name = _make_group_key(self, key, key_type)
+
+    if presorted:
+        for group_name, rows in groupby(self._rows, key=get_group_name):
+            yield group_name, self._fork(list(rows))
+
+        return
+
+    groups = OrderedDict()
+
+    for row in self._rows:
+        group_name = get_group_name(row)
+
+        try:
+            groups[group_name].append(row)
+        except KeyError:
+            groups[group_name] = [row]
+
+    for group_name, rows in groups.items():
+        yield group_name, self._fork(rows)
+
+
+def _make_group_key(table, key, key_type=None):
+    """
+    Get the key type for grouping a table, and a function that takes a row
+    and returns its group name, cast to that type.
+
+    The values of a column already have the column's type, so they are only
+    cast if a different :code:`key_type` is specified.
+    """
+    if hasattr(key, '__call__'):
+        key_type = key_type or Text()
+        cast = key_type.cast
+
+        def get_group_name(row):
+            return cast(key(row))
+
+        return key_type, get_group_name
+
+    column = table._columns[key]
+    index = column.index
+
+    if key_type is None or key_type is column.data_type:
+        key_type = column.data_type
+
+        def get_group_name(row):
+            return row.values()[index]
+    else:
+        cast = key_type.cast
+
+        def get_group_name(row):
+            return cast(row.values()[index])
+
+    return key_type, get_group_name
+
+
+def _make_group_keys(table, key, key_name=None, key_type=None):
+    """
+    Get the key names, key types and group name functions (see
+    :func:`_make_group_key`) for grouping a table by a key, or by each of a
+    sequence of keys in turn.
+
+    :returns:
+        A :code:`(key_names, key_types, key_getters)` tuple of lists.
+    """
+    if not utils.issequence(key):
+        key = [key]
+    elif not key:
+        raise ValueError('At least one key must be specified.')
+    elif key_name or key_type:
+        raise ValueError('key_name and key_type are not valid arguments when key is a sequence.')
+
+    key_names = []
+    key_types = []
+    key_getters = []
+
+    for k in key:
+        if hasattr(k, '__call__'):
+            key_names.append(key_name or 'group')
+        else:
+            key_names.append(key_name or table._columns[k].name)
+
+        k_type, getter = _make_group_key(table, k, key_type)
+
+        key_types.append(k_type)
+        key_getters.append(getter)
+
+    return key_names, key_types, key_getters
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+
+from agate.columns import sizeof
+
+
+def memory_usage(self, deep=True):
+    """
+    Get the number of bytes used by this table, as a dictionary with these
+    keys:
+
+    * :code:`rows`: the :class:`.Row` objects, and the sequence of them.
+    * :code:`values`: the tuples of values in each row.
+    * :code:`row_names`: the row names, if any.
+    * :code:`columns`: a dictionary of column names and the number of bytes
+      used by each column's values and cache. See :meth:`.Column.memory_usage`.
+    * :code:`total`: the sum of all of the above.
+
+    Each object is counted once, even if it is shared, for example when the
+    same value is used by more than one row, or when row names are values of
+    a column. Rows are shared by tables created from this one, such as by
+    :meth:`.Table.where` and :meth:`.Table.order_by`, so the memory used by
+    several tables is less than the sum of their totals.
+
+    Sizes are reported by :func:`sys.getsizeof`, so they exclude memory used
+    by the interpreter to manage objects.
+
+    :param deep:
+        If :code:`True`, count the values themselves, such as each
+        :class:`decimal.Decimal` and :class:`str`. Otherwise, only count the
+        containers of the values.
+    :returns:
+        A :class:`collections.OrderedDict`.
+    """
+    return _memory_usage(self, deep, set())
+
+
+def _memory_usage(table, deep, seen):
+    """
+    Count the bytes used by a table, skipping objects that have already been
+    counted. See :func:`.sizeof`.
+    """
+    rows = table._rows
+
+    usage = OrderedDict()
+    usage['rows'] = sizeof([rows, rows._values], seen) + sizeof(rows, seen)
+    usage['values'] = sizeof((row._values for row in rows), seen)
+    usage['row_names'] = 0
+    usage['columns'] = OrderedDict(
+        (column.name, column._memory_usage(deep, seen)) for column in table._columns
+    )
+
+    if table._row_names is not None:
+        usage['row_names'] = sizeof([table._row_names], seen)
+
+        if deep:
+            usage['row_names'] += sizeof(table._row_names, seen)
+
+    usage['total'] = usage['rows'] + usage['values'] + usage['row_names'] + sum(usage['columns'].values())
+
+    return usage
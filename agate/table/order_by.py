@@ -1,28 +1,18 @@
 from agate import utils
 
 
-def order_by(self, key, reverse=False):
+def make_sort_key(key):
     """
-    Create a new table that is sorted.
+    Create a function that takes a :class:`.Row` and returns the value to sort
+    it by, ordering nulls the same way as :meth:`.Table.order_by`.
 
     :param key:
-        Either the name of a single column to sort by, a sequence of such
-        names, or a :class:`function` that takes a row and returns a value
-        to sort by.
-    :param reverse:
-        If `True` then sort in reverse (typically, descending) order.
-    :returns:
-        A new :class:`.Table`.
+        See :meth:`.Table.order_by`.
     """
-    if len(self._rows) == 0:
-        return self._fork(self._rows)
-
     key_is_row_function = hasattr(key, '__call__')
     key_is_sequence = utils.issequence(key)
 
-    def sort_key(data):
-        row = data[1]
-
+    def sort_key(row):
         if key_is_row_function:
             k = key(row)
         elif key_is_sequence:
@@ -35,9 +25,42 @@ def order_by(self, key, reverse=False):
 
         return k
 
-    results = sorted(enumerate(self._rows), key=sort_key, reverse=reverse)
+    return sort_key
+
+
+def order_by(self, key, reverse=False):
+    """
+    Create a new table that is sorted.
+
+    :param key:
+        Either the name of a single column to sort by, a sequence of such
+        names, or a :class:`function` that takes a row and returns a value
+        to sort by.
+    :param reverse:
+        If `True` then sort in reverse (typically, descending) order.
+    :returns:
+        A new :class:`.Table`.
+    """
+    if len(self._rows) == 0:
+        return self._fork(self._rows)
+
+    if hasattr(key, '__call__') or utils.issequence(key):
+        sort_key = make_sort_key(key)
+
+        results = sorted(enumerate(self._rows), key=lambda data: sort_key(data[1]), reverse=reverse)
+
+        indices, rows = zip(*results)
+    else:
+        # Sorting by a single column uses the column's sort order, which
+        # compares the values directly rather than through a key function.
+        column = self._columns[key]
+
+        if reverse:
+            indices = utils.argsort(column.values(), reverse=True)
+        else:
+            indices = column.sort_order()
 
-    indices, rows = zip(*results)
+        rows = [self._rows[i] for i in indices]
 
     if self._row_names is not None:
         row_names = [self._row_names[i] for i in indices]
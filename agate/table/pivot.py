@@ -1,5 +1,11 @@
+from collections import OrderedDict
+from decimal import Decimal
+
 from agate import utils
 from agate.aggregations import Count
+from agate.data_types import Number
+from agate.table.group_aggregate import _aggregate_groups
+from agate.table.iter_groups import _make_group_key
 
 
 def pivot(self, key=None, pivot=None, aggregation=None, computation=None, default_value=utils.default, key_name=None):
@@ -39,6 +45,11 @@ def pivot(self, key=None, pivot=None, aggregation=None, computation=None, defaul
     If one or more keys are specified then the resulting table will
     automatically have :code:`row_names` set to those keys.
 
+    Every cell is aggregated in a single pass over the rows, in the same way
+    as :meth:`.Table.group_aggregate`, and the column types of the new table
+    are the types of the aggregation (or computation), so no type inference
+    is needed.
+
     See also the related method :meth:`.Table.denormalize`.
 
     :param key:
@@ -56,6 +67,12 @@ def pivot(self, key=None, pivot=None, aggregation=None, computation=None, defaul
         of the grouped data.)
 
         If not specified this defaults to :class:`.Count` with no arguments.
+
+        This may also be a sequence of tuples in the format
+        :code:`(name, aggregation)`, in which case there will be a column for
+        each aggregation of each pivot value, named
+        :code:`"<pivot value>_<name>"`, or a column for each aggregation
+        named :code:`name` if :code:`pivot` is :code:`None`.
     :param computation:
         An optional :class:`.Computation` instance to be applied to the
         aggregated sequence of values before they are transposed into the
@@ -75,6 +92,8 @@ def pivot(self, key=None, pivot=None, aggregation=None, computation=None, defaul
     :returns:
         A new :class:`.Table`.
     """
+    from agate.table import Table
+
     if key is None:
         key = []
     elif not utils.issequence(key):
@@ -85,48 +104,121 @@ def pivot(self, key=None, pivot=None, aggregation=None, computation=None, defaul
     if aggregation is None:
         aggregation = Count()
 
-    groups = self
+    if utils.issequence(aggregation):
+        aggregations = list(aggregation)
 
-    for k in key:
-        groups = groups.group_by(k, key_name=key_name)
+        if not aggregations:
+            raise ValueError('At least one aggregation must be specified.')
+        elif computation is not None:
+            raise ValueError('A computation can only be applied to a single aggregation.')
+    else:
+        aggregations = [(str(aggregation), aggregation)]
+
+    key_names = []
+    key_types = []
+    key_getters = []
 
-    aggregation_name = str(aggregation)
-    computation_name = str(computation) if computation else None
+    for k in key:
+        if hasattr(k, '__call__'):
+            key_names.append(key_name or 'group')
+        else:
+            key_names.append(key_name or self._columns[k].name)
 
-    def apply_computation(table):
-        computed = table.compute([
-            (computation_name, computation)
-        ])
+        k_type, getter = _make_group_key(self, k)
 
-        excluded = computed.exclude([aggregation_name])
+        key_types.append(k_type)
+        key_getters.append(getter)
 
-        return excluded
+    group_names = list(key_names)
+    group_types = list(key_types)
 
     if pivot is not None:
-        groups = groups.group_by(pivot)
+        pivot_type, pivot_getter = _make_group_key(self, pivot)
 
-        column_type = aggregation.get_aggregate_data_type(self)
+        group_names.append(self._columns[pivot].name)
+        group_types.append(pivot_type)
+        key_getters.append(pivot_getter)
 
-        table = groups.aggregate([
-            (aggregation_name, aggregation)
-        ])
+    # Aggregate every cell in a single pass over the rows
+    if key_getters:
+        groups = _aggregate_groups(self, key_getters, aggregations)
+    else:
+        groups = [((), list(self.aggregate(aggregations).values()))]
+
+    value_names = [name for name, a in aggregations]
+    value_types = [a.get_aggregate_data_type(self) for name, a in aggregations]
+
+    # The computation is applied to a table with a row for each cell
+    if computation is not None:
+        cells = Table(
+            [list(group_key) + results for group_key, results in groups],
+            group_names + value_names,
+            group_types + value_types
+        )
+
+        computation_name = str(computation)
+        computed = cells.compute([(computation_name, computation)])
+
+        groups = [
+            (group_key, [value])
+            for (group_key, results), value in zip(groups, computed.columns[computation_name].values())
+        ]
+        value_names = [computation_name]
+        value_types = [computation.get_computed_data_type(cells)]
+
+    if len(key_names) == 1:
+        row_names = key_names[0]
+    else:
+        def row_names(r):
+            return tuple(r[n] for n in key_names)
+
+    if pivot is None:
+        return Table(
+            [list(group_key) + results for group_key, results in groups],
+            key_names + value_names,
+            key_types + value_types,
+            row_names=row_names
+        )
+
+    # Organize the cells into a row for each key and a column (or a column
+    # for each aggregation) for each pivot value
+    width = len(key_names)
+    rows = OrderedDict()
+    fields = OrderedDict()
+
+    for group_key, results in groups:
+        field = str(group_key[width])
+        fields[field] = True
+
+        try:
+            rows[group_key[:width]][field] = results
+        except KeyError:
+            rows[group_key[:width]] = {field: results}
+
+    if default_value == utils.default:
+        defaults = [Decimal(0) if isinstance(t, Number) else None for t in value_types]
+    else:
+        defaults = [default_value] * len(value_types)
 
-        pivot_count = len(set(table.columns[pivot].values()))
+    column_names = list(key_names)
+    column_types = list(key_types)
 
-        if computation is not None:
-            column_types = computation.get_computed_data_type(table)
-            table = apply_computation(table)
+    for field in fields:
+        if len(value_names) == 1:
+            column_names.append(field)
+        else:
+            column_names.extend('%s_%s' % (field, name) for name in value_names)
 
-        column_types = [column_type] * pivot_count
+        column_types.extend(value_types)
 
-        table = table.denormalize(key, pivot, computation_name or aggregation_name, default_value=default_value,
-                                  column_types=column_types)
-    else:
-        table = groups.aggregate([
-            (aggregation_name, aggregation)
-        ])
+    new_rows = []
+
+    for row_key, cells in rows.items():
+        row = list(row_key)
+
+        for field in fields:
+            row.extend(cells.get(field, defaults))
 
-        if computation:
-            table = apply_computation(table)
+        new_rows.append(row)
 
-    return table
+    return Table(new_rows, column_names, column_types, row_names=row_names)
@@ -1,7 +1,7 @@
 import os
 
 
-def to_csv(self, path, **kwargs):
+def to_csv(self, path, compression='infer', **kwargs):
     """
     Write this table to a CSV. This method uses agate's builtin CSV writer,
     which supports unicode on both Python 2 and Python 3.
@@ -12,8 +12,13 @@ def to_csv(self, path, **kwargs):
 
     :param path:
         Filepath or file-like object to write to.
+    :param compression:
+        The compression of the file: :code:`'gzip'`, :code:`'bz2'`,
+        :code:`'lzma'` or :code:`None`. By default, it is inferred from the
+        extension of :code:`path`. See :mod:`agate.compression`.
     """
     from agate import csv
+    from agate.compression import open_output
 
     if 'lineterminator' not in kwargs:
         kwargs['lineterminator'] = '\n'
@@ -31,7 +36,7 @@ def to_csv(self, path, **kwargs):
             if dirpath and not os.path.exists(dirpath):
                 os.makedirs(dirpath)
 
-            f = open(path, 'w')
+            f = open_output(path, compression=compression)
 
         writer = csv.writer(f, **kwargs)
         writer.writerow(self._column_names)
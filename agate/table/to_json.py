@@ -4,7 +4,7 @@ from collections import OrderedDict
 from decimal import Decimal
 
 
-def to_json(self, path, key=None, newline=False, indent=None, **kwargs):
+def to_json(self, path, key=None, newline=False, indent=None, compression='infer', **kwargs):
     """
     Write this table to a JSON file or file-like object.
 
@@ -22,13 +22,40 @@ def to_json(self, path, key=None, newline=False, indent=None, **kwargs):
     :param indent:
         If specified, the number of spaces to indent the JSON for
         formatting.
+    :param compression:
+        See :meth:`.Table.to_csv`.
     """
+    from agate.compression import open_output
+
     if key is not None and newline:
         raise ValueError('key and newline may not be specified together.')
 
     if newline and indent is not None:
         raise ValueError('newline and indent may not be specified together.')
 
+    close = True
+    f = None
+
+    try:
+        if hasattr(path, 'write'):
+            f = path
+            close = False
+        else:
+            if os.path.dirname(path) and not os.path.exists(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            f = open_output(path, compression=compression)
+
+        _write_json(f, self._rows, self._column_types, key, newline, indent, **kwargs)
+    finally:
+        if close and f is not None:
+            f.close()
+
+
+def _write_json(f, rows, column_types, key=None, newline=False, indent=None, **kwargs):
+    """
+    Write rows to a file-like object as JSON, one row at a time, so that the
+    rows may be any iterable. See :meth:`.Table.to_json` for the arguments.
+    """
     key_is_row_function = hasattr(key, '__call__')
 
     json_kwargs = {
@@ -39,58 +66,85 @@ def to_json(self, path, key=None, newline=False, indent=None, **kwargs):
     # Pass remaining kwargs through to JSON encoder
     json_kwargs.update(kwargs)
 
-    json_funcs = [c.jsonify for c in self._column_types]
+    json_funcs = [c.jsonify for c in column_types]
 
-    close = True
-    f = None
+    def dump_row(row):
+        values = tuple(json_funcs[i](d) for i, d in enumerate(row))
 
-    try:
-        if hasattr(path, 'write'):
-            f = path
-            close = False
-        else:
-            if os.path.dirname(path) and not os.path.exists(os.path.dirname(path)):
-                os.makedirs(os.path.dirname(path))
-            f = open(path, 'w')
-
-        def dump_json(data):
-            json.dump(data, f, **json_kwargs)
-
-            if newline:
-                f.write('\n')
-
-        # Keyed
-        if key is not None:
-            output = OrderedDict()
-
-            for row in self._rows:
-                if key_is_row_function:
-                    k = key(row)
-                elif isinstance(row[key], Decimal):
-                    k = str(row[key].normalize())
-                else:
-                    k = str(row[key])
-
-                if k in output:
-                    raise ValueError('Value %s is not unique in the key column.' % str(k))
-
-                values = tuple(json_funcs[i](d) for i, d in enumerate(row))
-                output[k] = OrderedDict(zip(row.keys(), values))
-            dump_json(output)
-        # Newline-delimited
-        elif newline:
-            for row in self._rows:
-                values = tuple(json_funcs[i](d) for i, d in enumerate(row))
-                dump_json(OrderedDict(zip(row.keys(), values)))
-        # Normal
+        return json.dumps(OrderedDict(zip(row.keys(), values)), **json_kwargs)
+
+    # Newline-delimited
+    if newline:
+        for row in rows:
+            f.write(dump_row(row))
+            f.write('\n')
+
+        return
+
+    # The separators and indentation that json.dump would use for a list or
+    # object containing the rows
+    if indent is None:
+        item_separator = json_kwargs.get('separators', (', ', ': '))[0]
+        line_indent = ''
+    else:
+        item_separator = json_kwargs.get('separators', (',', ': '))[0]
+        line_indent = '\n' + (indent if isinstance(indent, str) else ' ' * indent)
+
+    key_separator = json_kwargs.get('separators', (None, ': '))[1]
+
+    # Normal
+    if key is None:
+        items = (dump_row(row) for row in rows)
+    # Keyed
+    else:
+        items = _keyed_items(rows, key, key_is_row_function, dump_row, key_separator, json_kwargs)
+
+    f.write('[' if key is None else '{')
+
+    first = True
+
+    for item in items:
+        if not first:
+            f.write(item_separator)
+
+        f.write(line_indent + item.replace('\n', line_indent))
+        first = False
+
+    if not first and indent is not None:
+        f.write('\n')
+
+    f.write(']' if key is None else '}')
+
+
+def _keyed_items(rows, key, key_is_row_function, dump_row, key_separator, json_kwargs):
+    """
+    Yield the members of the object written by :func:`_write_json` when a
+    key is specified.
+    """
+    keys = set()
+    items = []
+
+    for row in rows:
+        if key_is_row_function:
+            k = key(row)
+        elif isinstance(row[key], Decimal):
+            k = str(row[key].normalize())
         else:
-            output = []
+            k = str(row[key])
 
-            for row in self._rows:
-                values = tuple(json_funcs[i](d) for i, d in enumerate(row))
-                output.append(OrderedDict(zip(row.keys(), values)))
+        if k in keys:
+            raise ValueError('Value %s is not unique in the key column.' % str(k))
 
-            dump_json(output)
-    finally:
-        if close and f is not None:
-            f.close()
+        keys.add(k)
+
+        # Keys that are not strings are converted as json.dump converts them
+        name = json.dumps(k if isinstance(k, str) else json.dumps(k), **json_kwargs)
+        item = name + key_separator + dump_row(row)
+
+        if json_kwargs.get('sort_keys'):
+            items.append((k, item))
+        else:
+            yield item
+
+    for k, item in sorted(items):
+        yield item
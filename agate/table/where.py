@@ -1,12 +1,16 @@
+from agate.computations.expression import Expression
+
+
 def where(self, test):
     """
     Create a new :class:`.Table` with only those rows that pass a test.
 
     :param test:
         A function that takes a :class:`.Row` and returns :code:`True` if
-        it should be included in the new :class:`.Table`.
+        it should be included in the new :class:`.Table`, or an
+        :class:`.Expression`, which is evaluated for the whole table at once.
     :type test:
-        :class:`function`
+        :class:`function` or :class:`.Expression`
     :returns:
         A new :class:`.Table`.
     """
@@ -17,8 +21,14 @@ def where(self, test):
     else:
         row_names = None
 
-    for i, row in enumerate(self._rows):
-        if test(row):
+    if isinstance(test, Expression):
+        test.validate(self)
+        results = test.evaluate(self)
+    else:
+        results = (test(row) for row in self._rows)
+
+    for i, (row, result) in enumerate(zip(self._rows, results)):
+        if result:
             rows.append(row)
 
             if row_names is not None:
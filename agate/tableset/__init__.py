@@ -22,9 +22,11 @@ and end up with data grouped across multiple dimensions.
 dimensions.
 """
 
+from functools import partial
 from io import StringIO
 from itertools import zip_longest
 
+from agate import utils
 from agate.data_types import Text
 from agate.mapped_sequence import MappedSequence
 
@@ -62,6 +64,7 @@ class TableSet(MappedSequence):
 
         self._key_name = key_name
         self._key_type = key_type or Text()
+        self._executor = None
         self._sample_table = tables[0]
 
         while isinstance(self._sample_table, TableSet):
@@ -80,6 +83,13 @@ class TableSet(MappedSequence):
 
         MappedSequence.__init__(self, tables, keys)
 
+    def __reduce__(self):
+        """
+        Pickle this table set with its key name and key type. Its executor, if
+        any, is not pickled.
+        """
+        return (TableSet, (self._values, self._keys, self._key_name, self._key_type, True))
+
     def __str__(self):
         """
         Print the tableset's structure via :meth:`TableSet.print_structure`.
@@ -139,16 +149,17 @@ class TableSet(MappedSequence):
         if key_type is None:
             key_type = self._key_type
 
-        return TableSet(tables, keys, key_name, key_type, _is_fork=True)
+        tableset = TableSet(tables, keys, key_name, key_type, _is_fork=True)
+        tableset._executor = self._executor
+
+        return tableset
 
     def _proxy(self, method_name, *args, **kwargs):
         """
-        Calls a method on each table in this :class:`.TableSet`.
+        Calls a method on each table in this :class:`.TableSet`, using its
+        executor if it has one. (See :meth:`.TableSet.with_executor`.)
         """
-        tables = []
-
-        for key, table in self.items():
-            tables.append(getattr(table, method_name)(*args, **kwargs))
+        tables = _map(_get_executor(self), partial(_call_method, method_name, args, kwargs), self._values)
 
         return self._fork(
             tables,
@@ -156,45 +167,37 @@ class TableSet(MappedSequence):
         )
 
 
-from agate.tableset.aggregate import aggregate
-from agate.tableset.bar_chart import bar_chart
-from agate.tableset.column_chart import column_chart
-from agate.tableset.from_csv import from_csv
-from agate.tableset.from_json import from_json
-from agate.tableset.having import having
-from agate.tableset.line_chart import line_chart
-from agate.tableset.merge import merge
-from agate.tableset.print_structure import print_structure
-from agate.tableset.proxy_methods import (bins, compute, denormalize, distinct, exclude, find, group_by, homogenize,
-                                          join, limit, normalize, order_by, pivot, select, where)
-from agate.tableset.scatterplot import scatterplot
-from agate.tableset.to_csv import to_csv
-from agate.tableset.to_json import to_json
-
-TableSet.aggregate = aggregate
-TableSet.bar_chart = bar_chart
-TableSet.bins = bins
-TableSet.column_chart = column_chart
-TableSet.compute = compute
-TableSet.denormalize = denormalize
-TableSet.distinct = distinct
-TableSet.exclude = exclude
-TableSet.find = find
-TableSet.from_csv = from_csv
-TableSet.from_json = from_json
-TableSet.group_by = group_by
-TableSet.having = having
-TableSet.homogenize = homogenize
-TableSet.join = join
-TableSet.limit = limit
-TableSet.line_chart = line_chart
-TableSet.merge = merge
-TableSet.normalize = normalize
-TableSet.order_by = order_by
-TableSet.pivot = pivot
-TableSet.print_structure = print_structure
-TableSet.scatterplot = scatterplot
-TableSet.select = select
-TableSet.to_csv = to_csv
-TableSet.to_json = to_json
-TableSet.where = where
+from agate.tableset.with_executor import _call_method, _get_executor, _map
+
+# Methods are imported from their modules the first time they are used
+__getattr__ = utils.attach_lazy_methods(TableSet, {
+    'aggregate': 'agate.tableset.aggregate',
+    'bar_chart': 'agate.tableset.bar_chart',
+    'bins': 'agate.tableset.proxy_methods',
+    'column_chart': 'agate.tableset.column_chart',
+    'compute': 'agate.tableset.proxy_methods',
+    'denormalize': 'agate.tableset.proxy_methods',
+    'distinct': 'agate.tableset.proxy_methods',
+    'exclude': 'agate.tableset.proxy_methods',
+    'find': 'agate.tableset.proxy_methods',
+    'from_csv': 'agate.tableset.from_csv',
+    'from_json': 'agate.tableset.from_json',
+    'group_by': 'agate.tableset.proxy_methods',
+    'having': 'agate.tableset.having',
+    'homogenize': 'agate.tableset.proxy_methods',
+    'join': 'agate.tableset.proxy_methods',
+    'limit': 'agate.tableset.proxy_methods',
+    'line_chart': 'agate.tableset.line_chart',
+    'memory_usage': 'agate.tableset.memory_usage',
+    'merge': 'agate.tableset.merge',
+    'normalize': 'agate.tableset.proxy_methods',
+    'order_by': 'agate.tableset.proxy_methods',
+    'pivot': 'agate.tableset.proxy_methods',
+    'print_structure': 'agate.tableset.print_structure',
+    'scatterplot': 'agate.tableset.scatterplot',
+    'select': 'agate.tableset.proxy_methods',
+    'to_csv': 'agate.tableset.to_csv',
+    'to_json': 'agate.tableset.to_json',
+    'where': 'agate.tableset.proxy_methods',
+    'with_executor': 'agate.tableset.with_executor',
+})
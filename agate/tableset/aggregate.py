@@ -1,49 +1,69 @@
+from functools import partial
+
 from agate.table import Table
+from agate.tableset.with_executor import _get_executor, _map
 
 
-def _aggregate(self, aggregations=[]):
+def _run_aggregations(aggregations, table):
     """
-    Recursive aggregation allowing for TableSet's to be nested inside
-    one another.
+    Validate and run a sequence of aggregations on a single table.
+    """
+    for new_column_name, aggregation in aggregations:
+        aggregation.validate(table)
+
+    return [aggregation.run(table) for new_column_name, aggregation in aggregations]
+
+
+def _leaves(tableset, prefix=()):
+    """
+    Yield a :code:`(keys, table)` tuple for each table in a TableSet and any
+    TableSets nested inside it, where :code:`keys` is a tuple of the keys at
+    each level.
     """
     from agate.tableset import TableSet
 
-    output = []
+    for key, value in zip(tableset._keys, tableset._values):
+        if isinstance(value, TableSet):
+            yield from _leaves(value, prefix + (key,))
+        else:
+            yield prefix + (key,), value
+
 
-    # Process nested TableSet's
-    if isinstance(self._values[0], TableSet):
-        for key, nested_tableset in self.items():
-            column_names, column_types, nested_output, row_name_columns = _aggregate(nested_tableset, aggregations)
+def _aggregate(self, aggregations=[], executor=None):
+    """
+    Aggregation allowing for TableSet's to be nested inside one another. The
+    aggregations for every table, at any depth, are run in a single batch.
+    """
+    from agate.tableset import TableSet
 
-            for row in nested_output:
-                row.insert(0, key)
+    column_names = []
+    column_types = []
+    tableset = self
 
-                output.append(row)
+    while True:
+        column_names.append(tableset._key_name)
+        column_types.append(tableset._key_type)
 
-        column_names.insert(0, self._key_name)
-        column_types.insert(0, self._key_type)
-        row_name_columns.insert(0, self._key_name)
-    # Regular Tables
-    else:
-        column_names = [self._key_name]
-        column_types = [self._key_type]
-        row_name_columns = [self._key_name]
+        if not isinstance(tableset._values[0], TableSet):
+            break
 
-        for new_column_name, aggregation in aggregations:
-            column_names.append(new_column_name)
-            column_types.append(aggregation.get_aggregate_data_type(self._sample_table))
+        tableset = tableset._values[0]
+
+    row_name_columns = list(column_names)
 
-        for name, table in self.items():
-            for new_column_name, aggregation in aggregations:
-                aggregation.validate(table)
+    for new_column_name, aggregation in aggregations:
+        column_names.append(new_column_name)
+        column_types.append(aggregation.get_aggregate_data_type(self._sample_table))
 
-        for name, table in self.items():
-            new_row = [name]
+    leaves = list(_leaves(self))
 
-            for new_column_name, aggregation in aggregations:
-                new_row.append(aggregation.run(table))
+    # An empty TableSet (created by grouping an empty table) has no keys
+    if not leaves:
+        for new_column_name, aggregation in aggregations:
+            aggregation.validate(self._sample_table)
 
-            output.append(new_row)
+    results = _map(executor, partial(_run_aggregations, aggregations), [table for keys, table in leaves])
+    output = [list(keys) + new_row for (keys, table), new_row in zip(leaves, results)]
 
     return column_names, column_types, output, row_name_columns
 
@@ -67,7 +87,7 @@ def aggregate(self, aggregations):
     :returns:
         A new :class:`.Table`.
     """
-    column_names, column_types, output, row_name_columns = _aggregate(self, aggregations)
+    column_names, column_types, output, row_name_columns = _aggregate(self, aggregations, _get_executor(self))
 
     if len(row_name_columns) == 1:
         row_names = row_name_columns[0]
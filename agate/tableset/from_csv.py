@@ -1,12 +1,18 @@
 import os
 from collections import OrderedDict
+from functools import partial
 from glob import glob
 
+from agate import utils
+from agate.compression import COMPRESSION_EXTENSIONS, strip_extension
 from agate.table import Table
+from agate.tableset.with_executor import _map
+from agate.type_tester import TypeTester
 
 
 @classmethod
-def from_csv(cls, dir_path, column_names=None, column_types=None, row_names=None, header=True, **kwargs):
+def from_csv(cls, dir_path, column_names=None, column_types=None, row_names=None, header=True, workers=None,
+             shared_types=False, sample_rows=1000, **kwargs):
     """
     Create a new :class:`TableSet` from a directory of CSVs.
 
@@ -14,7 +20,9 @@ def from_csv(cls, dir_path, column_names=None, column_types=None, row_names=None
 
     :param dir_path:
         Path to a directory full of CSV files. All CSV files in this
-        directory will be loaded.
+        directory will be loaded, including those compressed with gzip, bz2
+        or lzma, if their names end with :code:`.csv` followed by the
+        extension of the compression, such as :code:`.csv.gz`.
     :param column_names:
         See :meth:`Table.__init__`.
     :param column_types:
@@ -23,17 +31,131 @@ def from_csv(cls, dir_path, column_names=None, column_types=None, row_names=None
         See :meth:`Table.__init__`.
     :param header:
         See :meth:`Table.from_csv`.
+    :param workers:
+        If specified, load the files in a
+        :class:`concurrent.futures.ProcessPoolExecutor` with this many worker
+        processes. The arguments must be picklable, so :code:`row_names` and
+        :code:`column_types` can not be lambda functions.
+    :param shared_types:
+        If :code:`True` and :code:`column_types` is :code:`None` or a
+        :class:`.TypeTester`, infer the column types once, from the first
+        rows of every file, and use them for every table, instead of inferring
+        them for each table. A file whose types differ from those of the others
+        then can't cause a :code:`ValueError` after every file is loaded,
+        though a :class:`.CastError` is raised if a row after the sample can't
+        be cast.
+    :param sample_rows:
+        The number of rows read from each file to infer the types when
+        :code:`shared_types` is :code:`True`, unless the :class:`.TypeTester`
+        has a :code:`limit`, in which case that is used instead. If
+        :code:`None`, every row is read, at the cost of reading every file
+        twice. If the limit of the :class:`.TypeTester` is :code:`0`, no types
+        are inferred and no rows are sampled.
     """
     from agate.tableset import TableSet
 
     if not os.path.isdir(dir_path):
         raise OSError('Specified path doesn\'t exist or isn\'t a directory.')
 
-    tables = OrderedDict()
+    paths = glob(os.path.join(dir_path, '*.csv'))
 
-    for path in glob(os.path.join(dir_path, '*.csv')):
-        name = os.path.split(path)[1].strip('.csv')
+    for ext in COMPRESSION_EXTENSIONS:
+        paths.extend(glob(os.path.join(dir_path, '*.csv' + ext)))
 
-        tables[name] = Table.from_csv(path, column_names, column_types, row_names=row_names, header=header, **kwargs)
+    names = OrderedDict()
 
-    return TableSet(tables.values(), tables.keys())
+    for path in paths:
+        name = os.path.splitext(os.path.basename(strip_extension(path)))[0]
+
+        if name in names:
+            raise ValueError('%s and %s would both be loaded as the table "%s".' % (names[name], path, name))
+
+        names[name] = path
+
+    executor = None
+
+    if workers is not None and paths:
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        if shared_types and (column_types is None or isinstance(column_types, TypeTester)):
+            column_types = _infer_types(executor, paths, column_names, column_types, header, sample_rows, kwargs)
+
+        tables = _map(executor, partial(
+            _load_csv, column_names=column_names, column_types=column_types, row_names=row_names, header=header,
+            kwargs=kwargs
+        ), paths)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return TableSet(tables, list(names))
+
+
+def _load_csv(path, column_names, column_types, row_names, header, kwargs):
+    """
+    Load a single CSV. This is a module-level function so that it can be sent
+    to worker processes.
+    """
+    return Table.from_csv(path, column_names, column_types, row_names=row_names, header=header, **kwargs)
+
+
+def _sample_csv(path, column_names, header, limit, kwargs):
+    """
+    Read the column names and up to :code:`limit` rows of raw values from a
+    single CSV.
+    """
+    from agate.table.from_csv import open_csv
+
+    kwargs = dict(kwargs)
+    kwargs.pop('chunk_rows', None)
+    row_limit = kwargs.pop('row_limit', None)
+
+    if limit is None or (row_limit is not None and row_limit < limit):
+        limit = row_limit
+
+    with open_csv(path, column_names, header=header, row_limit=limit, **kwargs) as csv_data:
+        column_names, rows = csv_data
+
+        return column_names, list(rows)
+
+
+def _infer_types(executor, paths, column_names, tester, header, sample_rows, kwargs):
+    """
+    Infer a single sequence of column types from samples of rows of every
+    CSV.
+    """
+    if tester is None:
+        tester = TypeTester()
+
+    limit = tester.limit
+
+    if limit == 0:
+        # Every column is Text, whatever the rows, so there is nothing to infer
+        return tester
+    elif limit is None:
+        limit = sample_rows
+    else:
+        # The limit applies to each file, not to the combined sample
+        tester = TypeTester(force=tester.force, limit=None, types=tester.types)
+
+    samples = _map(executor, partial(
+        _sample_csv, column_names=column_names, header=header, limit=limit, kwargs=kwargs
+    ), paths)
+    sample_names = None
+    rows = []
+
+    for path, (names, sample) in zip(paths, samples):
+        if sample_names is None:
+            sample_names = names
+        elif names != sample_names:
+            raise ValueError('Not all tables have the same column names! (%s)' % path)
+
+        rows.extend(sample)
+
+    if sample_names is None:
+        sample_names = [utils.letter_name(i) for i in range(len(rows[0]))] if rows else []
+
+    return tester.run(rows, list(sample_names))
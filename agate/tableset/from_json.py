@@ -4,6 +4,7 @@ from collections import OrderedDict
 from decimal import Decimal
 from glob import glob
 
+from agate.compression import open_input
 from agate.table import Table
 
 
@@ -50,7 +51,7 @@ def from_json(cls, path, column_names=None, column_types=None, keys=None, **kwar
         if hasattr(path, 'read'):
             js = json.load(path, object_pairs_hook=OrderedDict, parse_float=Decimal, **kwargs)
         else:
-            with open(path) as f:
+            with open_input(path, None) as f:
                 js = json.load(f, object_pairs_hook=OrderedDict, parse_float=Decimal, **kwargs)
 
         for key, value in js.items():
@@ -1,3 +1,8 @@
+from functools import partial
+
+from agate.tableset.with_executor import _call_method, _get_executor, _map
+
+
 def having(self, aggregations, test):
     """
     Create a new :class:`.TableSet` with only those tables that pass a test.
@@ -14,17 +19,19 @@ def having(self, aggregations, test):
     :param test:
         A function that takes a dictionary of aggregated properties and returns
         :code:`True` if it should be included in the new :class:`.TableSet`.
+        An :class:`.Expression` whose columns are the names of the
+        aggregations may also be used, e.g. :code:`col('count') > 10`.
     :type test:
-        :class:`function`
+        :class:`function` or :class:`.Expression`
     :returns:
         A new :class:`.TableSet`.
     """
     new_tables = []
     new_keys = []
 
-    for key, table in self.items():
-        props = table.aggregate(aggregations)
+    results = _map(_get_executor(self), partial(_call_method, 'aggregate', (aggregations,), {}), self._values)
 
+    for key, table, props in zip(self._keys, self._values, results):
         if test(props):
             new_tables.append(table)
             new_keys.append(key)
@@ -0,0 +1,46 @@
+from collections import OrderedDict
+
+from agate.table.memory_usage import _memory_usage
+
+
+def memory_usage(self, deep=True):
+    """
+    Get the number of bytes used by the tables in this set, summed across
+    every table, as a dictionary with the same keys as
+    :meth:`.Table.memory_usage`.
+
+    Each object is counted once, even if it is shared by more than one
+    table.
+
+    :param deep:
+        See :meth:`.Table.memory_usage`.
+    :returns:
+        A :class:`collections.OrderedDict`.
+    """
+    return _tableset_memory_usage(self, deep, set())
+
+
+def _tableset_memory_usage(tableset, deep, seen):
+    from agate.tableset import TableSet
+
+    usage = OrderedDict([
+        ('rows', 0),
+        ('values', 0),
+        ('row_names', 0),
+        ('columns', OrderedDict((name, 0) for name in tableset._column_names)),
+        ('total', 0),
+    ])
+
+    for table in tableset._values:
+        if isinstance(table, TableSet):
+            table_usage = _tableset_memory_usage(table, deep, seen)
+        else:
+            table_usage = _memory_usage(table, deep, seen)
+
+        for key in ('rows', 'values', 'row_names', 'total'):
+            usage[key] += table_usage[key]
+
+        for name, size in table_usage['columns'].items():
+            usage['columns'][name] += size
+
+    return usage
@@ -1,7 +1,9 @@
 import os
 
+from agate.compression import add_extension
 
-def to_csv(self, dir_path, **kwargs):
+
+def to_csv(self, dir_path, compression='infer', **kwargs):
     """
     Write each table in this set to a separate CSV in a given
     directory.
@@ -10,11 +12,16 @@ def to_csv(self, dir_path, **kwargs):
 
     :param dir_path:
         Path to the directory to write the CSV files to.
+    :param compression:
+        If specified, compress each file with :code:`'gzip'`, :code:`'bz2'` or
+        :code:`'lzma'`, and add the extension of the compression to its name.
+        By default, as the names of the files end with :code:`.csv`, they are
+        not compressed.
     """
     if not os.path.exists(dir_path):
         os.makedirs(dir_path)
 
     for name, table in self.items():
-        path = os.path.join(dir_path, '%s.csv' % name)
+        path = add_extension(os.path.join(dir_path, '%s.csv' % name), compression)
 
-        table.to_csv(path, **kwargs)
+        table.to_csv(path, compression=compression, **kwargs)
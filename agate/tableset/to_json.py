@@ -3,8 +3,10 @@ import os
 from collections import OrderedDict
 from io import StringIO
 
+from agate.compression import add_extension, open_output
 
-def to_json(self, path, nested=False, indent=None, **kwargs):
+
+def to_json(self, path, nested=False, indent=None, compression='infer', **kwargs):
     """
     Write :class:`TableSet` to either a set of JSON files for each table or
     a single nested JSON file.
@@ -20,15 +22,20 @@ def to_json(self, path, nested=False, indent=None, **kwargs):
         will be a set of files for each table. Defaults to `False`.
     :param indent:
         See :meth:`Table.to_json`.
+    :param compression:
+        If specified, compress each file with :code:`'gzip'`, :code:`'bz2'` or
+        :code:`'lzma'`, and, if nested is `False`, add the extension of the
+        compression to its name. By default, the compression of a nested
+        JSON file is inferred from its extension.
     """
     if not nested:
         if not os.path.exists(path):
             os.makedirs(path)
 
         for name, table in self.items():
-            filepath = os.path.join(path, '%s.json' % name)
+            filepath = add_extension(os.path.join(path, '%s.json' % name), compression)
 
-            table.to_json(filepath, indent=indent, **kwargs)
+            table.to_json(filepath, indent=indent, compression=compression, **kwargs)
     else:
         close = True
         tableset_dict = OrderedDict()
@@ -47,7 +54,7 @@ def to_json(self, path, nested=False, indent=None, **kwargs):
             if dirpath and not os.path.exists(dirpath):
                 os.makedirs(dirpath)
 
-            f = open(path, 'w')
+            f = open_output(path, compression=compression)
 
         json_kwargs = {'ensure_ascii': False, 'indent': indent}
 
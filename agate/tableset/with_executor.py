@@ -0,0 +1,71 @@
+import os
+
+from agate.config import get_option
+
+
+def with_executor(self, executor):
+    """
+    Create a new :class:`.TableSet` that applies operations to its tables
+    using an executor from :mod:`concurrent.futures`.
+
+    Methods that call a :class:`.Table` method on each table, such as
+    :meth:`.TableSet.compute` and :meth:`.TableSet.where`, as well as
+    :meth:`.TableSet.aggregate` and :meth:`.TableSet.having`, will submit one
+    task per table to the executor. Results are always returned in the same
+    order as the tables in this set. TableSets created from the new TableSet
+    use the same executor.
+
+    When the executor is a :class:`concurrent.futures.ProcessPoolExecutor`,
+    tables (and any TableSets returned by the workers) are sent to and from
+    the worker processes as tuples of row values, rather than as :class:`.Row`
+    instances. The arguments of each operation (including any functions,
+    :class:`.Computation` and :class:`.Aggregation` instances) must be
+    picklable, so lambda functions can not be used.
+
+    The executor is not shut down by agate. To use the same executor for
+    every :class:`.TableSet` see the :code:`executor` option in
+    :mod:`agate.config`.
+
+    :param executor:
+        A :class:`concurrent.futures.Executor`, or :code:`None` to apply
+        operations serially.
+    :returns:
+        A new :class:`.TableSet`.
+    """
+    tableset = self._fork(self._values, self._keys)
+    tableset._executor = executor
+
+    return tableset
+
+
+def _get_executor(tableset):
+    """
+    Get the executor that a :class:`.TableSet` should use, if any.
+    """
+    if tableset._executor is not None:
+        return tableset._executor
+
+    return get_option('executor')
+
+
+def _map(executor, func, tables):
+    """
+    Call a function on each of a sequence of tables using an executor, and
+    return a list of the results in the same order.
+    """
+    if executor is None:
+        return [func(table) for table in tables]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    if isinstance(executor, ProcessPoolExecutor):
+        tables = list(tables)
+        chunksize = max(1, len(tables) // ((os.cpu_count() or 1) * 4))
+
+        return list(executor.map(func, tables, chunksize=chunksize))
+
+    return list(executor.map(func, tables))
+
+
+def _call_method(method_name, args, kwargs, table):
+    return getattr(table, method_name)(*args, **kwargs)
@@ -0,0 +1,201 @@
+"""
+This module contains binary streams that read and write files in a
+background thread, so that waiting for the disk (or the network, or a
+compression codec) overlaps with parsing and formatting data.
+
+:meth:`.Table.from_csv` and the other methods that read or write a file
+given by its path use them by default. The size of the blocks read and
+written, and the number of blocks that may be read ahead or left to be
+written, are set by the :code:`io_block_size`, :code:`read_ahead` and
+:code:`write_behind` options in :mod:`agate.config`.
+"""
+
+import io
+import queue
+import threading
+
+from agate.config import get_option
+
+
+class ThreadedReader(io.RawIOBase):
+    """
+    A binary stream that reads blocks from another binary stream in a
+    background thread, up to :code:`queue_size` blocks ahead of its own
+    reads. The other stream is closed when this stream is closed.
+
+    :param f:
+        A binary file-like object.
+    :param block_size:
+        The number of bytes to read at a time. Defaults to the
+        :code:`io_block_size` option.
+    :param queue_size:
+        The number of blocks that may be read ahead. Defaults to the
+        :code:`read_ahead` option.
+    """
+    def __init__(self, f, block_size=None, queue_size=None):
+        self._f = f
+        self._block_size = block_size or get_option('io_block_size')
+        self._queue = queue.Queue(queue_size or get_option('read_ahead'))
+        self._stop = threading.Event()
+        self._block = memoryview(b'')
+        self._eof = False
+
+        self._thread = threading.Thread(target=self._fill, daemon=True)
+        self._thread.start()
+
+    def _fill(self):
+        """
+        Read blocks into the queue until the end of the stream, an error or
+        this stream is closed.
+        """
+        try:
+            while not self._stop.is_set():
+                block = self._f.read(self._block_size)
+
+                self._put(block)
+
+                if not block:
+                    break
+        except Exception as e:
+            self._put(e)
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+
+            break
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if not self._block:
+            if self._eof:
+                return 0
+
+            item = self._queue.get()
+
+            if isinstance(item, Exception):
+                self._eof = True
+
+                raise item
+
+            if not item:
+                self._eof = True
+
+                return 0
+
+            self._block = memoryview(item)
+
+        n = min(len(b), len(self._block))
+        b[:n] = self._block[:n]
+        self._block = self._block[n:]
+
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self._f.close()
+
+        super().close()
+
+
+class ThreadedWriter(io.RawIOBase):
+    """
+    A binary stream that collects what is written to it into blocks, which a
+    background thread writes to another binary stream. Writes only wait for
+    the background thread if :code:`queue_size` blocks are already waiting
+    to be written. The other stream is closed when this stream is closed.
+
+    An error raised by the other stream is raised by the next call to
+    :meth:`write`, :meth:`flush` or :meth:`close`.
+
+    :param f:
+        A binary file-like object.
+    :param block_size:
+        The number of bytes to write at a time. Defaults to the
+        :code:`io_block_size` option.
+    :param queue_size:
+        The number of blocks that may wait to be written. Defaults to the
+        :code:`write_behind` option.
+    """
+    def __init__(self, f, block_size=None, queue_size=None):
+        self._f = f
+        self._block_size = block_size or get_option('io_block_size')
+        self._queue = queue.Queue(queue_size or get_option('write_behind'))
+        self._buffer = bytearray()
+        self._error = None
+        self._done = False
+
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _drain(self):
+        """
+        Write blocks from the queue until it receives :code:`None`. After an
+        error, blocks are discarded.
+        """
+        while True:
+            block = self._queue.get()
+
+            try:
+                if block is None:
+                    return
+
+                if self._error is None:
+                    self._f.write(block)
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _check(self):
+        if self._error is not None:
+            raise self._error
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._check()
+
+        self._buffer += b
+
+        if len(self._buffer) >= self._block_size:
+            self._queue.put(bytes(self._buffer))
+            self._buffer.clear()
+
+        return len(b)
+
+    def flush(self):
+        """
+        Wait until everything written so far has been written to the other
+        stream, and flush it.
+        """
+        if self.closed or self._done:
+            return
+
+        if self._buffer:
+            self._queue.put(bytes(self._buffer))
+            self._buffer.clear()
+
+        self._queue.join()
+        self._check()
+        self._f.flush()
+
+    def close(self):
+        if not self.closed and not self._done:
+            try:
+                self.flush()
+            finally:
+                self._done = True
+                self._queue.put(None)
+                self._thread.join()
+                self._f.close()
+
+        super().close()
@@ -73,6 +73,27 @@ class TypeTester:
                 Text(null_values=null_values)
             ]
 
+    @property
+    def force(self):
+        """
+        Get the dictionary of data types that override inference.
+        """
+        return self._force
+
+    @property
+    def limit(self):
+        """
+        Get the limit on how many rows are evaluated, or :code:`None`.
+        """
+        return self._limit
+
+    @property
+    def types(self):
+        """
+        Get the sequence of possible types, in the order they are tested in.
+        """
+        return self._possible_types
+
     def run(self, rows, column_names):
         """
         Apply type inference to the provided data and return an array of
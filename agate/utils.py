@@ -5,12 +5,13 @@ agate.
 
 import math
 import string
+import sys
+from bisect import bisect_right
 from collections import OrderedDict
 from collections.abc import Sequence
 from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal, getcontext
-from functools import wraps
-
-from slugify import slugify as pslugify
+from functools import partial, wraps
+from importlib import import_module
 
 from agate import config
 from agate.warns import warn_duplicate_column, warn_unnamed_column
@@ -37,6 +38,68 @@ def memoize(func):
     return wrapper
 
 
+class LazyMethod:
+    """
+    A placeholder for a method of a class that is defined in another module,
+    which is only imported the first time the method is accessed. The
+    placeholder then replaces itself on the class with the real method.
+
+    This is used by :class:`.Table` and :class:`.TableSet` so that importing
+    agate does not import every method's module (and their dependencies,
+    such as the charting library).
+
+    :param cls:
+        The class the method belongs to.
+    :param name:
+        The name of the method, which must also be its name in the module.
+    :param module_name:
+        The full name of the module that defines the method.
+    """
+    def __init__(self, cls, name, module_name):
+        self._cls = cls
+        self._name = name
+        self._module_name = module_name
+
+    def load(self):
+        """
+        Import and return the method, and set it on the class and as an
+        attribute of the class's module, as if it had been imported there.
+        """
+        method = getattr(import_module(self._module_name), self._name)
+
+        setattr(self._cls, self._name, method)
+        setattr(sys.modules[self._cls.__module__], self._name, method)
+
+        return method
+
+    def __get__(self, obj, objtype=None):
+        return self.load().__get__(obj, objtype or self._cls)
+
+
+def attach_lazy_methods(cls, methods):
+    """
+    Attach a :class:`LazyMethod` to a class for each of a dictionary of
+    method names and module names.
+
+    :returns:
+        A module-level :code:`__getattr__` function (see :pep:`562`) that
+        lazily imports each method as an attribute of the calling module.
+    """
+    lazy_methods = {}
+
+    for name, module_name in methods.items():
+        lazy_methods[name] = LazyMethod(cls, name, module_name)
+        setattr(cls, name, lazy_methods[name])
+
+    def __getattr__(name):
+        try:
+            return lazy_methods[name].load()
+        except KeyError:
+            raise AttributeError('module %r has no attribute %r' % (cls.__module__, name))
+
+    return __getattr__
+
+
 class NullOrder:
     """
     Dummy object used for sorting in place of None.
@@ -80,8 +143,6 @@ class Quantiles(Sequence):
         """
         Identify which quantile a given value is part of.
         """
-        i = 0
-
         if value < self._quantiles[0]:
             raise ValueError('Value is less than minimum quantile value.')
 
@@ -91,12 +152,138 @@ class Quantiles(Sequence):
         if value == self._quantiles[-1]:
             return Decimal(len(self._quantiles) - 1)
 
-        while value >= self._quantiles[i + 1]:
-            i += 1
+        # The last quantile whose value is less than or equal to the value
+        i = bisect_right(self._quantiles, value) - 1
 
         return Decimal(i)
 
 
+def nth_smallest(data, indices):
+    """
+    Find the values that would be at the given indices if the data were
+    sorted, without sorting all of it.
+
+    The first and last indices are found with :func:`min` and :func:`max`.
+    Others are found by repeatedly partitioning the data around a pivot and
+    only continuing into the partitions that contain requested indices
+    ("quickselect"). This takes linear time for a few indices, but when many
+    scattered indices are requested sorting is faster, so the data is sorted
+    instead.
+
+    :param data:
+        A sequence of values, which must not contain nulls.
+    :param indices:
+        A sequence of indices into the sorted data.
+    :returns:
+        A list of values in the same order as :code:`indices`.
+    """
+    length = len(data)
+    results = {}
+    wanted = []
+
+    for i in sorted(set(indices)):
+        if i < 0 or i >= length:
+            raise IndexError('Index %i is out of range.' % i)
+        elif i == 0:
+            results[i] = min(data)
+        elif i == length - 1:
+            results[i] = max(data)
+        else:
+            wanted.append(i)
+
+    # Runs of consecutive indices, such as the two middle values of an even
+    # number of values, cost about the same to find as a single index.
+    runs = sum(1 for j, i in enumerate(wanted) if j == 0 or wanted[j - 1] != i - 1)
+
+    if runs > 4:
+        data_sorted = sorted(data)
+
+        for i in wanted:
+            results[i] = data_sorted[i]
+    elif wanted:
+        _select(list(data), wanted, 0, results, 2 * length.bit_length())
+
+    return [results[i] for i in indices]
+
+
+def _select(data, indices, offset, results, depth):
+    """
+    Recursive implementation of :func:`nth_smallest`. :code:`data` contains
+    the values at positions :code:`offset` to :code:`offset + len(data)` of
+    the sorted data. Falls back to sorting if the data is small or the
+    recursion is too deep, which guarantees :code:`O(n log n)` time.
+    """
+    length = len(data)
+
+    if length <= 64 or depth == 0:
+        data.sort()
+
+        for i in indices:
+            results[i] = data[i - offset]
+
+        return
+
+    # Median of the first, middle and last values
+    pivot = sorted((data[0], data[length // 2], data[-1]))[1]
+
+    lows = [d for d in data if d < pivot]
+    highs = [d for d in data if d > pivot]
+
+    low_end = offset + len(lows)
+    high_start = offset + length - len(highs)
+
+    for i in indices:
+        if low_end <= i < high_start:
+            results[i] = pivot
+
+    low_indices = [i for i in indices if i < low_end]
+    high_indices = [i for i in indices if i >= high_start]
+
+    del data
+
+    if low_indices:
+        _select(lows, low_indices, offset, results, depth - 1)
+
+    if high_indices:
+        _select(highs, high_indices, high_start, results, depth - 1)
+
+
+def argsort(values, reverse=False):
+    """
+    Get the indices of a sequence of values in sorted order.
+
+    Null values are ordered after all other values, as in
+    :meth:`.Table.order_by`, so they come first when :code:`reverse` is
+    :code:`True`. Equal values keep their original order.
+
+    The non-null values are sorted by index using the sequence's own
+    :code:`__getitem__` as the key, which avoids calling a Python function for
+    every comparison.
+
+    :param values:
+        A sequence of values.
+    :param reverse:
+        If :code:`True`, sort in descending order.
+    :returns:
+        A :class:`list` of indices into :code:`values`.
+    """
+    indices = []
+    nulls = []
+
+    for i, value in enumerate(values):
+        if value is None:
+            nulls.append(i)
+        else:
+            indices.append(i)
+
+    indices.sort(key=values.__getitem__, reverse=reverse)
+
+    if reverse:
+        return nulls + indices
+
+    return indices + nulls
+
+
 def median(data_sorted):
     """
     Finds the median value of a given series of values.
@@ -116,26 +303,49 @@ def median(data_sorted):
     return (a + b) / 2
 
 
-def max_precision(values):
+def significant_places(value):
+    """
+    Given a single value returns a tuple of the number of significant whole
+    places and decimal places in it, or :code:`None` if the value is null,
+    NaN or infinite.
+
+    :param value:
+        The value to analyze.
+    """
+    if value is None or math.isnan(value) or math.isinf(value):
+        return None
+
+    sign, digits, exponent = value.normalize().as_tuple()
+
+    exponent_places = exponent * -1
+    whole_places = len(digits) - exponent_places
+
+    return whole_places, exponent_places
+
+
+def max_precision(values, max_whole_places=1, max_decimal_places=0):
     """
     Given a series of values (such as a :class:`.Column`) returns the most
     significant decimal places present in any value.
 
     :param values:
         The values to analyze.
+    :param max_whole_places:
+        The most significant whole places already seen, if continuing from
+        previously analyzed values.
+    :param max_decimal_places:
+        The most significant decimal places already seen, if continuing from
+        previously analyzed values.
     """
-    max_whole_places = 1
-    max_decimal_places = 0
     precision = getcontext().prec
 
     for value in values:
-        if value is None or math.isnan(value) or math.isinf(value):
-            continue
+        value_places = significant_places(value)
 
-        sign, digits, exponent = value.normalize().as_tuple()
+        if value_places is None:
+            continue
 
-        exponent_places = exponent * -1
-        whole_places = len(digits) - exponent_places
+        whole_places, exponent_places = value_places
 
         if whole_places > max_whole_places:
             max_whole_places = whole_places
@@ -304,11 +514,23 @@ def slugify(values, ensure_unique=False, **kwargs):
     Any kwargs will be passed to the slugify method in python-slugify. See:
     https://github.com/un33k/python-slugify
     """
-    slug_args = {'separator': '_'}
-    slug_args.update(kwargs)
+    func = slugify_function(**kwargs)
 
     if ensure_unique:
-        new_values = tuple(pslugify(value, **slug_args) for value in values)
-        return deduplicate(new_values, separator=slug_args['separator'])
+        new_values = tuple(func(value) for value in values)
+        return deduplicate(new_values, separator=func.keywords['separator'])
+
+    return tuple(func(value) for value in values)
+
+
+def slugify_function(**kwargs):
+    """
+    Get a function that standardizes a single string in the same way as
+    :func:`slugify`, with any kwargs bound to it.
+    """
+    from slugify import slugify as pslugify
+
+    slug_args = {'separator': '_'}
+    slug_args.update(kwargs)
 
-    return tuple(pslugify(value, **slug_args) for value in values)
+    return partial(pslugify, **slug_args)
@@ -0,0 +1,88 @@
+"""
+Run the benchmark suite, or compare saved results to a baseline.
+
+    python -m benchmarks run --rows 1000,100000 --output results.json
+    python -m benchmarks compare baseline.json results.json --threshold 0.2
+
+:code:`compare` exits with status 1 if any benchmark regressed.
+"""
+
+import argparse
+import sys
+
+from benchmarks import suite
+
+
+def _list(convert):
+    def parse(value):
+        return [convert(v) for v in value.split(',')]
+
+    return parse
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmark agate.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run benchmarks and save the results as JSON.')
+    run_parser.add_argument('--rows', type=_list(int), default=[1000, 10000, 100000],
+                            help='Comma-separated numbers of rows. Default: 1000,10000,100000')
+    run_parser.add_argument('--widths', type=_list(int), default=[6],
+                            help='Comma-separated numbers of columns, at least 6. Default: 6')
+    run_parser.add_argument('--cardinalities', type=_list(int), default=[100],
+                            help='Comma-separated numbers of distinct keys. Default: 100')
+    run_parser.add_argument('--null-ratios', type=_list(float), default=[0.1],
+                            help='Comma-separated proportions of null values. Default: 0.1')
+    run_parser.add_argument('--repeat', type=int, default=3,
+                            help='Number of times to time each benchmark. Default: 3')
+    run_parser.add_argument('--names', type=_list(str), default=None,
+                            help='Comma-separated patterns of benchmark names, such as "aggregate.*". Default: all')
+    run_parser.add_argument('--output', '-o', default='benchmarks.json',
+                            help='The file to save results to. Default: benchmarks.json')
+
+    subparsers.add_parser('list', help='List the names of the benchmarks.')
+
+    compare_parser = subparsers.add_parser('compare', help='Compare results to a baseline.')
+    compare_parser.add_argument('baseline', help='Baseline results file.')
+    compare_parser.add_argument('results', help='Results file.')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help='Proportional change in time that is a regression. Default: 0.1')
+
+    args = parser.parse_args(args)
+
+    if args.command == 'run':
+        results = suite.run(args.rows, args.widths, args.cardinalities, args.null_ratios, args.repeat, args.names,
+                            output=sys.stdout)
+        suite.save(results, args.output)
+
+        return 0
+
+    if args.command == 'list':
+        for name in suite.BENCHMARKS:
+            print(name)
+
+        return 0
+
+    comparisons = suite.compare(suite.load(args.baseline), suite.load(args.results), args.threshold)
+    regressions = 0
+
+    for name, params, baseline_time, time, ratio, status in comparisons:
+        print('%-12s %s [%s] %.6f -> %.6f (%+.1f%%)' % (
+            status,
+            name,
+            ','.join('%s=%s' % item for item in params.items()),
+            baseline_time,
+            time,
+            (ratio - 1) * 100,
+        ))
+
+        if status == 'regression':
+            regressions += 1
+
+    print('%i of %i benchmarks regressed.' % (regressions, len(comparisons)))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
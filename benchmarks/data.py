@@ -0,0 +1,145 @@
+"""
+Generators of reproducible tables for benchmarks.
+"""
+
+import datetime
+import random
+from decimal import Decimal
+from functools import cached_property
+from io import StringIO
+
+import agate
+
+#: The number of columns that every generated table has, before extra columns
+BASE_WIDTH = 6
+
+
+class Dataset:
+    """
+    A generated table, and the same data in the forms that benchmarks
+    need, each created the first time it is used.
+
+    Columns are :code:`id` (a unique number), :code:`key` (text with
+    :code:`cardinality` distinct values), :code:`group` (text with about the
+    square root of :code:`cardinality` distinct values), :code:`value` (a
+    number), :code:`date` and :code:`flag` (a boolean), followed by extra
+    number columns :code:`extra_1`, :code:`extra_2`, etc.
+
+    :param rows:
+        The number of rows.
+    :param width:
+        The number of columns, at least :data:`BASE_WIDTH`.
+    :param cardinality:
+        The number of distinct values of the :code:`key` column.
+    :param null_ratio:
+        The proportion of values in the :code:`value`, :code:`date`,
+        :code:`flag` and extra columns that are null.
+    :param seed:
+        The seed of the random number generator.
+    """
+    def __init__(self, rows, width=BASE_WIDTH, cardinality=100, null_ratio=0.1, seed=0):
+        if width < BASE_WIDTH:
+            raise ValueError('width must be at least %i.' % BASE_WIDTH)
+
+        self.params = {
+            'rows': rows,
+            'width': width,
+            'cardinality': cardinality,
+            'null_ratio': null_ratio,
+        }
+        self.seed = seed
+
+        self.column_names = ['id', 'key', 'group', 'value', 'date', 'flag']
+        self.column_names.extend('extra_%i' % i for i in range(1, width - BASE_WIDTH + 1))
+
+        self.column_types = [agate.Number(), agate.Text(), agate.Text(), agate.Number(), agate.Date(), agate.Boolean()]
+        self.column_types.extend(agate.Number() for i in range(width - BASE_WIDTH))
+
+    def __str__(self):
+        return ','.join('%s=%s' % item for item in self.params.items())
+
+    @cached_property
+    def rows(self):
+        """
+        The rows, as tuples of values of each column's type.
+        """
+        rng = random.Random(self.seed)
+        count = self.params['rows']
+        cardinality = max(self.params['cardinality'], 1)
+        groups = max(int(cardinality ** 0.5), 1)
+        null_ratio = self.params['null_ratio']
+        extras = len(self.column_names) - BASE_WIDTH
+        start = datetime.date(2000, 1, 1)
+
+        def maybe_null(value):
+            return None if rng.random() < null_ratio else value
+
+        rows = []
+
+        for i in range(count):
+            k = rng.randrange(cardinality)
+            row = [
+                Decimal(i + 1),
+                'k%i' % k,
+                'g%i' % (k % groups),
+                maybe_null(Decimal(rng.randrange(100000)) / 100),
+                maybe_null(start + datetime.timedelta(days=rng.randrange(10000))),
+                maybe_null(rng.random() < 0.5),
+            ]
+            row.extend(maybe_null(Decimal(rng.randrange(1000))) for j in range(extras))
+            rows.append(tuple(row))
+
+        return rows
+
+    @cached_property
+    def text_rows(self):
+        """
+        The rows, as tuples of strings, like those read from a CSV file.
+        """
+        return [tuple('' if v is None else str(v) for v in row) for row in self.rows]
+
+    @cached_property
+    def table(self):
+        """
+        The rows as a :class:`.Table`.
+        """
+        return agate.Table(self.rows, self.column_names, self.column_types)
+
+    @cached_property
+    def right_table(self):
+        """
+        A table to join to :attr:`table` on the :code:`key` column, with one
+        row per distinct key.
+        """
+        cardinality = max(self.params['cardinality'], 1)
+        rows = [('k%i' % k, Decimal(k)) for k in range(cardinality)]
+
+        return agate.Table(rows, ['key', 'weight'], [agate.Text(), agate.Number()])
+
+    @cached_property
+    def csv(self):
+        """
+        The table as CSV text.
+        """
+        output = StringIO()
+        self.table.to_csv(output)
+
+        return output.getvalue()
+
+    @cached_property
+    def json(self):
+        """
+        The table as JSON text.
+        """
+        output = StringIO()
+        self.table.to_json(output)
+
+        return output.getvalue()
+
+    @cached_property
+    def normalized(self):
+        """
+        The :code:`key` and :code:`group` columns of the table, normalized
+        into :code:`property` and :code:`value` columns.
+        """
+        return self.table.normalize('id', ['key', 'group'])
@@ -0,0 +1,421 @@
+"""
+A suite of benchmarks of agate's most frequently used operations, run
+against generated tables (see :class:`benchmarks.data.Dataset`) of every
+combination of a set of sizes, widths, cardinalities and null ratios.
+
+Each benchmark is a function that takes a :class:`.Dataset` and returns a
+function to time. Preparing the data is not timed.
+
+Results are saved as JSON, and can be compared to a baseline to find
+regressions. Run :code:`python -m benchmarks --help` for usage.
+"""
+
+import fnmatch
+import itertools
+import json
+import platform
+import sys
+import time
+import warnings
+from collections import OrderedDict
+from io import StringIO
+
+import agate
+from agate.aggregations import (IQR, MAD, All, Any, ApproxCountDistinct, ApproxMedian, ApproxPercentiles, Count,
+                                Deciles, First, HasNulls, Max, MaxLength, MaxPrecision, Mean, Median, Min, Mode,
+                                Percentiles, PopulationStDev, PopulationVariance, Quartiles, Quintiles, StDev, Sum,
+                                Summary, Variance)
+from agate.computations import (Change, CumulativeSum, Formula, Lag, Lead, Percent, PercentChange, PercentileRank,
+                                Rank, RollingMax, RollingMean, RollingMin, RollingSum, RowNumber, Slug, col)
+from benchmarks.data import Dataset
+
+#: The version of the format of saved results
+RESULTS_VERSION = 1
+
+#: Benchmarks by name, in the order they are run
+BENCHMARKS = OrderedDict()
+
+#: Aggregations benchmarked with :meth:`.Table.aggregate`
+AGGREGATIONS = OrderedDict([
+    ('All', lambda: All('flag', lambda v: v is not None)),
+    ('Any', lambda: Any('flag', lambda v: v is None)),
+    ('ApproxCountDistinct', lambda: ApproxCountDistinct('key')),
+    ('ApproxMedian', lambda: ApproxMedian('value')),
+    ('ApproxPercentiles', lambda: ApproxPercentiles('value')),
+    ('Count', lambda: Count()),
+    ('Count.value', lambda: Count('key', 'k1')),
+    ('Deciles', lambda: Deciles('value')),
+    ('First', lambda: First('value')),
+    ('HasNulls', lambda: HasNulls('value')),
+    ('IQR', lambda: IQR('value')),
+    ('MAD', lambda: MAD('value')),
+    ('Max', lambda: Max('value')),
+    ('MaxLength', lambda: MaxLength('key')),
+    ('MaxPrecision', lambda: MaxPrecision('value')),
+    ('Mean', lambda: Mean('value')),
+    ('Median', lambda: Median('value')),
+    ('Min', lambda: Min('value')),
+    ('Mode', lambda: Mode('value')),
+    ('Percentiles', lambda: Percentiles('value')),
+    ('PopulationStDev', lambda: PopulationStDev('value')),
+    ('PopulationVariance', lambda: PopulationVariance('value')),
+    ('Quartiles', lambda: Quartiles('value')),
+    ('Quintiles', lambda: Quintiles('value')),
+    ('StDev', lambda: StDev('value')),
+    ('Sum', lambda: Sum('value')),
+    ('Summary', lambda: Summary('value', agate.Number(), lambda c: len(c.values()))),
+    ('Variance', lambda: Variance('value')),
+])
+
+#: Computations benchmarked with :meth:`.Table.compute`
+COMPUTATIONS = OrderedDict([
+    ('Change', lambda: Change('id', 'value')),
+    ('CumulativeSum', lambda: CumulativeSum('value')),
+    ('Expression', lambda: col('value') * 2 + col('id')),
+    ('Formula', lambda: Formula(agate.Number(), lambda row: row['id'] * 2)),
+    ('Lag', lambda: Lag('value')),
+    ('Lead', lambda: Lead('value')),
+    ('Percent', lambda: Percent('id')),
+    ('PercentChange', lambda: PercentChange('id', 'value')),
+    ('PercentileRank', lambda: PercentileRank('id')),
+    ('Rank', lambda: Rank('value')),
+    ('RollingMax', lambda: RollingMax('value', 10)),
+    ('RollingMean', lambda: RollingMean('value', 10)),
+    ('RollingMin', lambda: RollingMin('value', 10)),
+    ('RollingSum', lambda: RollingSum('value', 10)),
+    ('RowNumber', lambda: RowNumber(order_by='value')),
+    ('Slug', lambda: Slug('key')),
+    ('Slug.ensure_unique', lambda: Slug('key', ensure_unique=True)),
+])
+
+
+def benchmark(name):
+    """
+    Register a benchmark.
+    """
+    def decorator(func):
+        BENCHMARKS[name] = func
+
+        return func
+
+    return decorator
+
+
+@benchmark('table')
+def bench_table(data):
+    rows, column_names, column_types = data.rows, data.column_names, data.column_types
+
+    return lambda: agate.Table(rows, column_names, column_types)
+
+
+@benchmark('type_tester')
+def bench_type_tester(data):
+    rows, column_names = data.text_rows, data.column_names
+
+    return lambda: agate.TypeTester().run(rows, column_names)
+
+
+@benchmark('from_csv')
+def bench_from_csv(data):
+    text, column_types = data.csv, data.column_types
+
+    return lambda: agate.Table.from_csv(StringIO(text), column_types=column_types)
+
+
+@benchmark('to_csv')
+def bench_to_csv(data):
+    table = data.table
+
+    return lambda: table.to_csv(StringIO())
+
+
+@benchmark('from_json')
+def bench_from_json(data):
+    text, column_types = data.json, data.column_types
+
+    return lambda: agate.Table.from_json(StringIO(text), column_types=column_types)
+
+
+@benchmark('to_json')
+def bench_to_json(data):
+    table = data.table
+
+    return lambda: table.to_json(StringIO())
+
+
+@benchmark('where')
+def bench_where(data):
+    table = data.table
+
+    return lambda: table.where(lambda row: row['flag'])
+
+
+@benchmark('where.expression')
+def bench_where_expression(data):
+    table = data.table
+
+    return lambda: table.where(col('value') > 500)
+
+
+@benchmark('select')
+def bench_select(data):
+    table = data.table
+
+    return lambda: table.select(['id', 'value', 'key'])
+
+
+@benchmark('order_by')
+def bench_order_by(data):
+    table = data.table
+
+    return lambda: table.order_by('value')
+
+
+@benchmark('order_by.multiple')
+def bench_order_by_multiple(data):
+    table = data.table
+
+    return lambda: table.order_by(['key', 'value'])
+
+
+@benchmark('distinct')
+def bench_distinct(data):
+    table = data.table
+
+    return lambda: table.distinct('key')
+
+
+@benchmark('group_by')
+def bench_group_by(data):
+    table = data.table
+
+    return lambda: table.group_by('key')
+
+
+@benchmark('group_by.multiple')
+def bench_group_by_multiple(data):
+    table = data.table
+
+    return lambda: table.group_by(['group', 'key', 'flag'])
+
+
+@benchmark('group_by.aggregate')
+def bench_group_by_aggregate(data):
+    table = data.table
+
+    return lambda: table.group_by('key').aggregate([('count', Count()), ('sum', Sum('value'))])
+
+
+@benchmark('group_aggregate')
+def bench_group_aggregate(data):
+    table = data.table
+
+    return lambda: table.group_aggregate('key', [('count', Count()), ('sum', Sum('value'))])
+
+
+def _aggregate_benchmark(make):
+    def bench(data):
+        table = data.table
+
+        return lambda: table.aggregate(make())
+
+    return bench
+
+
+def _compute_benchmark(make):
+    def bench(data):
+        table = data.table
+
+        return lambda: table.compute([('computed', make())])
+
+    return bench
+
+
+for _name, _make in AGGREGATIONS.items():
+    benchmark('aggregate.%s' % _name)(_aggregate_benchmark(_make))
+
+for _name, _make in COMPUTATIONS.items():
+    benchmark('compute.%s' % _name)(_compute_benchmark(_make))
+
+
+@benchmark('pivot')
+def bench_pivot(data):
+    table = data.table
+
+    return lambda: table.pivot('group', 'flag')
+
+
+@benchmark('pivot.aggregation')
+def bench_pivot_aggregation(data):
+    table = data.table
+
+    return lambda: table.pivot('key', 'flag', Sum('value'))
+
+
+@benchmark('normalize')
+def bench_normalize(data):
+    table = data.table
+
+    return lambda: table.normalize('id', ['key', 'group'])
+
+
+@benchmark('denormalize')
+def bench_denormalize(data):
+    table = data.normalized
+
+    return lambda: table.denormalize('id', 'property', 'value')
+
+
+@benchmark('join')
+def bench_join(data):
+    table, right_table = data.table, data.right_table
+
+    return lambda: table.join(right_table, 'key')
+
+
+@benchmark('print_table')
+def bench_print_table(data):
+    table = data.table
+
+    return lambda: table.print_table(output=StringIO())
+
+
+def run(rows=(1000, 10000, 100000), widths=(6,), cardinalities=(100,), null_ratios=(0.1,), repeat=3, names=None,
+        output=None):
+    """
+    Run benchmarks against a dataset of each combination of parameters.
+
+    :param rows:
+        A sequence of numbers of rows.
+    :param widths:
+        A sequence of numbers of columns.
+    :param cardinalities:
+        A sequence of numbers of distinct keys.
+    :param null_ratios:
+        A sequence of proportions of null values.
+    :param repeat:
+        The number of times to time each benchmark. The fastest time is
+        used to compare results.
+    :param names:
+        A sequence of patterns (see :mod:`fnmatch`) of the names of the
+        benchmarks to run. Defaults to all benchmarks.
+    :param output:
+        A file-like object to report progress to, or :code:`None`.
+    :returns:
+        A dictionary of results that can be saved as JSON.
+    """
+    selected = [
+        name for name in BENCHMARKS
+        if names is None or any(fnmatch.fnmatchcase(name, pattern) for pattern in names)
+    ]
+    results = []
+
+    for params in itertools.product(rows, widths, cardinalities, null_ratios):
+        data = Dataset(*params)
+
+        for name in selected:
+            func = BENCHMARKS[name](data)
+            times = []
+
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+
+                for i in range(repeat):
+                    start = time.perf_counter()
+                    func()
+                    times.append(time.perf_counter() - start)
+
+            result = OrderedDict([
+                ('name', name),
+                ('params', data.params),
+                ('times', times),
+                ('min', min(times)),
+            ])
+            results.append(result)
+
+            if output:
+                output.write('%s [%s] %.6f\n' % (name, data, result['min']))
+
+    return OrderedDict([
+        ('version', RESULTS_VERSION),
+        ('agate', _agate_version()),
+        ('python', sys.version.split()[0]),
+        ('implementation', platform.python_implementation()),
+        ('machine', platform.machine()),
+        ('results', results),
+    ])
+
+
+def compare(baseline, results, threshold=0.1):
+    """
+    Compare results to a baseline. Only benchmarks that were run with the
+    same parameters in both are compared.
+
+    :param baseline:
+        A dictionary of results returned by :func:`run`.
+    :param results:
+        A dictionary of results returned by :func:`run`.
+    :param threshold:
+        The proportion by which the fastest time of a benchmark must increase
+        to be a regression, or decrease to be an improvement.
+    :returns:
+        A list of :code:`(name, params, baseline_time, time, ratio, status)`
+        tuples, where status is :code:`'regression'`, :code:`'improvement'`
+        or :code:`'same'`.
+    """
+    baseline_times = {_result_key(result): result['min'] for result in baseline['results']}
+    comparisons = []
+
+    for result in results['results']:
+        key = _result_key(result)
+
+        if key not in baseline_times:
+            continue
+
+        baseline_time = baseline_times[key]
+        ratio = result['min'] / baseline_time if baseline_time else float('inf')
+
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 / (1 + threshold):
+            status = 'improvement'
+        else:
+            status = 'same'
+
+        comparisons.append((result['name'], result['params'], baseline_time, result['min'], ratio, status))
+
+    return comparisons
+
+
+def load(path):
+    """
+    Load results saved as JSON.
+    """
+    with open(path) as f:
+        results = json.load(f, object_pairs_hook=OrderedDict)
+
+    if results.get('version') != RESULTS_VERSION:
+        raise ValueError('%s is not a benchmark results file of version %i.' % (path, RESULTS_VERSION))
+
+    return results
+
+
+def save(results, path):
+    """
+    Save results as JSON.
+    """
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=4)
+
+
+def _result_key(result):
+    return (result['name'],) + tuple(sorted(result['params'].items()))
+
+
+def _agate_version():
+    try:
+        from importlib.metadata import version
+
+        return version('agate')
+    except Exception:
+        return None
@@ -0,0 +1,20 @@
+import subprocess
+import sys
+import unittest
+from timeit import Timer
+
+
+class TestStartup(unittest.TestCase):
+    def test_import(self):
+        def test():
+            subprocess.run([sys.executable, '-c', 'import agate'], check=True)
+
+        def baseline():
+            subprocess.run([sys.executable, '-c', 'pass'], check=True)
+
+        results = Timer(test).repeat(10, 1)
+        baseline_results = Timer(baseline).repeat(10, 1)
+
+        min_time = min(results) - min(baseline_results)
+
+        self.assertLess(min_time, 0.2)  # Roughly 0.04s, or 0.25s when everything was imported eagerly
@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+from copy import deepcopy
+
+from benchmarks import suite
+from benchmarks.__main__ import main
+
+
+class TestSuite(unittest.TestCase):
+    def test_run(self):
+        results = suite.run(rows=[100], cardinalities=[10], repeat=1)
+
+        self.assertEqual([result['name'] for result in results['results']], list(suite.BENCHMARKS))
+
+        for result in results['results']:
+            self.assertEqual(result['params'], {'rows': 100, 'width': 6, 'cardinality': 10, 'null_ratio': 0.1})
+            self.assertEqual(len(result['times']), 1)
+
+    def test_compare(self):
+        baseline = suite.run(rows=[100, 200], widths=[7], repeat=1, names=['aggregate.Sum', 'join'])
+        results = deepcopy(baseline)
+
+        results['results'][0]['min'] *= 2
+        results['results'][1]['min'] /= 2
+        del results['results'][3]
+
+        comparisons = suite.compare(baseline, results, threshold=0.5)
+
+        self.assertEqual([(name, status) for name, params, before, after, ratio, status in comparisons], [
+            ('aggregate.Sum', 'regression'),
+            ('join', 'improvement'),
+            ('aggregate.Sum', 'same'),
+        ])
+        self.assertEqual(comparisons[2][1]['rows'], 200)
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results.json')
+
+            self.assertEqual(main(['run', '--rows', '100', '--repeat', '1', '--names', 'select', '-o', path]), 0)
+            self.assertEqual(suite.load(path)['results'][0]['name'], 'select')
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 import unittest
 
 import agate
@@ -9,3 +11,39 @@ class TestCSV(unittest.TestCase):
         self.assertIs(agate.csv.writer, agate.csv_py3.writer)
         self.assertIs(agate.csv.DictReader, agate.csv_py3.DictReader)
         self.assertIs(agate.csv.DictWriter, agate.csv_py3.DictWriter)
+
+
+class TestLazyImports(unittest.TestCase):
+    def run_python(self, code):
+        return subprocess.run(
+            [sys.executable, '-c', code],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True
+        ).stdout.split()
+
+    def test_import_does_not_load_dependencies(self):
+        loaded = self.run_python(
+            'import sys, agate; '
+            'print(" ".join(m for m in ("babel", "isodate", "leather", "parsedatetime", "pytimeparse", "slugify", '
+            '"agate.aggregations", "agate.computations", "agate.table.print_table") if m in sys.modules))'
+        )
+
+        self.assertEqual(loaded, [])
+
+    def test_lazy_names(self):
+        self.assertIs(agate.Sum, agate.aggregations.Sum)
+        self.assertIs(agate.Formula, agate.computations.Formula)
+        self.assertIs(agate.Table.order_by, agate.table.order_by)
+        self.assertIs(agate.TableSet.compute, agate.tableset.compute)
+        self.assertIn('Sum', dir(agate))
+
+        with self.assertRaises(AttributeError):
+            agate.NotAName
+
+    def test_star_import(self):
+        names = self.run_python(
+            'from agate import *; print(Sum.__name__, Formula.__name__, PartitionedTable.__name__)'
+        )
+
+        self.assertEqual(names, ['Sum', 'Formula', 'PartitionedTable'])
@@ -5,11 +5,12 @@ import warnings
 from decimal import Decimal
 
 from agate import Table
-from agate.aggregations import (IQR, MAD, All, Any, Count, Deciles, First, HasNulls, Max, MaxLength, MaxPrecision,
-                                Mean, Median, Min, Mode, Percentiles, PopulationStDev, PopulationVariance, Quartiles,
-                                Quintiles, StDev, Sum, Summary, Variance)
+from agate.aggregations import (IQR, MAD, All, Any, ApproxCountDistinct, ApproxMedian, ApproxPercentiles, Count,
+                                Deciles, First, HasNulls, Max, MaxLength, MaxPrecision, Mean, Median, Min, Mode,
+                                Percentiles, PopulationStDev, PopulationVariance, Quartiles, Quintiles, StDev, Sum,
+                                Summary, Variance)
 from agate.data_types import Boolean, DateTime, Number, Text, TimeDelta
-from agate.exceptions import DataTypeError
+from agate.exceptions import DataTypeError, UnsupportedAggregationError
 from agate.utils import Quantiles
 from agate.warns import NullCalculationWarning
 
@@ -89,6 +90,11 @@ class TestSimpleAggregation(unittest.TestCase):
         self.assertEqual(Count().run(table), 5)
         self.assertEqual(Count().run(table), 5)
 
+    def test_get_column_name(self):
+        self.assertEqual(Count('one').get_column_name(), 'one')
+        self.assertIsNone(Count().get_column_name())
+        self.assertEqual(Summary('one', Boolean(), lambda c: 2 in c).get_column_name(), 'one')
+
     def test_count_column(self):
         rows = (
             (1, 2, 'a'),
@@ -122,6 +128,30 @@ class TestSimpleAggregation(unittest.TestCase):
         self.assertEqual(Count('one', 4).run(table), 0)
         self.assertEqual(Count('one', None).run(table), 1)
 
+    def test_approx_count_distinct(self):
+        rows = (
+            (1, 2, 'a'),
+            (2, 3, 'b'),
+            (None, 4, 'c'),
+            (1, 2, 'a'),
+            (1, 2, 'a')
+        )
+
+        table = Table(rows, self.column_names, self.column_types)
+
+        self.assertIsInstance(ApproxCountDistinct('one').get_aggregate_data_type(table), Number)
+        ApproxCountDistinct('one').validate(table)
+        self.assertEqual(ApproxCountDistinct('one').run(table), 2)
+        self.assertEqual(ApproxCountDistinct('three').run(table), 3)
+
+        with self.assertRaises(ValueError):
+            ApproxCountDistinct('one', precision=3)
+
+    def test_approx_count_distinct_many(self):
+        table = Table([(n % 20000,) for n in range(40000)], ['one'], [Number()])
+
+        self.assertAlmostEqual(ApproxCountDistinct('one').run(table), 20000, delta=20000 * 0.03)
+
 
 class TestBooleanAggregation(unittest.TestCase):
     def test_any(self):
@@ -525,7 +555,7 @@ class TestNumberAggregation(unittest.TestCase):
             warnings.resetwarnings()
 
         self.assertIsInstance(MAD('two').get_aggregate_data_type(self.table), Number)
-        self.assertAlmostEqual(MAD('two').run(self.table), Decimal('0'))
+        self.assertAlmostEqual(MAD('two').run(self.table), Decimal('0.34'))
 
     def test_mad_all_nulls(self):
         self.assertIsNone(MAD('four').run(self.table))
@@ -580,6 +610,48 @@ class TestNumberAggregation(unittest.TestCase):
         with self.assertRaises(ValueError):
             percentiles.locate(1012)
 
+    def test_approx_percentiles(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+
+            with self.assertRaises(NullCalculationWarning):
+                ApproxPercentiles('one').validate(self.table)
+
+        with self.assertRaises(DataTypeError):
+            ApproxPercentiles('three').validate(self.table)
+
+        with self.assertRaises(ValueError):
+            ApproxPercentiles('two', accuracy=0)
+
+        self.assertEqual(ApproxPercentiles('two').run(self.table), Percentiles('two').run(self.table))
+
+        rows = [(n,) for n in range(1, 10001)]
+
+        table = Table(rows, ['ints'], [self.number_type])
+
+        percentiles = ApproxPercentiles('ints', accuracy=0.01).run(table)
+
+        self.assertIsInstance(percentiles, Quantiles)
+        self.assertEqual(percentiles[0], Decimal('1'))
+        self.assertEqual(percentiles[100], Decimal('10000'))
+
+        for i in range(1, 100):
+            self.assertAlmostEqual(percentiles[i], Decimal(i * 100), delta=100)
+
+    def test_approx_percentiles_all_nulls(self):
+        self.assertEqual(ApproxPercentiles('four').run(self.table), Quantiles([None] * 101))
+
+    def test_approx_median(self):
+        self.assertIsInstance(ApproxMedian('two').get_aggregate_data_type(self.table), Number)
+        self.assertEqual(ApproxMedian('two').run(self.table), Median('two').run(self.table))
+        self.assertIsNone(ApproxMedian('four').run(self.table))
+
+        rows = [(n,) for n in range(1, 10001)]
+
+        table = Table(rows, ['ints'], [self.number_type])
+
+        self.assertAlmostEqual(ApproxMedian('ints', accuracy=0.01).run(table), Decimal('5000'), delta=100)
+
     def test_quartiles(self):
         """
         CDF quartile tests from:
@@ -821,3 +893,128 @@ class TestTextAggregation(unittest.TestCase):
 
         with self.assertRaises(DataTypeError):
             MaxLength('test').validate(table)
+
+
+class TestIncrementalAggregation(unittest.TestCase):
+    def setUp(self):
+        self.rows = (
+            (Decimal('1.1'), Decimal('2.19'), 'a', None),
+            (Decimal('2.7'), Decimal('3.42'), 'bb', None),
+            (None, Decimal('4.1'), 'c', None),
+            (Decimal('2.7'), Decimal('3.42'), None, None),
+            (Decimal('-0.5'), Decimal('5.125'), 'dddd', None),
+        )
+
+        self.number_type = Number()
+        self.text_type = Text()
+
+        self.column_names = ['one', 'two', 'three', 'four']
+        self.column_types = [self.number_type, self.number_type, self.text_type, self.number_type]
+
+        self.table = Table(self.rows, self.column_names, self.column_types)
+
+    def accumulate(self, aggregation, rows):
+        state = aggregation.init(self.table)
+        column_name = aggregation.get_column_name()
+
+        for row in rows:
+            state = aggregation.update(state, row if column_name is None else row[column_name])
+
+        return state
+
+    def assertIncremental(self, aggregation, places=None):
+        expected = aggregation.run(self.table)
+        rows = self.table.rows
+
+        results = [aggregation.finalize(self.accumulate(aggregation, rows))]
+
+        for i in range(len(rows) + 1):
+            state = self.accumulate(aggregation, rows[:i])
+            other = self.accumulate(aggregation, rows[i:])
+            results.append(aggregation.finalize(aggregation.merge(state, other)))
+
+        for result in results:
+            if places is None:
+                self.assertEqual(result, expected)
+                self.assertIs(type(result), type(expected))
+            else:
+                self.assertEqual(result.quantize(places), expected.quantize(places))
+
+    def test_count(self):
+        self.assertIncremental(Count())
+        self.assertIncremental(Count('one'))
+        self.assertIncremental(Count('one', Decimal('2.7')))
+        self.assertIncremental(Count('one', None))
+
+    def test_sum(self):
+        self.assertIncremental(Sum('one'))
+        self.assertIncremental(Sum('four'))
+
+    def test_min_max(self):
+        self.assertIncremental(Min('one'))
+        self.assertIncremental(Max('two'))
+        self.assertIncremental(Min('four'))
+
+    def test_mean(self):
+        self.assertIncremental(Mean('one'))
+        self.assertIncremental(Mean('two'))
+        self.assertIncremental(Mean('four'))
+
+    def test_variance(self):
+        self.assertIncremental(Variance('one'), Decimal('0.000000000001'))
+        self.assertIncremental(PopulationVariance('two'), Decimal('0.000000000001'))
+        self.assertIncremental(Variance('four'))
+
+    def test_variance_state_size(self):
+        table = Table([(Decimal(i) / 7,) for i in range(10000)], ['one'], [self.number_type])
+        aggregation = Variance('one')
+
+        small = self.accumulate(aggregation, table.rows[:10])
+        large = self.accumulate(aggregation, table.rows)
+
+        self.assertEqual(len(small), len(large))
+        self.assertEqual(len(aggregation.merge(small, large)), len(large))
+
+    def test_stdev(self):
+        self.assertIncremental(StDev('one'), Decimal('0.000000000001'))
+        self.assertIncremental(PopulationStDev('two'), Decimal('0.000000000001'))
+        self.assertIncremental(StDev('four'))
+
+    def test_all_any(self):
+        self.assertIncremental(All('one', lambda d: d is not None))
+        self.assertIncremental(All('two', lambda d: d > 0))
+        self.assertIncremental(Any('one', Decimal('2.7')))
+        self.assertIncremental(Any('three', 'e'))
+
+    def test_has_nulls(self):
+        self.assertIncremental(HasNulls('one'))
+        self.assertIncremental(HasNulls('two'))
+
+    def test_max_length(self):
+        self.assertIncremental(MaxLength('three'))
+
+    def test_max_precision(self):
+        self.assertIncremental(MaxPrecision('one'))
+        self.assertIncremental(MaxPrecision('two'))
+        self.assertIncremental(MaxPrecision('four'))
+
+    def test_first(self):
+        self.assertIncremental(First('one'))
+        self.assertIncremental(First('one', lambda d: d is None))
+        self.assertIncremental(First('two', lambda d: d > 4))
+
+        with self.assertRaises(ValueError):
+            First('one', lambda d: d == 5).finalize(self.accumulate(First('one', lambda d: d == 5), self.table.rows))
+
+    def test_approx_percentiles(self):
+        self.assertIncremental(ApproxPercentiles('one'))
+        self.assertIncremental(ApproxPercentiles('four'))
+        self.assertIncremental(ApproxMedian('two'))
+
+    def test_approx_count_distinct(self):
+        self.assertIncremental(ApproxCountDistinct('one'))
+        self.assertIncremental(ApproxCountDistinct('three', precision=4))
+
+    def test_unsupported(self):
+        with self.assertRaises(UnsupportedAggregationError):
+            Median('one').init(self.table)
@@ -1,4 +1,5 @@
 import pickle
+import sys
 import unittest
 from decimal import Decimal
 
@@ -92,6 +93,16 @@ class TestColumn(unittest.TestCase):
             [Decimal('1'), Decimal('2')]
         )
 
+    def test_has_nulls(self):
+        self.assertTrue(self.table.columns['one'].has_nulls())
+        self.assertFalse(self.table.columns['two'].has_nulls())
+
+        column = self.table.columns['one']
+        column.enable_cache()
+
+        self.assertTrue(column.has_nulls())
+        self.assertTrue(column._cache['has_nulls'])
+
     def test_values_sorted(self):
         rows = (
             (2, 2, 'a'),
@@ -119,3 +130,58 @@ class TestColumn(unittest.TestCase):
             table.columns['one'].values_without_nulls_sorted(),
             [Decimal('1'), Decimal('2')]
         )
+
+    def test_sort_order(self):
+        rows = (
+            (2, 2, 'b'),
+            (None, 3, 'a'),
+            (1, 4, 'b'),
+            (2, 5, 'a')
+        )
+
+        table = Table(rows, self.column_names, self.column_types)
+
+        self.assertSequenceEqual(table.columns['one'].sort_order(), [2, 0, 3, 1])
+        self.assertSequenceEqual(table.columns['three'].sort_order(), [1, 3, 0, 2])
+
+        column = table.columns['one']
+        column.enable_cache()
+
+        self.assertIs(column.sort_order(), column.sort_order())
+        self.assertSequenceEqual(column.values_without_nulls_sorted(), [Decimal('1'), Decimal('2'), Decimal('2')])
+        self.assertSequenceEqual(column.values_sorted(), [Decimal('1'), Decimal('2'), Decimal('2'), None])
+
+    def test_enable_cache(self):
+        column = self.table.columns['one']
+
+        self.assertIsNot(column.values(), column.values())
+
+        self.assertFalse(column.cache_enabled)
+
+        column.enable_cache()
+
+        self.assertTrue(column.cache_enabled)
+        self.assertIs(column.values(), column.values())
+        self.assertIs(column.values_without_nulls_sorted(), column.values_without_nulls_sorted())
+        self.assertSequenceEqual(column.values(), (Decimal('1'), Decimal('2'), None))
+
+        restored = pickle.loads(pickle.dumps(column))
+
+        self.assertIsNot(restored.values(), restored.values())
+
+    def test_memory_usage(self):
+        column = self.table.columns['three']
+
+        self.assertEqual(column.memory_usage(), sum(sys.getsizeof(v) for v in column.values()))
+        self.assertEqual(column.memory_usage(deep=False), 0)
+
+        column = self.table.columns['one']
+        values = sum(sys.getsizeof(v) for v in column.values_without_nulls())
+
+        self.assertEqual(column.memory_usage(), values)
+
+        column.enable_cache()
+        column.values()
+
+        self.assertEqual(column.memory_usage(deep=False), sys.getsizeof(column.values()))
+        self.assertEqual(column.memory_usage(), values + sys.getsizeof(column.values()))
@@ -0,0 +1,69 @@
+import gzip
+import io
+import os
+
+from agate import config
+from agate.compression import add_extension, infer_compression, open_input, open_output, strip_extension
+from agate.testcase import AgateTestCase
+
+
+class TestCompression(AgateTestCase):
+    def test_infer_compression(self):
+        self.assertEqual(infer_compression('data.csv.gz'), 'gzip')
+        self.assertEqual(infer_compression('data.csv.BZ2'), 'bz2')
+        self.assertEqual(infer_compression('data.csv.xz'), 'lzma')
+        self.assertEqual(infer_compression('data.csv.lzma'), 'lzma')
+        self.assertIsNone(infer_compression('data.csv'))
+        self.assertIsNone(infer_compression(io.StringIO()))
+
+    def test_infer_compression_explicit(self):
+        self.assertEqual(infer_compression('data.csv', 'gzip'), 'gzip')
+        self.assertIsNone(infer_compression('data.csv.gz', None))
+
+    def test_infer_compression_invalid(self):
+        with self.assertRaises(ValueError):
+            infer_compression('data.csv', 'zip')
+
+    def test_extension(self):
+        self.assertEqual(add_extension('data.csv', 'gzip'), 'data.csv.gz')
+        self.assertEqual(add_extension('data.csv', 'lzma'), 'data.csv.xz')
+        self.assertEqual(add_extension('data.csv', None), 'data.csv')
+        self.assertEqual(add_extension('data.csv', 'infer'), 'data.csv')
+        self.assertEqual(strip_extension('data.csv.bz2'), 'data.csv')
+        self.assertEqual(strip_extension('data.csv'), 'data.csv')
+
+    def test_open(self):
+        for compression in ('gzip', 'bz2', 'lzma'):
+            path = add_extension('.test.txt', compression)
+
+            with open_output(path, encoding='utf-8') as f:
+                f.write('a,👍\n' * 1000)
+
+            with open_input(path) as f:
+                self.assertEqual(f.read(), 'a,👍\n' * 1000)
+
+            os.remove(path)
+
+    def test_open_output_compressed(self):
+        with open_output('.test.txt', compression='gzip') as f:
+            f.write('abc')
+
+        with gzip.open('.test.txt', 'rt') as f:
+            self.assertEqual(f.read(), 'abc')
+
+        os.remove('.test.txt')
+
+    def test_open_without_threads(self):
+        config.set_options({'read_ahead': 0, 'write_behind': 0})
+
+        try:
+            for path in ('.test.txt', '.test.txt.gz'):
+                with open_output(path, encoding='utf-8') as f:
+                    f.write('abc\n')
+
+                with open_input(path) as f:
+                    self.assertEqual(f.read(), 'abc\n')
+
+                os.remove(path)
+        finally:
+            config.set_options({'read_ahead': 8, 'write_behind': 8})
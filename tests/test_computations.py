@@ -4,7 +4,9 @@ import warnings
 from decimal import Decimal
 
 from agate import Table
-from agate.computations import Change, Formula, Percent, PercentChange, PercentileRank, Rank, Slug
+from agate.computations import (Change, CumulativeSum, Expression, Formula, Lag, Lead, Percent, PercentChange,
+                                PercentileRank, Rank, RollingMax, RollingMean, RollingMin, RollingSum, RowNumber, Slug,
+                                col, lit)
 from agate.data_types import Boolean, Date, DateTime, Number, Text, TimeDelta
 from agate.exceptions import CastError, DataTypeError
 from agate.warns import NullCalculationWarning
@@ -332,6 +334,50 @@ class TestTableComputation(unittest.TestCase):
         self.assertEqual(len(new_table.columns), 5)
         self.assertSequenceEqual(new_table.columns['rank'], (1, 3, 1, 3))
 
+    def test_rank_methods(self):
+        rows = [(3,), (1,), (2,), (None,), (1,), (3,)]
+        table = Table(rows, ['n'], [self.number_type])
+
+        new_table = table.compute([
+            ('min', Rank('n')),
+            ('dense', Rank('n', method='dense')),
+            ('ordinal', Rank('n', method='ordinal')),
+            ('average', Rank('n', method='average')),
+            ('reverse', Rank('n', reverse=True, method='ordinal'))
+        ])
+
+        self.assertSequenceEqual(new_table.columns['min'], (4, 1, 3, 6, 1, 4))
+        self.assertSequenceEqual(new_table.columns['dense'], (3, 1, 2, 4, 1, 3))
+        self.assertSequenceEqual(new_table.columns['ordinal'], (4, 1, 3, 6, 2, 5))
+        self.assertSequenceEqual(new_table.columns['average'], (
+            Decimal('4.5'), Decimal('1.5'), Decimal('3'), Decimal('6'), Decimal('1.5'), Decimal('4.5')
+        ))
+        self.assertSequenceEqual(new_table.columns['reverse'], (1, 4, 3, 6, 5, 2))
+
+    def test_rank_comparer_ties(self):
+        rows = [(1,), (-1,), (2,), (1,)]
+        table = Table(rows, ['n'], [self.number_type])
+
+        new_table = table.compute([
+            ('rank', Rank('n', comparer=lambda x, y: int(abs(x) - abs(y)))),
+        ])
+
+        self.assertSequenceEqual(new_table.columns['rank'], (1, 1, 4, 1))
+
+    def test_rank_comparer_reverse_ordinal_ties(self):
+        rows = [(1,), (-1,), (2,), (1,)]
+        table = Table(rows, ['n'], [self.number_type])
+
+        new_table = table.compute([
+            ('rank', Rank('n', comparer=lambda x, y: int(abs(x) - abs(y)), reverse=True, method='ordinal')),
+        ])
+
+        self.assertSequenceEqual(new_table.columns['rank'], (2, 3, 1, 4))
+
+    def test_rank_invalid_method(self):
+        with self.assertRaises(ValueError):
+            Rank('two', method='max')
+
     def test_rank_text(self):
         new_table = self.table.compute([
             ('rank', Rank('one'))
@@ -513,3 +559,227 @@ class TestDateAndTimeComputations(unittest.TestCase):
         self.assertEqual(new_table.columns['test'][0], datetime.timedelta(minutes=4, seconds=3))
         self.assertEqual(new_table.columns['test'][1], datetime.timedelta(hours=-2, minutes=-2))
         self.assertEqual(new_table.columns['test'][2], datetime.timedelta(days=-1))
+
+
+class TestWindowComputations(unittest.TestCase):
+    def setUp(self):
+        self.rows = (
+            ('a', 3, datetime.date(2020, 1, 3)),
+            ('b', 1, datetime.date(2020, 1, 1)),
+            ('c', None, datetime.date(2020, 1, 4)),
+            ('d', 4, datetime.date(2020, 1, 2)),
+            ('e', 2, datetime.date(2020, 1, 5))
+        )
+
+        self.column_names = ['letter', 'number', 'date']
+        self.column_types = [Text(), Number(), Date()]
+
+        self.table = Table(self.rows, self.column_names, self.column_types)
+
+    def compute(self, computation):
+        return self.table.compute([('test', computation)]).columns['test'].values()
+
+    def test_rolling_sum(self):
+        self.assertSequenceEqual(self.compute(RollingSum('number', 2)), [None, 4, None, None, 6])
+        self.assertSequenceEqual(self.compute(RollingSum('number', 2, min_periods=1)), [3, 4, 1, 4, 6])
+        self.assertSequenceEqual(self.compute(RollingSum('number', 1)), [3, 1, None, 4, 2])
+
+    def test_rolling_mean(self):
+        self.assertSequenceEqual(self.compute(RollingMean('number', 2)), [None, 2, None, None, 3])
+        self.assertSequenceEqual(
+            self.compute(RollingMean('number', 3, min_periods=2)),
+            [None, 2, 2, Decimal('2.5'), 3]
+        )
+
+    def test_rolling_min_max(self):
+        self.assertSequenceEqual(self.compute(RollingMin('number', 3, min_periods=1)), [3, 1, 1, 1, 2])
+        self.assertSequenceEqual(self.compute(RollingMax('number', 3, min_periods=1)), [3, 3, 3, 4, 4])
+        self.assertSequenceEqual(self.compute(RollingMax('number', 2)), [None, 3, None, None, 4])
+        self.assertSequenceEqual(self.compute(RollingMin('date', 2)), [
+            None,
+            datetime.date(2020, 1, 1),
+            datetime.date(2020, 1, 1),
+            datetime.date(2020, 1, 2),
+            datetime.date(2020, 1, 2)
+        ])
+
+    def test_rolling_matches_naive(self):
+        values = [Decimal(v) for v in (5, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9)]
+        table = Table([[v] for v in values], ['number'], [Number()])
+
+        for window in range(1, 5):
+            new_table = table.compute([
+                ('sum', RollingSum('number', window, min_periods=1)),
+                ('min', RollingMin('number', window, min_periods=1)),
+                ('max', RollingMax('number', window, min_periods=1))
+            ])
+
+            for i, row in enumerate(new_table.rows):
+                values_in_window = values[max(0, i - window + 1):i + 1]
+
+                self.assertEqual(row['sum'], sum(values_in_window))
+                self.assertEqual(row['min'], min(values_in_window))
+                self.assertEqual(row['max'], max(values_in_window))
+
+    def test_rolling_invalid(self):
+        with self.assertRaises(ValueError):
+            RollingSum('number', 0)
+
+        with self.assertRaises(ValueError):
+            RollingSum('number', 2, min_periods=3)
+
+        with self.assertRaises(DataTypeError):
+            self.compute(RollingMean('letter', 2))
+
+        with self.assertRaises(DataTypeError):
+            self.compute(RollingMax('letter', 2))
+
+    def test_cumulative_sum(self):
+        self.assertSequenceEqual(self.compute(CumulativeSum('number')), [3, 4, None, 8, 10])
+
+        with self.assertRaises(DataTypeError):
+            self.compute(CumulativeSum('letter'))
+
+    def test_lag(self):
+        self.assertSequenceEqual(self.compute(Lag('letter')), [None, 'a', 'b', 'c', 'd'])
+        self.assertSequenceEqual(self.compute(Lag('letter', 2, default='-')), ['-', '-', 'a', 'b', 'c'])
+        self.assertSequenceEqual(self.compute(Lag('letter', 0)), ['a', 'b', 'c', 'd', 'e'])
+        self.assertSequenceEqual(self.compute(Lag('letter', 10)), [None] * 5)
+
+        with self.assertRaises(ValueError):
+            Lag('letter', -1)
+
+    def test_lead(self):
+        self.assertSequenceEqual(self.compute(Lead('letter')), ['b', 'c', 'd', 'e', None])
+        self.assertSequenceEqual(self.compute(Lead('letter', 2, default='-')), ['c', 'd', 'e', '-', '-'])
+        self.assertSequenceEqual(self.compute(Lead('letter', 10)), [None] * 5)
+
+    def test_row_number(self):
+        self.assertSequenceEqual(self.compute(RowNumber()), [1, 2, 3, 4, 5])
+        self.assertSequenceEqual(self.compute(RowNumber(order_by='date')), [3, 1, 4, 2, 5])
+
+    def test_order_by(self):
+        self.assertSequenceEqual(self.compute(Lag('letter', order_by='date')), ['d', None, 'a', 'b', 'c'])
+        self.assertSequenceEqual(self.compute(CumulativeSum('number', order_by='date')), [8, 1, None, 5, 10])
+        self.assertSequenceEqual(self.compute(RollingSum('number', 2, order_by='date')), [7, None, None, 5, None])
+
+        # Nulls are ordered last
+        self.assertSequenceEqual(self.compute(RowNumber(order_by='number')), [3, 1, 5, 4, 2])
+        self.assertSequenceEqual(self.compute(RowNumber(order_by=['number', 'letter'])), [3, 1, 5, 4, 2])
+        self.assertSequenceEqual(self.compute(RowNumber(order_by=lambda r: r['letter'])), [1, 2, 3, 4, 5])
+
+    def test_empty(self):
+        table = Table([], self.column_names, self.column_types)
+
+        new_table = table.compute([
+            ('sum', RollingSum('number', 2)),
+            ('lag', Lag('letter', order_by='date')),
+            ('row_number', RowNumber())
+        ])
+
+        self.assertEqual(len(new_table.rows), 0)
+
+
+class TestExpression(unittest.TestCase):
+    def setUp(self):
+        self.rows = (
+            ('a', 2, 3, datetime.date(2020, 1, 2)),
+            (None, 3, 5, datetime.date(2020, 1, 1)),
+            ('a', 2, None, None),
+            ('b', 3, 4, datetime.date(2020, 2, 1))
+        )
+
+        self.number_type = Number()
+        self.text_type = Text()
+
+        self.column_names = ['one', 'two', 'three', 'four']
+        self.column_types = [self.text_type, self.number_type, self.number_type, Date()]
+
+        self.table = Table(self.rows, self.column_names, self.column_types)
+
+    def assertEvaluates(self, expression, expected):
+        self.assertSequenceEqual(expression.evaluate(self.table), expected)
+        self.assertSequenceEqual([expression(row) for row in self.table.rows], expected)
+
+    def test_arithmetic(self):
+        self.assertEvaluates(col('two') + col('three'), [Decimal('5'), Decimal('8'), None, Decimal('7')])
+        self.assertEvaluates(col('three') - 1, [Decimal('2'), Decimal('4'), None, Decimal('3')])
+        self.assertEvaluates(10 - col('two'), [Decimal('8'), Decimal('7'), Decimal('8'), Decimal('7')])
+        self.assertEvaluates(col('two') * 1.5, [Decimal('3.0'), Decimal('4.5'), Decimal('3.0'), Decimal('4.5')])
+        self.assertEvaluates(col('three') / col('two'), [Decimal('1.5'), Decimal(5) / 3, None, Decimal(4) / 3])
+        self.assertEvaluates(col('three') // 2, [Decimal('1'), Decimal('2'), None, Decimal('2')])
+        self.assertEvaluates(col('three') % 2, [Decimal('1'), Decimal('1'), None, Decimal('0')])
+        self.assertEvaluates(col('two') ** 2, [Decimal('4'), Decimal('9'), Decimal('4'), Decimal('9')])
+        self.assertEvaluates(-col('two'), [Decimal('-2'), Decimal('-3'), Decimal('-2'), Decimal('-3')])
+        self.assertEvaluates(col('one') + '!', ['a!', None, 'a!', 'b!'])
+        self.assertEvaluates(col('two') + None, [None, None, None, None])
+
+    def test_comparison(self):
+        self.assertEvaluates(col('two') == 2, [True, False, True, False])
+        self.assertEvaluates(col('two') != 2, [False, True, False, True])
+        self.assertEvaluates(col('three') > col('two'), [True, True, None, True])
+        self.assertEvaluates(col('three') >= 4, [False, True, None, True])
+        self.assertEvaluates(col('three') < 4, [True, False, None, False])
+        self.assertEvaluates(4 <= col('three'), [False, True, None, True])
+        self.assertEvaluates(col('four') < datetime.date(2020, 1, 2), [False, True, None, False])
+
+    def test_logical(self):
+        self.assertEvaluates((col('two') == 2) & (col('one') == 'a'), [True, False, True, False])
+        self.assertEvaluates((col('two') == 2) | (col('three') > 4), [True, True, True, False])
+        self.assertEvaluates(~(col('three') > 3), [True, False, True, False])
+        self.assertEvaluates(col('three').is_null(), [False, False, True, False])
+        self.assertEvaluates(col('one').is_in(['b', None]), [False, True, False, True])
+
+        with self.assertRaises(TypeError):
+            bool(col('two') > 2)
+
+        with self.assertRaises(TypeError):
+            col('two') > 2 and col('three') > 2
+
+    def test_data_types(self):
+        self.assertIsInstance((col('two') + 1).get_data_type(self.table), Number)
+        self.assertIsInstance((col('two') > 1).get_data_type(self.table), Boolean)
+        self.assertIsInstance((col('one') + 'x').get_data_type(self.table), Text)
+        self.assertIsInstance((col('four') - col('four')).get_data_type(self.table), TimeDelta)
+        self.assertIsInstance((col('four') + datetime.timedelta(days=1)).get_data_type(self.table), Date)
+        self.assertIsInstance((datetime.timedelta(days=1) * col('two')).get_data_type(self.table), TimeDelta)
+        self.assertIsInstance(lit(True).get_data_type(self.table), Boolean)
+        self.assertIsInstance(lit(datetime.datetime(2020, 1, 1)).get_data_type(self.table), DateTime)
+        self.assertIsNone(lit(None).get_data_type(self.table))
+
+        with self.assertRaises(DataTypeError):
+            (col('one') * col('two')).validate(self.table)
+
+        with self.assertRaises(DataTypeError):
+            (col('four') * 2).validate(self.table)
+
+        with self.assertRaises(KeyError):
+            (col('five') + 1).validate(self.table)
+
+    def test_compute(self):
+        new_table = self.table.compute([
+            ('total', col('two') + col('three')),
+            ('big', col('three') > 3),
+        ])
+
+        self.assertSequenceEqual(new_table.column_names, self.column_names + ['total', 'big'])
+        self.assertIsInstance(new_table.column_types[4], Number)
+        self.assertIsInstance(new_table.column_types[5], Boolean)
+        self.assertSequenceEqual(new_table.columns['total'], [Decimal('5'), Decimal('8'), None, Decimal('7')])
+        self.assertSequenceEqual(new_table.columns['big'], [False, True, None, True])
+
+        expected = self.table.compute([
+            ('total', Formula(self.number_type, lambda r: r['two'] + r['three'] if r['three'] is not None else None))
+        ])
+
+        self.assertSequenceEqual(
+            new_table.columns['total'].values(),
+            expected.columns['total'].values()
+        )
+
+    def test_str(self):
+        expression = ((col('two') + 1) > col('three')) & ~col('one').is_null()
+
+        self.assertIsInstance(expression, Expression)
+        self.assertEqual(str(expression), "(((col('two') + 1) > col('three')) & ~col('one').is_null())")
+        self.assertEqual(repr(lit(1)), '<agate.Expression: 1>')
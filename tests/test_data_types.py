@@ -1,5 +1,6 @@
 import datetime
 import pickle
+import threading
 import unittest
 from decimal import Decimal
 from zoneinfo import ZoneInfo
@@ -196,6 +197,18 @@ class TestNumber(unittest.TestCase):
         with self.assertRaises(CastError):
             data_type.cast('00.11')
 
+    def test_shared_locale(self):
+        self.assertIs(Number().locale, self.type.locale)
+        self.assertIsNot(Number(locale='de_DE').locale, self.type.locale)
+
+    def test_pickle_locale(self):
+        data_type = Number(locale='de_DE', group_symbol=' ')
+        from_pickle = pickle.loads(pickle.dumps(data_type))
+
+        self.assertIs(from_pickle.locale, data_type.locale)
+        self.assertEqual(from_pickle.group_symbol, ' ')
+        self.assertEqual(from_pickle.decimal_symbol, ',')
+
 
 class TestDate(unittest.TestCase):
     def setUp(self):
@@ -311,6 +324,22 @@ class TestDate(unittest.TestCase):
         self.assertEqual(from_pickle.locale, self.type.locale)
         self.assertIsInstance(from_pickle._constants, parsedatetime.Constants)
         self.assertIsInstance(from_pickle._parser, parsedatetime.Calendar)
+        self.assertIs(from_pickle._parser, self.type._parser)
+
+    def test_shared_parser(self):
+        self.assertIs(Date()._constants, self.type._constants)
+        self.assertIs(Date()._parser, self.type._parser)
+        self.assertIs(DateTime()._parser, self.type._parser)
+        self.assertIsNot(Date(locale='fr_FR')._parser, self.type._parser)
+
+    def test_parser_per_thread(self):
+        parsers = []
+        thread = threading.Thread(target=lambda: parsers.append(Date()._parser))
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(parsers[0], self.type._parser)
+        self.assertIs(parsers[0].ptc, self.type._constants)
 
 
 class TestDateTime(unittest.TestCase):
@@ -0,0 +1,92 @@
+import os
+import random
+import unittest
+from io import StringIO
+
+from agate import Table, external_sort
+from agate.data_types import Number, Text
+
+
+class TestExternalSort(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+
+        rows = []
+
+        for i in range(250):
+            rows.append((
+                random.choice([None, random.randint(0, 20)]),
+                random.choice(['a', 'b', 'c', None]),
+                i
+            ))
+
+        self.column_names = ['one', 'two', 'three']
+        self.column_types = [Number(), Text(), Number()]
+
+        self.table = Table(rows, self.column_names, self.column_types)
+
+        self.input = StringIO()
+        self.table.to_csv(self.input)
+        self.input.seek(0)
+
+    def expected(self, key, reverse=False):
+        output = StringIO()
+        self.table.order_by(key, reverse=reverse).to_csv(output)
+
+        return output.getvalue()
+
+    def test_external_sort(self):
+        output = StringIO()
+        external_sort(self.input, 'one', output, column_types=self.column_types, run_size=30)
+
+        self.assertEqual(output.getvalue(), self.expected('one'))
+
+    def test_external_sort_reverse(self):
+        output = StringIO()
+        external_sort(self.input, 'one', output, reverse=True, column_types=self.column_types, run_size=30)
+
+        self.assertEqual(output.getvalue(), self.expected('one', reverse=True))
+
+    def test_external_sort_multiple_columns(self):
+        output = StringIO()
+        external_sort(self.input, ['two', 'one'], output, column_types=self.column_types, run_size=7)
+
+        self.assertEqual(output.getvalue(), self.expected(['two', 'one']))
+
+    def test_external_sort_function(self):
+        def key(row):
+            return row['three'] % 7
+
+        output = StringIO()
+        external_sort(self.input, key, output, column_types=self.column_types, run_size=50)
+
+        self.assertEqual(output.getvalue(), self.expected(key))
+
+    def test_external_sort_single_run(self):
+        output = StringIO()
+        external_sort(self.input, 'one', output, column_types=self.column_types)
+
+        self.assertEqual(output.getvalue(), self.expected('one'))
+
+    def test_external_sort_infer_types(self):
+        output = StringIO()
+        external_sort(self.input, 'three', output, reverse=True, run_size=100)
+
+        self.assertEqual(output.getvalue(), self.expected('three', reverse=True))
+
+    def test_external_sort_paths(self):
+        external_sort('examples/test.csv', 'text', '.test-external-sort.csv', run_size=2)
+
+        with open('.test-external-sort.csv') as f:
+            contents = f.read()
+
+        os.remove('.test-external-sort.csv')
+
+        output = StringIO()
+        Table.from_csv('examples/test.csv').order_by('text').to_csv(output)
+
+        self.assertEqual(contents, output.getvalue())
+
+    def test_external_sort_invalid_run_size(self):
+        with self.assertRaises(ValueError):
+            external_sort(self.input, 'one', StringIO(), run_size=0)
@@ -1,3 +1,6 @@
+import lzma
+import os
+
 from agate import Table
 from agate.data_types import Boolean, Date, DateTime, Number, Text, TimeDelta
 from agate.rows import Row
@@ -29,6 +32,20 @@ class TestJSON(AgateTestCase):
         self.assertColumnTypes(table2, [Number, Text, Boolean, Date, DateTime, TimeDelta])
         self.assertRows(table2, table1.rows)
 
+    def test_from_json_compression(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+
+        with open('examples/test.json', 'rb') as f, lzma.open('.test.json.xz', 'wb') as g:
+            g.write(f.read())
+
+        table2 = Table.from_json('.test.json.xz')
+
+        self.assertColumnNames(table2, self.column_names)
+        self.assertColumnTypes(table2, [Number, Text, Boolean, Date, DateTime, TimeDelta])
+        self.assertRows(table2, table1.rows)
+
+        os.remove('.test.json.xz')
+
     def test_from_json_file_like_object(self):
         table1 = Table(self.rows, self.column_names, self.column_types)
 
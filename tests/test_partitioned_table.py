@@ -0,0 +1,214 @@
+import os
+import random
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from io import StringIO
+
+from agate import PartitionedTable, Table
+from agate.aggregations import ApproxMedian, Count, Max, Mean, Median, Sum
+from agate.computations import Formula
+from agate.data_types import Number, Text
+from agate.exceptions import UnsupportedAggregationError
+from agate.testcase import AgateTestCase
+
+
+def double(row):
+    return row['one'] * 2 if row['one'] is not None else None
+
+
+class TestPartitionedTable(AgateTestCase):
+    def setUp(self):
+        random.seed(0)
+
+        self.rows = []
+
+        for i in range(100):
+            self.rows.append((
+                random.choice([None, Decimal(random.randint(0, 20))]),
+                random.choice(['a', 'b', 'c', None]),
+                Decimal(i)
+            ))
+
+        self.column_names = ['one', 'two', 'three']
+        self.column_types = [Number(), Text(), Number()]
+
+        self.table = Table(self.rows, self.column_names, self.column_types)
+
+        self.input = StringIO()
+        self.table.to_csv(self.input)
+
+    def partition(self, chunk_rows=30, **kwargs):
+        self.input.seek(0)
+
+        return PartitionedTable.from_csv(self.input, column_types=self.column_types, chunk_rows=chunk_rows, **kwargs)
+
+    def assertColumns(self, partitioned, names, types):
+        self.assertSequenceEqual(partitioned.column_names, names)
+        self.assertSequenceEqual([type(t) for t in partitioned.column_types], types)
+
+    def assertTableEqual(self, partitioned, table):
+        self.assertColumns(partitioned, table.column_names, [type(t) for t in table.column_types])
+        self.assertSequenceEqual([tuple(row) for row in partitioned], [tuple(row) for row in table.rows])
+
+    def test_from_csv(self):
+        partitioned = self.partition()
+
+        self.assertEqual(len(partitioned), 100)
+        self.assertEqual([len(chunk) for chunk in partitioned.iter_chunks()], [30, 30, 30, 10])
+        self.assertTableEqual(partitioned, self.table)
+
+    def test_from_csv_exact_chunks(self):
+        partitioned = self.partition(25)
+
+        self.assertEqual([len(chunk) for chunk in partitioned.iter_chunks()], [25, 25, 25, 25])
+
+    def test_from_csv_infer_types(self):
+        self.input.seek(0)
+
+        partitioned = Table.from_csv(self.input, chunk_rows=40)
+
+        self.assertIsInstance(partitioned, PartitionedTable)
+        self.assertColumns(partitioned, self.column_names, [Number, Text, Number])
+        self.assertTableEqual(partitioned, self.table)
+
+    def test_from_csv_empty(self):
+        partitioned = PartitionedTable.from_csv(StringIO('one,two\n'), chunk_rows=10)
+
+        self.assertEqual(len(partitioned), 0)
+        self.assertSequenceEqual(partitioned.column_names, ['one', 'two'])
+        self.assertEqual(len(list(partitioned.iter_chunks())), 1)
+
+    def test_from_csv_invalid(self):
+        with self.assertRaises(ValueError):
+            self.partition(0)
+
+        with self.assertRaises(ValueError):
+            Table.from_csv(self.input, chunk_rows=10, row_names='three')
+
+    def test_mismatched_chunks(self):
+        with self.assertRaises(ValueError):
+            PartitionedTable([self.table, self.table.select(['one'])])
+
+        with self.assertRaises(ValueError):
+            PartitionedTable([])
+
+    def test_on_disk(self):
+        partitioned = self.partition(on_disk=True)
+
+        self.assertEqual(len(partitioned), 100)
+        self.assertTableEqual(partitioned, self.table)
+        self.assertTableEqual(partitioned.where(lambda row: row['two'] == 'a'),
+                              self.table.where(lambda row: row['two'] == 'a'))
+
+    def test_where_select_exclude(self):
+        partitioned = self.partition()
+
+        self.assertTableEqual(partitioned.where(lambda row: row['two'] == 'a'),
+                              self.table.where(lambda row: row['two'] == 'a'))
+        self.assertTableEqual(partitioned.select(['two', 'one']), self.table.select(['two', 'one']))
+        self.assertTableEqual(partitioned.exclude(['two']), self.table.exclude(['two']))
+
+    def test_compute(self):
+        computations = [('double', Formula(Number(), double))]
+
+        self.assertTableEqual(self.partition().compute(computations), self.table.compute(computations))
+
+    def test_with_executor(self):
+        computations = [('double', Formula(Number(), double))]
+
+        with ThreadPoolExecutor(2) as executor:
+            partitioned = self.partition(7).with_executor(executor)
+            computed = partitioned.compute(computations)
+
+            self.assertIs(computed._executor, executor)
+            self.assertTableEqual(computed, self.table.compute(computations))
+            self.assertEqual(partitioned.aggregate(Sum('three')), Decimal('4950'))
+
+    def test_aggregate(self):
+        aggregations = [
+            ('count', Count()),
+            ('sum', Sum('one')),
+            ('max', Max('three')),
+            ('mean', Mean('one')),
+        ]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+
+            self.assertEqual(self.partition().aggregate(aggregations), self.table.aggregate(aggregations))
+            self.assertEqual(self.partition().aggregate(Count('two', 'a')), self.table.aggregate(Count('two', 'a')))
+            self.assertEqual(self.partition(10).aggregate(ApproxMedian('three')), Decimal('49.5'))
+
+    def test_aggregate_validate_once(self):
+        validated = []
+
+        class CountValidated(Count):
+            def validate(self, table):
+                validated.append(table)
+
+        self.assertEqual(self.partition().aggregate(CountValidated()), 100)
+        self.assertEqual(len(validated), 1)
+
+    def test_aggregate_unsupported(self):
+        with self.assertRaises(UnsupportedAggregationError):
+            self.partition().aggregate(Median('one'))
+
+    def test_order_by(self):
+        partitioned = self.partition().order_by('one')
+
+        self.assertEqual([len(chunk) for chunk in partitioned.iter_chunks()], [30, 30, 30, 10])
+        self.assertTableEqual(partitioned, self.table.order_by('one'))
+        self.assertTableEqual(self.partition(7, on_disk=True).order_by(['two', 'one'], reverse=True),
+                              self.table.order_by(['two', 'one'], reverse=True))
+
+    def test_to_table(self):
+        table = self.partition().to_table()
+
+        self.assertIsInstance(table, Table)
+        self.assertTableEqual(self.partition(), table)
+
+    def test_to_csv(self):
+        output = StringIO()
+        self.partition().to_csv(output)
+
+        self.assertEqual(output.getvalue(), self.input.getvalue())
+
+    def test_to_csv_path(self):
+        self.partition().to_csv('.test-partitioned/test.csv')
+
+        with open('.test-partitioned/test.csv') as f:
+            contents = f.read()
+
+        os.remove('.test-partitioned/test.csv')
+        os.rmdir('.test-partitioned')
+
+        self.assertEqual(contents, self.input.getvalue())
+
+    def test_to_json(self):
+        for kwargs in [{}, {'indent': 4}, {'newline': True}, {'key': 'three'}, {'key': 'three', 'indent': '\t'},
+                       {'key': lambda row: str(row['three'] + 1)}, {'key': lambda row: int(row['three'])},
+                       {'key': 'three', 'sort_keys': True}, {'separators': (',', ':')}]:
+            output = StringIO()
+            self.partition().to_json(output, **kwargs)
+
+            expected = StringIO()
+            self.table.to_json(expected, **kwargs)
+
+            self.assertEqual(output.getvalue(), expected.getvalue())
+
+    def test_to_json_empty(self):
+        table = Table([], self.column_names, self.column_types)
+
+        for kwargs in [{}, {'indent': 4}, {'key': 'three'}]:
+            output = StringIO()
+            PartitionedTable([table]).to_json(output, **kwargs)
+
+            expected = StringIO()
+            table.to_json(expected, **kwargs)
+
+            self.assertEqual(output.getvalue(), expected.getvalue())
+
+    def test_to_json_key_not_unique(self):
+        with self.assertRaises(ValueError):
+            self.partition().to_json(StringIO(), key='two')
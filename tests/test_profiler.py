@@ -0,0 +1,156 @@
+import json
+import threading
+import unittest
+from io import StringIO
+
+import agate
+from agate.aggregations import Count, Sum
+from agate.computations import Formula, Rank
+from agate.data_types import Number, Text
+from agate.table import Table
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.rows = (
+            ('a', 1),
+            ('b', 2),
+            ('a', 3),
+            ('b', 4),
+            ('c', 5),
+        )
+
+        self.column_names = ['letter', 'number']
+        self.column_types = [Text(), Number()]
+
+        self.table = Table(self.rows, self.column_names, self.column_types)
+
+    def test_call_tree(self):
+        with agate.profile(memory=False) as profiler:
+            self.table.where(lambda row: row['number'] > 1).group_by('letter').aggregate([
+                ('count', Count()),
+                ('total', Sum('number')),
+            ])
+
+        self.assertEqual([node.name for node in profiler.calls], [
+            'Table.where',
+            'Table.group_by',
+            'TableSet.aggregate',
+        ])
+
+        where, group_by, aggregate = profiler.calls
+
+        self.assertEqual(where.rows_in, 5)
+        self.assertEqual(where.rows_out, 4)
+        self.assertEqual(where.columns, 2)
+        self.assertIsNone(where.memory)
+
+        self.assertEqual(group_by.rows_in, 4)
+        self.assertEqual(group_by.rows_out, 4)
+
+        self.assertEqual(aggregate.rows_out, 3)
+        self.assertEqual(aggregate.columns, 3)
+
+        names = [child.name for child in aggregate.children]
+
+        self.assertEqual(names.count('Count.run'), 3)
+        self.assertEqual(names.count('Sum.run'), 3)
+
+        for node in profiler.calls:
+            self.assertGreaterEqual(node.time, node.self_time)
+
+    def test_nested_calls(self):
+        with agate.profile(memory=False) as profiler:
+            self.table.compute([
+                ('double', Formula(Number(), lambda row: row['number'] * 2)),
+                ('rank', Rank('number')),
+            ])
+
+        compute, = profiler.calls
+
+        self.assertEqual(compute.name, 'Table.compute')
+        self.assertEqual(compute.columns, 4)
+        self.assertEqual([child.name for child in compute.children], ['Rank.run'])
+        self.assertEqual(compute.children[0].rows_in, 5)
+
+    def test_memory(self):
+        with agate.profile() as profiler:
+            self.table.select(['number'])
+
+        self.assertIsInstance(profiler.calls[0].memory, int)
+
+    def test_threads(self):
+        with agate.profile(memory=False) as profiler:
+            thread = threading.Thread(target=lambda: self.table.limit(2))
+            thread.start()
+            thread.join()
+
+        self.assertEqual([node.name for node in profiler.calls], ['Table.limit'])
+
+    def test_restores_methods(self):
+        where = Table.where
+        run = Sum.run
+
+        with agate.profile(memory=False):
+            self.assertIsNot(Table.where, where)
+            self.assertIsNot(Sum.run, run)
+
+        self.assertIs(Table.where, where)
+        self.assertIs(Sum.run, run)
+
+    def test_classmethod(self):
+        with agate.profile(memory=False) as profiler:
+            table = Table.from_csv('examples/test.csv')
+
+        self.assertIsInstance(table, Table)
+        self.assertEqual(profiler.calls[0].name, 'Table.from_csv')
+        self.assertIsNone(profiler.calls[0].rows_in)
+        self.assertEqual(profiler.calls[0].rows_out, 3)
+
+    def test_one_at_a_time(self):
+        with agate.profile(memory=False):
+            with self.assertRaises(ValueError):
+                agate.profile().start()
+
+        with agate.profile(memory=False) as profiler:
+            self.table.limit(1)
+
+        self.assertEqual(len(profiler.calls), 1)
+
+    def test_to_json(self):
+        with agate.profile(memory=False) as profiler:
+            self.table.group_by('letter').aggregate([('count', Count())])
+
+        output = StringIO()
+        profiler.to_json(output)
+        data = json.loads(output.getvalue())
+
+        self.assertEqual(data[1]['name'], 'TableSet.aggregate')
+        self.assertEqual(data[1]['rows_out'], 3)
+        self.assertEqual(data[1]['children'][0]['name'], 'Count.run')
+
+    def test_to_folded(self):
+        with agate.profile(memory=False) as profiler:
+            self.table.group_by('letter').aggregate([('count', Count())])
+
+        output = StringIO()
+        profiler.to_folded(output)
+        lines = output.getvalue().splitlines()
+
+        self.assertEqual([line.rsplit(' ', 1)[0] for line in lines], [
+            'Table.group_by',
+            'TableSet.aggregate',
+            'TableSet.aggregate;Count.run',
+        ])
+
+        for line in lines:
+            int(line.rsplit(' ', 1)[1])
+
+    def test_print_tree(self):
+        with agate.profile(memory=False) as profiler:
+            self.table.where(lambda row: row['number'] > 1)
+
+        output = StringIO()
+        profiler.print_tree(output)
+
+        self.assertRegex(output.getvalue(), r'^Table.where  \d+\.\d{3} ms  rows 5 -> 4  columns 2\n$')
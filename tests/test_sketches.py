@@ -0,0 +1,162 @@
+import datetime
+import random
+import unittest
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+
+from agate.sketches import HyperLogLog, KLLSketch, stable_hash
+
+
+class TestKLLSketch(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+
+        self.values = [random.random() for i in range(20000)]
+        self.sorted = sorted(self.values)
+        self.indices = list(range(0, 20000, 100)) + [19999]
+
+    def assertRankErrors(self, sketch, error):
+        estimates = sketch.values_at(self.indices)
+
+        for i, value in zip(self.indices, estimates):
+            low = bisect_left(self.sorted, value)
+            high = bisect_right(self.sorted, value)
+
+            self.assertLessEqual(max(low - i, i - high, 0), error * len(self.values))
+
+    def test_values_at(self):
+        sketch = KLLSketch(200)
+
+        for value in self.values:
+            sketch.update(value)
+
+        self.assertEqual(len(sketch), 20000)
+        self.assertLess(sketch._size, 1000)
+        self.assertRankErrors(sketch, 0.02)
+
+    def test_values_at_exact(self):
+        sketch = KLLSketch(200)
+
+        for value in [3, 1, 2]:
+            sketch.update(value)
+
+        self.assertEqual(sketch.values_at([0, 1, 2]), [1, 2, 3])
+
+    def test_values_at_bounds(self):
+        sketch = KLLSketch(50)
+
+        for value in self.values:
+            sketch.update(value)
+
+        self.assertEqual(sketch.values_at([0, 19999]), [self.sorted[0], self.sorted[-1]])
+
+        with self.assertRaises(IndexError):
+            sketch.values_at([20000])
+
+    def test_merge(self):
+        sketches = [KLLSketch(200) for i in range(7)]
+
+        for i, value in enumerate(self.values):
+            sketches[i % 7].update(value)
+
+        sketch = sketches[0]
+
+        for other in sketches[1:]:
+            sketch.merge(other)
+
+        self.assertEqual(len(sketch), 20000)
+        self.assertLess(sketch._size, 1000)
+        self.assertRankErrors(sketch, 0.02)
+
+    def test_merge_empty(self):
+        sketch = KLLSketch()
+        sketch.update(1)
+        sketch.merge(KLLSketch())
+
+        self.assertEqual(sketch.values_at([0]), [1])
+
+        empty = KLLSketch()
+        empty.merge(sketch)
+
+        self.assertEqual(empty.values_at([0]), [1])
+
+    def test_deterministic(self):
+        a = KLLSketch(20)
+        b = KLLSketch(20)
+
+        for value in self.values:
+            a.update(value)
+            b.update(value)
+
+        self.assertEqual(a.values_at(self.indices), b.values_at(self.indices))
+
+
+class TestHyperLogLog(unittest.TestCase):
+    def test_count_small(self):
+        sketch = HyperLogLog()
+
+        self.assertEqual(sketch.count(), 0)
+
+        for value in ['a', 'b', 'a', Decimal('1'), Decimal('1.0')]:
+            sketch.update(value)
+
+        self.assertEqual(sketch.count(), 3)
+
+    def test_count_large(self):
+        sketch = HyperLogLog(12)
+
+        for i in range(100000):
+            sketch.update(Decimal(i))
+
+        # Standard error is 1.6%
+        self.assertAlmostEqual(sketch.count(), 100000, delta=100000 * 0.05)
+
+    def test_merge(self):
+        a = HyperLogLog(10)
+        b = HyperLogLog(10)
+        both = HyperLogLog(10)
+
+        for i in range(5000):
+            a.update(str(i))
+            both.update(str(i))
+
+        for i in range(2500, 7500):
+            b.update(str(i))
+            both.update(str(i))
+
+        a.merge(b)
+
+        self.assertEqual(a.count(), both.count())
+
+    def test_merge_precision(self):
+        with self.assertRaises(ValueError):
+            HyperLogLog(10).merge(HyperLogLog(12))
+
+    def test_invalid_precision(self):
+        with self.assertRaises(ValueError):
+            HyperLogLog(3)
+
+        with self.assertRaises(ValueError):
+            HyperLogLog(19)
+
+
+class TestStableHash(unittest.TestCase):
+    def test_stable(self):
+        self.assertEqual(stable_hash('agate'), 0x746356ba92ad0c8a)
+
+    def test_equal_values(self):
+        self.assertEqual(stable_hash(Decimal('1.50')), stable_hash(Decimal('1.5')))
+        self.assertEqual(stable_hash(Decimal('0')), stable_hash(Decimal('-0.00')))
+        self.assertEqual(stable_hash(2), stable_hash(Decimal('2')))
+
+    def test_types(self):
+        values = [
+            '1',
+            Decimal('1'),
+            True,
+            datetime.date(2020, 1, 1),
+            datetime.datetime(2020, 1, 1),
+            datetime.timedelta(days=1),
+        ]
+
+        self.assertEqual(len(set(stable_hash(v) for v in values)), len(values))
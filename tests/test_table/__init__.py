@@ -2,7 +2,7 @@ import warnings
 from decimal import Decimal
 
 from agate import Table
-from agate.computations import Formula
+from agate.computations import Formula, col
 from agate.data_types import Number, Text
 from agate.exceptions import CastError
 from agate.testcase import AgateTestCase
@@ -440,6 +440,22 @@ class TestBasic(AgateTestCase):
 
         self.assertRowNames(new_table, ['b', '👍'])
 
+    def test_where_expression(self):
+        table = Table(self.rows, self.column_names, self.column_types, row_names='three')
+        new_table = table.where((col('one') == 2) | col('one').is_null())
+
+        self.assertRows(new_table, [
+            self.rows[1],
+            self.rows[2]
+        ])
+        self.assertRowNames(new_table, ['b', '👍'])
+
+    def test_where_expression_invalid(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+
+        with self.assertRaises(KeyError):
+            table.where(col('four') > 1)
+
     def test_find(self):
         table = Table(self.rows, self.column_names, self.column_types)
 
@@ -1,5 +1,7 @@
+import warnings
+
 from agate import Table
-from agate.aggregations import Count, Sum
+from agate.aggregations import Count, MaxLength, Mean, Median, StDev, Sum
 from agate.data_types import Number, Text
 from agate.testcase import AgateTestCase
 
@@ -37,3 +39,23 @@ class TestAggregate(AgateTestCase):
                 'sum': 9
             }
         )
+
+    def test_multiple_shared(self):
+        aggregations = [
+            ('count', Count()),
+            ('sum', Sum('two')),
+            ('mean', Mean('one')),
+            ('median', Median('two')),
+            ('stdev', StDev('two')),
+            ('max_length', MaxLength('three')),
+        ]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+
+            results = self.table.aggregate(aggregations)
+
+            for name, aggregation in aggregations:
+                self.assertEqual(results[name], self.table.aggregate(aggregation))
+
+        self.assertIsNone(self.table.columns['one']._cache)
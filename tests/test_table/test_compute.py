@@ -1,5 +1,5 @@
 from agate import Table
-from agate.computations import Formula
+from agate.computations import Change, Formula, Percent
 from agate.data_types import Number, Text
 from agate.testcase import AgateTestCase
 
@@ -97,3 +97,27 @@ class TestCompute(AgateTestCase):
 
         self.assertSequenceEqual(new_table.rows[0], ('a', 5, 3, 4, 1))
         self.assertSequenceEqual(new_table.columns['two'], (5, 8, 6, 9))
+
+    def test_compute_mixed(self):
+        new_table = self.table.compute([
+            ('three', Percent('two')),
+            ('change', Change('two', 'three')),
+            ('two', Formula(self.number_type, lambda r: r['two'] * 10)),
+            ('percent', Percent('two'))
+        ], replace=True)
+
+        self.assertColumnNames(new_table, ['one', 'two', 'three', 'four', 'change', 'percent'])
+        self.assertColumnTypes(new_table, [Text, Number, Number, Number, Number, Number])
+
+        self.assertSequenceEqual(new_table.rows[0], ('a', 20, 20, 4, 1, 20))
+        self.assertSequenceEqual(new_table.columns['change'], (1, 2, 2, 3))
+        self.assertSequenceEqual(new_table.columns['two'], (20, 30, 20, 30))
+
+    def test_compute_replace_twice(self):
+        new_table = self.table.compute([
+            ('two', Formula(self.number_type, lambda r: 1)),
+            ('two', Percent('two'))
+        ], replace=True)
+
+        self.assertColumnNames(new_table, ['one', 'two', 'three', 'four'])
+        self.assertSequenceEqual(new_table.columns['two'], (20, 30, 20, 30))
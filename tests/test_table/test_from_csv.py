@@ -1,6 +1,10 @@
+import gzip
+import importlib
+import os
 import warnings
 
 from agate import Table
+from agate.compression import add_extension
 from agate.data_types import Boolean, Date, DateTime, Number, Text, TimeDelta
 from agate.testcase import AgateTestCase
 from agate.type_tester import TypeTester
@@ -212,3 +216,45 @@ class TestFromCSV(AgateTestCase):
 
         self.assertColumnNames(table, ['a', 'b'])
         self.assertRows(table, [])
+
+    def test_from_csv_compression(self):
+        table1 = Table.from_csv('examples/test.csv')
+
+        for compression in ('gzip', 'bz2', 'lzma'):
+            path = add_extension('.test.csv', compression)
+
+            with open('examples/test.csv', 'rb') as f, importlib.import_module(compression).open(path, 'wb') as g:
+                g.write(f.read())
+
+            table2 = Table.from_csv(path)
+
+            self.assertColumnNames(table2, table1.column_names)
+            self.assertColumnTypes(table2, [Number, Text, Boolean, Date, DateTime, TimeDelta])
+            self.assertRows(table2, table1.rows)
+
+            os.remove(path)
+
+    def test_from_csv_compression_argument(self):
+        table1 = Table.from_csv('examples/test.csv')
+
+        with open('examples/test.csv', 'rb') as f, gzip.open('.test.dat', 'wb') as g:
+            g.write(f.read())
+
+        table2 = Table.from_csv('.test.dat', compression='gzip')
+
+        self.assertRows(table2, table1.rows)
+
+        os.remove('.test.dat')
+
+    def test_from_csv_compression_sniff(self):
+        table1 = Table.from_csv('examples/test_csv_sniff.csv', sniff_limit=None)
+
+        with open('examples/test_csv_sniff.csv', 'rb') as f, gzip.open('.test.csv.gz', 'wb') as g:
+            g.write(f.read())
+
+        table2 = Table.from_csv('.test.csv.gz', sniff_limit=200)
+
+        self.assertColumnNames(table2, table1.column_names)
+        self.assertRows(table2, table1.rows)
+
+        os.remove('.test.csv.gz')
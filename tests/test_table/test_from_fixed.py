@@ -1,3 +1,6 @@
+import gzip
+import os
+
 from agate import Table
 from agate.testcase import AgateTestCase
 
@@ -11,3 +14,15 @@ class TestFromFixed(AgateTestCase):
         self.assertColumnTypes(table2, [type(c) for c in table1.column_types])
 
         self.assertRows(table2, table1.rows)
+
+    def test_from_fixed_compression(self):
+        table1 = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv')
+
+        with open('examples/testfixed', 'rb') as f, gzip.open('.testfixed.gz', 'wb') as g:
+            g.write(f.read())
+
+        table2 = Table.from_fixed('.testfixed.gz', 'examples/testfixed_schema.csv')
+
+        self.assertRows(table2, table1.rows)
+
+        os.remove('.testfixed.gz')
@@ -0,0 +1,150 @@
+import datetime
+import random
+from decimal import Decimal
+
+from agate import Table
+from agate.aggregations import (Count, Max, MaxLength, Mean, Min, PopulationStDev, PopulationVariance, StDev, Sum,
+                                Variance)
+from agate.data_types import Number, Text, TimeDelta
+from agate.testcase import AgateTestCase
+
+
+class TestGroupAggregate(AgateTestCase):
+    def setUp(self):
+        self.rows = (
+            ('a', 'x', 2, 'foo'),
+            ('b', 'y', 3, 'ba'),
+            ('a', 'z', None, 'b'),
+            ('c', 'x', 5, None),
+            ('a', 'x', 1, 'fooo'),
+            ('b', 'x', 4, 'bar'),
+        )
+
+        self.number_type = Number()
+        self.text_type = Text()
+
+        self.column_names = ['letter', 'code', 'number', 'text']
+        self.column_types = [self.text_type, self.text_type, self.number_type, self.text_type]
+
+        self.table = Table(self.rows, self.column_names, self.column_types)
+
+        self.aggregations = [
+            ('count', Count()),
+            ('count_number', Count('number')),
+            ('count_x', Count('code', 'x')),
+            ('sum', Sum('number')),
+            ('min', Min('number')),
+            ('max', Max('number')),
+            ('mean', Mean('number')),
+            ('max_length', MaxLength('text')),
+        ]
+
+    def assertTablesEqual(self, table, expected):
+        self.assertColumnNames(table, expected.column_names)
+        self.assertColumnTypes(table, [type(t) for t in expected.column_types])
+        self.assertRows(table, [tuple(row) for row in expected.rows])
+        self.assertRowNames(table, expected.row_names)
+        self.assertEqual(len(table.rows), len(expected.rows))
+
+    def test_group_aggregate(self):
+        table = self.table.group_aggregate('letter', self.aggregations)
+        expected = self.table.group_by('letter').aggregate(self.aggregations)
+
+        self.assertTablesEqual(table, expected)
+        self.assertRows(table, [
+            ('a', 3, 2, 2, Decimal('3'), Decimal('1'), Decimal('2'), Decimal('1.5'), Decimal('4')),
+            ('b', 2, 2, 1, Decimal('7'), Decimal('3'), Decimal('4'), Decimal('3.5'), Decimal('3')),
+            ('c', 1, 1, 1, Decimal('5'), Decimal('5'), Decimal('5'), Decimal('5'), Decimal('0')),
+        ])
+
+    def test_group_aggregate_variance(self):
+        rng = random.Random(0)
+        rows = [
+            ('k%i' % rng.randrange(10), Decimal(rng.randrange(10000000)) / 1000 if rng.random() > 0.1 else None)
+            for i in range(2000)
+        ]
+        table = Table(rows, ['key', 'value'], [self.text_type, self.number_type])
+        aggregations = [
+            ('variance', Variance('value')),
+            ('stdev', StDev('value')),
+            ('population_variance', PopulationVariance('value')),
+            ('population_stdev', PopulationStDev('value')),
+        ]
+
+        new_table = table.group_aggregate('key', aggregations)
+        expected = table.group_by('key').aggregate(aggregations)
+
+        self.assertColumnNames(new_table, expected.column_names)
+        self.assertEqual(len(new_table.rows), len(expected.rows))
+
+        # Welford's algorithm may differ from run() in the last digits
+        for row, expected_row in zip(new_table.rows, expected.rows):
+            self.assertEqual(row[0], expected_row[0])
+
+            for value, expected_value in zip(row[1:], expected_row[1:]):
+                self.assertLess(abs(value - expected_value), abs(expected_value) * Decimal('1e-20'))
+
+    def test_group_aggregate_multiple_keys(self):
+        table = self.table.group_aggregate(['letter', 'code'], self.aggregations)
+        expected = self.table.group_by('letter').group_by('code').aggregate(self.aggregations)
+
+        self.assertTablesEqual(table, expected)
+        self.assertSequenceEqual(table.columns['code'].values(), ('x', 'z', 'y', 'x', 'x'))
+
+    def test_group_aggregate_function(self):
+        def key(row):
+            return row['number'] is not None and row['number'] > 2
+
+        table = self.table.group_aggregate(key, self.aggregations, key_name='big', key_type=self.number_type)
+        expected = self.table.group_by(key, key_name='big', key_type=self.number_type).aggregate(self.aggregations)
+
+        self.assertTablesEqual(table, expected)
+        self.assertColumnNames(table, ['big'] + [name for name, aggregation in self.aggregations])
+
+    def test_group_aggregate_timedelta(self):
+        table = Table([
+            ('a', datetime.timedelta(seconds=1)),
+            ('a', datetime.timedelta(seconds=2)),
+            ('b', None),
+        ], ['letter', 'delta'], [self.text_type, TimeDelta()])
+
+        new_table = table.group_aggregate('letter', [('sum', Sum('delta'))])
+
+        self.assertRows(new_table, [
+            ('a', datetime.timedelta(seconds=3)),
+            ('b', datetime.timedelta(0)),
+        ])
+
+    def test_group_aggregate_empty(self):
+        table = Table([], self.column_names, self.column_types)
+
+        new_table = table.group_aggregate('letter', self.aggregations)
+        expected = table.group_by('letter').aggregate(self.aggregations)
+
+        self.assertColumnNames(new_table, expected.column_names)
+        self.assertRows(new_table, [])
+
+    def test_group_aggregate_no_keys(self):
+        with self.assertRaises(ValueError):
+            self.table.group_aggregate([], self.aggregations)
+
+    def test_group_aggregate_key_name_sequence(self):
+        with self.assertRaises(ValueError):
+            self.table.group_aggregate(['letter', 'code'], self.aggregations, key_name='foo')
+
+    def test_group_aggregate_bad_column(self):
+        with self.assertRaises(KeyError):
+            self.table.group_aggregate('bad', self.aggregations)
+
+    def test_group_aggregate_subclass_run(self):
+        class DoubleSum(Sum):
+            def run(self, table):
+                return super().run(table) * 2
+
+        new_table = self.table.group_aggregate('letter', [('double', DoubleSum('number'))])
+
+        self.assertRows(new_table, [
+            ('a', 6),
+            ('b', 14),
+            ('c', 10),
+        ])
@@ -1,6 +1,7 @@
 from decimal import Decimal
 
 from agate import Table, TableSet
+from agate.aggregations import Count, Sum
 from agate.data_types import Boolean, Number, Text
 from agate.testcase import AgateTestCase
 
@@ -108,3 +109,70 @@ class TestGroupBy(AgateTestCase):
 
         with self.assertRaises(KeyError):
             table.group_by('bad')
+
+    def test_group_by_multiple(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+
+        tableset = table.group_by(['one', 'two'])
+
+        self.assertIsInstance(tableset, TableSet)
+        self.assertSequenceEqual(tableset.keys(), ['a', None, 'b'])
+        self.assertEqual(tableset.key_name, 'one')
+        self.assertIsInstance(tableset.key_type, Text)
+
+        self.assertIsInstance(tableset['a'], TableSet)
+        self.assertSequenceEqual(tableset['a'].keys(), [Decimal('2')])
+        self.assertEqual(tableset['a'].key_name, 'two')
+        self.assertIsInstance(tableset['a'].key_type, Number)
+
+        self.assertRows(tableset['a'][Decimal('2')], [self.rows[0], self.rows[2]])
+
+    def test_group_by_multiple_matches_chained(self):
+        rows = self.rows + (
+            ('b', 2, 1, 1),
+            ('a', 3, 4, 1),
+            ('b', 3, 6, None),
+        )
+        table = Table(rows, self.column_names, self.column_types)
+
+        tableset = table.group_by(['one', lambda row: row['three'] > 3, 'two'])
+        chained = table.group_by('one').group_by(lambda row: row['three'] > 3).group_by('two')
+
+        def flatten(tableset):
+            items = []
+
+            for key, value in tableset.items():
+                if isinstance(value, TableSet):
+                    items.append((key, value.key_name, type(value.key_type), flatten(value)))
+                else:
+                    items.append((key, [row.values() for row in value.rows]))
+
+            return items
+
+        self.assertEqual(flatten(tableset), flatten(chained))
+
+        aggregations = [('count', Count()), ('sum', Sum('three'))]
+        results = tableset.aggregate(aggregations)
+        chained_results = chained.aggregate(aggregations)
+
+        self.assertColumnNames(results, chained_results.column_names)
+        self.assertColumnNames(results, ['one', 'group', 'two', 'count', 'sum'])
+        self.assertRows(results, [row.values() for row in chained_results.rows])
+        self.assertRowNames(results, chained_results.row_names)
+
+    def test_group_by_multiple_empty(self):
+        table = Table([], self.column_names, self.column_types)
+
+        tableset = table.group_by(['one', 'two'])
+
+        self.assertSequenceEqual(tableset.keys(), [])
+        self.assertEqual(len(tableset.aggregate([('count', Count())]).rows), 0)
+
+    def test_group_by_multiple_key_name(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+
+        with self.assertRaises(ValueError):
+            table.group_by(['one', 'two'], key_name='foo')
+
+        with self.assertRaises(ValueError):
+            table.group_by([])
@@ -0,0 +1,72 @@
+import types
+
+from agate import Table
+from agate.data_types import Number, Text
+from agate.testcase import AgateTestCase
+
+
+class TestIterGroups(AgateTestCase):
+    def setUp(self):
+        self.rows = (
+            ('a', 2, 3),
+            (None, 3, 5),
+            ('a', 2, 4),
+            ('b', 3, 4)
+        )
+
+        self.number_type = Number()
+        self.text_type = Text()
+
+        self.column_names = ['one', 'two', 'three']
+        self.column_types = [self.text_type, self.number_type, self.number_type]
+
+        self.table = Table(self.rows, self.column_names, self.column_types)
+
+    def test_iter_groups(self):
+        groups = self.table.iter_groups('one')
+
+        self.assertIsInstance(groups, types.GeneratorType)
+
+        groups = list(groups)
+
+        self.assertEqual([group_name for group_name, table in groups], ['a', None, 'b'])
+
+        table = groups[0][1]
+
+        self.assertColumnNames(table, self.column_names)
+        self.assertColumnTypes(table, [Text, Number, Number])
+        self.assertRows(table, [self.rows[0], self.rows[2]])
+
+    def test_iter_groups_matches_group_by(self):
+        tableset = self.table.group_by('two')
+
+        for (group_name, table), (key, expected) in zip(self.table.iter_groups('two'), tableset.items()):
+            self.assertEqual(group_name, key)
+            self.assertRows(table, expected.rows)
+
+    def test_iter_groups_presorted(self):
+        groups = list(self.table.order_by('one').iter_groups('one', presorted=True))
+
+        self.assertEqual([group_name for group_name, table in groups], ['a', 'b', None])
+        self.assertRows(groups[0][1], [self.rows[0], self.rows[2]])
+
+    def test_iter_groups_presorted_runs(self):
+        groups = list(self.table.iter_groups('one', presorted=True))
+
+        self.assertEqual([group_name for group_name, table in groups], ['a', None, 'a', 'b'])
+
+    def test_iter_groups_key_type(self):
+        groups = list(self.table.iter_groups('two', key_type=Text()))
+
+        self.assertEqual([group_name for group_name, table in groups], ['2', '3'])
+
+    def test_iter_groups_function(self):
+        groups = list(self.table.iter_groups(lambda r: r['three'] < 5))
+
+        self.assertEqual([group_name for group_name, table in groups], ['True', 'False'])
+        self.assertRows(groups[0][1], [self.rows[0], self.rows[2], self.rows[3]])
+
+    def test_iter_groups_empty(self):
+        table = Table([], self.column_names, self.column_types)
+
+        self.assertEqual(list(table.iter_groups('one')), [])
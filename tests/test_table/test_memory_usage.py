@@ -0,0 +1,63 @@
+import sys
+
+from agate import Table
+from agate.data_types import Number, Text
+from agate.testcase import AgateTestCase
+
+
+class TestMemoryUsage(AgateTestCase):
+    def setUp(self):
+        self.rows = (
+            ('a', 2, 3),
+            ('b', 3, None),
+            ('c', 2, 4),
+        )
+
+        self.number_type = Number()
+        self.text_type = Text()
+
+        self.column_names = ['one', 'two', 'three']
+        self.column_types = [self.text_type, self.number_type, self.number_type]
+
+        self.table = Table(self.rows, self.column_names, self.column_types)
+
+    def test_memory_usage(self):
+        usage = self.table.memory_usage()
+
+        rows = self.table.rows
+
+        self.assertEqual(list(usage), ['rows', 'values', 'row_names', 'columns', 'total'])
+        self.assertEqual(
+            usage['rows'],
+            sys.getsizeof(rows) + sys.getsizeof(rows._values) + sum(sys.getsizeof(row) for row in rows)
+        )
+        self.assertEqual(usage['values'], sum(sys.getsizeof(row._values) for row in rows))
+        self.assertEqual(usage['row_names'], 0)
+        self.assertEqual(list(usage['columns']), self.column_names)
+
+        for name in self.column_names:
+            self.assertEqual(usage['columns'][name], self.table.columns[name].memory_usage())
+
+        self.assertEqual(usage['total'], usage['rows'] + usage['values'] + sum(usage['columns'].values()))
+
+    def test_memory_usage_shallow(self):
+        usage = self.table.memory_usage(deep=False)
+
+        self.assertEqual(list(usage['columns'].values()), [0, 0, 0])
+        self.assertEqual(usage['total'], usage['rows'] + usage['values'])
+
+    def test_memory_usage_row_names(self):
+        table = Table(self.rows, self.column_names, self.column_types, row_names='one')
+        usage = table.memory_usage()
+
+        # The row names are values of a column, so they are only counted once
+        self.assertEqual(usage['row_names'], sys.getsizeof(table.row_names))
+        self.assertEqual(usage['columns']['one'], self.table.columns['one'].memory_usage())
+
+    def test_memory_usage_shared_values(self):
+        value = 'shared'
+        table = Table([(value, value)] * 3, ['a', 'b'], [self.text_type, self.text_type])
+        usage = table.memory_usage()
+
+        self.assertEqual(usage['columns']['a'], sys.getsizeof(value))
+        self.assertEqual(usage['columns']['b'], 0)
@@ -0,0 +1,61 @@
+import datetime
+import pickle
+from decimal import Decimal
+
+from agate import Table
+from agate.data_types import Boolean, Date, DateTime, Number, Text
+from agate.rows import Row
+from agate.testcase import AgateTestCase
+
+
+class TestPickle(AgateTestCase):
+    def setUp(self):
+        self.rows = (
+            (1, 'a', True, '2015-01-01', '2015-01-01T12:00:00'),
+            (Decimal('-2.50'), None, False, None, None),
+            (None, 'c', None, '1999-12-31', '1999-12-31T23:59:59'),
+            (Decimal('1E+3'), '\x00', True, '2000-02-29', None),
+        )
+
+        self.column_names = ['number', 'text', 'boolean', 'date', 'datetime']
+        self.column_types = [Number(), Text(), Boolean(), Date(), DateTime()]
+
+        self.table = Table(self.rows, self.column_names, self.column_types)
+
+    def test_pickle(self):
+        table = pickle.loads(pickle.dumps(self.table))
+
+        self.assertColumnNames(table, self.column_names)
+        self.assertColumnTypes(table, [Number, Text, Boolean, Date, DateTime])
+        self.assertRows(table, [row.values() for row in self.table.rows])
+
+        for row, original in zip(table.rows, self.table.rows):
+            self.assertIsInstance(row, Row)
+            self.assertEqual(row.keys(), original.keys())
+
+            for value, original_value in zip(row, original):
+                self.assertIs(type(value), type(original_value))
+
+        # Exponents are preserved
+        self.assertEqual(str(table.rows[1]['number']), '-2.50')
+        self.assertEqual(str(table.rows[3]['number']), '1E+3')
+        self.assertEqual(table.rows[3]['date'], datetime.date(2000, 2, 29))
+
+    def test_pickle_row_names(self):
+        table = Table(self.rows, self.column_names, self.column_types, row_names='text')
+        table = pickle.loads(pickle.dumps(table))
+
+        self.assertSequenceEqual(table.row_names, ['a', None, 'c', '\x00'])
+        self.assertEqual(table.rows['c']['date'], datetime.date(1999, 12, 31))
+
+    def test_pickle_empty(self):
+        table = pickle.loads(pickle.dumps(self.table.limit(0)))
+
+        self.assertColumnNames(table, self.column_names)
+        self.assertEqual(len(table.rows), 0)
+
+    def test_pickle_smaller(self):
+        table = Table([(i, str(i)) for i in range(100)], ['number', 'text'], [Number(), Text()])
+        rows_size = len(pickle.dumps([row for row in table.rows]))
+
+        self.assertLess(len(pickle.dumps(table)), rows_size / 2)
@@ -2,7 +2,7 @@ import sys
 from decimal import Decimal
 
 from agate import Table
-from agate.aggregations import Sum
+from agate.aggregations import Count, MaxLength, Sum
 from agate.computations import Percent
 from agate.data_types import Number, Text
 from agate.testcase import AgateTestCase
@@ -90,6 +90,7 @@ class TestPivot(AgateTestCase):
         self.assertColumnNames(pivot_table, ['male', 'female'])
         self.assertColumnTypes(pivot_table, [Number, Number])
         self.assertRows(pivot_table, pivot_rows)
+        self.assertRowNames(pivot_table, [()])
 
     def test_pivot_no_pivot(self):
         table = Table(self.rows, self.column_names, self.column_types)
@@ -107,6 +108,53 @@ class TestPivot(AgateTestCase):
         self.assertColumnTypes(pivot_table, [Text, Number])
         self.assertRows(pivot_table, pivot_rows)
 
+    def test_pivot_no_key_no_pivot(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+
+        pivot_table = table.pivot()
+
+        self.assertColumnNames(pivot_table, ['Count'])
+        self.assertColumnTypes(pivot_table, [Number])
+        self.assertRows(pivot_table, [(6,)])
+        self.assertRowNames(pivot_table, [()])
+
+    def test_pivot_multiple_aggregations(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+
+        pivot_table = table.pivot('race', 'gender', [
+            ('count', Count()),
+            ('age', Sum('age')),
+            ('name', MaxLength('name'))
+        ])
+
+        pivot_rows = (
+            ('white', 1, 20, 3, 2, 45, 5),
+            ('black', 1, 20, 4, 0, 0, 0),
+            ('latino', 1, 25, 3, 0, 0, 0),
+            ('asian', 0, 0, 0, 1, 25, 4)
+        )
+
+        self.assertColumnNames(pivot_table, [
+            'race', 'male_count', 'male_age', 'male_name', 'female_count', 'female_age', 'female_name'
+        ])
+        self.assertColumnTypes(pivot_table, [Text, Number, Number, Number, Number, Number, Number])
+        self.assertRowNames(pivot_table, ['white', 'black', 'latino', 'asian'])
+        self.assertRows(pivot_table, pivot_rows)
+
+    def test_pivot_multiple_aggregations_no_pivot(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+
+        pivot_table = table.pivot('gender', aggregation=[('count', Count()), ('age', Sum('age'))])
+
+        self.assertColumnNames(pivot_table, ['gender', 'count', 'age'])
+        self.assertRows(pivot_table, [('male', 3, 65), ('female', 3, 70)])
+
+    def test_pivot_multiple_aggregations_computation_invalid(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+
+        with self.assertRaises(ValueError):
+            table.pivot('race', 'gender', [('count', Count())], computation=Percent('count'))
+
     def test_pivot_sum(self):
         table = Table(self.rows, self.column_names, self.column_types)
 
@@ -1,9 +1,12 @@
 import csv
+import gzip
+import importlib
 import os
 import sys
 from io import StringIO
 
 from agate import Table
+from agate.compression import add_extension
 from agate.data_types import Boolean, Date, DateTime, Number, Text, TimeDelta
 from agate.testcase import AgateTestCase
 
@@ -119,3 +122,36 @@ class TestToCSV(AgateTestCase):
             self.assertEqual(contents1, contents2)
         finally:
             sys.stdout = old
+
+    def test_to_csv_compression(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+
+        with open('examples/test.csv') as f:
+            contents2 = f.read()
+
+        for compression in ('gzip', 'bz2', 'lzma'):
+            path = add_extension('.test.csv', compression)
+
+            table.to_csv(path)
+
+            with importlib.import_module(compression).open(path, 'rt') as f:
+                contents1 = f.read()
+
+            self.assertEqual(contents1, contents2)
+
+            os.remove(path)
+
+    def test_to_csv_compression_argument(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+
+        table.to_csv('.test.dat', compression='gzip')
+
+        with gzip.open('.test.dat', 'rt') as f:
+            contents1 = f.read()
+
+        with open('examples/test.csv') as f:
+            contents2 = f.read()
+
+        self.assertEqual(contents1, contents2)
+
+        os.remove('.test.dat')
@@ -1,3 +1,4 @@
+import bz2
 import json
 import os
 import sys
@@ -131,6 +132,21 @@ class TestJSON(AgateTestCase):
 
         os.remove('.test.json')
 
+    def test_to_json_compression(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+
+        table.to_json('.test.json.bz2')
+
+        with bz2.open('.test.json.bz2', 'rt') as f1:
+            js1 = json.load(f1)
+
+        with open('examples/test.json') as f2:
+            js2 = json.load(f2)
+
+        self.assertEqual(js1, js2)
+
+        os.remove('.test.json.bz2')
+
     def test_to_json_make_dir(self):
         table = Table(self.rows, self.column_names, self.column_types)
 
@@ -4,7 +4,7 @@ from collections import OrderedDict
 from io import StringIO
 
 from agate import Table, TableSet
-from agate.computations import Formula
+from agate.computations import CumulativeSum, Formula, RowNumber
 from agate.data_types import Number, Text
 from agate.testcase import AgateTestCase
 
@@ -237,6 +237,26 @@ class TestTableSet(AgateTestCase):
         self.assertSequenceEqual(new_table.rows[1], ('a', 2, 'a-2'))
         self.assertSequenceEqual(new_table.rows[2], ('c', 3, 'c-3'))
 
+    def test_compute_window(self):
+        tableset = TableSet(self.tables.values(), self.tables.keys())
+
+        new_tableset = tableset.compute([
+            ('total', CumulativeSum('number')),
+            ('row_number', RowNumber(order_by='number'))
+        ])
+
+        self.assertRows(new_tableset['table1'], [
+            ('a', 1, 1, 1),
+            ('a', 3, 4, 3),
+            ('b', 2, 6, 2)
+        ])
+
+        self.assertRows(new_tableset['table2'], [
+            ('b', 0, 0, 1),
+            ('a', 2, 2, 2),
+            ('c', 5, 7, 3)
+        ])
+
     def test_select(self):
         tableset = TableSet(self.tables.values(), self.tables.keys())
 
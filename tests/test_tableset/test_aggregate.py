@@ -2,7 +2,7 @@ from collections import OrderedDict
 from decimal import Decimal
 
 from agate import Table, TableSet
-from agate.aggregations import Count, MaxLength, Mean, Min, Sum
+from agate.aggregations import ApproxCountDistinct, Count, MaxLength, Mean, Min, Sum
 from agate.data_types import Number, Text
 from agate.exceptions import DataTypeError
 from agate.testcase import AgateTestCase
@@ -111,6 +111,21 @@ class TestAggregate(AgateTestCase):
             ('table3', 3, 1)
         ])
 
+    def test_aggregate_approx_count_distinct(self):
+        tableset = TableSet(self.tables.values(), self.tables.keys())
+
+        new_table = tableset.aggregate([
+            ('letters', ApproxCountDistinct('letter'))
+        ])
+
+        self.assertColumnNames(new_table, ('group', 'letters'))
+        self.assertColumnTypes(new_table, [Text, Number])
+        self.assertRows(new_table, [
+            ('table1', 2),
+            ('table2', 3),
+            ('table3', 2)
+        ])
+
     def test_aggregate_two_ops(self):
         tableset = TableSet(self.tables.values(), self.tables.keys())
 
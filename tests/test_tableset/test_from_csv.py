@@ -0,0 +1,182 @@
+import bz2
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import warnings
+
+from agate import Table, TableSet, TypeTester
+from agate.data_types import Number, Text
+from agate.exceptions import CastError
+from agate.testcase import AgateTestCase
+
+
+class TestFromCSV(AgateTestCase):
+    def test_workers(self):
+        tableset1 = TableSet.from_csv('examples/tableset')
+        tableset2 = TableSet.from_csv('examples/tableset', workers=2)
+
+        self.assertSequenceEqual(tableset1.keys(), tableset2.keys())
+        self.assertSequenceEqual(tableset1.column_names, tableset2.column_names)
+
+        for name in tableset1.keys():
+            self.assertColumnTypes(tableset2[name], [Text, Number])
+            self.assertRows(tableset2[name], tableset1[name].rows)
+
+    def test_names(self):
+        dir_path = tempfile.mkdtemp()
+
+        try:
+            for name in ('sales.csv', 'vcs.csv', 'costs.csv.gz'):
+                Table([(1,)], ['a']).to_csv(os.path.join(dir_path, name))
+
+            tableset = TableSet.from_csv(dir_path)
+
+            self.assertSequenceEqual(sorted(tableset.keys()), ['costs', 'sales', 'vcs'])
+        finally:
+            shutil.rmtree(dir_path)
+
+    def test_names_duplicate(self):
+        dir_path = tempfile.mkdtemp()
+
+        try:
+            for name in ('sales.csv', 'sales.csv.gz'):
+                Table([(1,)], ['a']).to_csv(os.path.join(dir_path, name))
+
+            with self.assertRaises(ValueError):
+                TableSet.from_csv(dir_path)
+        finally:
+            shutil.rmtree(dir_path)
+
+    def test_shared_types(self):
+        tableset = TableSet.from_csv('examples/tableset', shared_types=True)
+
+        self.assertEqual(len(tableset), 3)
+
+        column_types = tableset['table1'].column_types
+
+        for table in tableset:
+            self.assertColumnTypes(table, [Text, Number])
+            self.assertIs(table.column_types[1], column_types[1])
+
+    def test_shared_types_type_error(self):
+        tableset = TableSet.from_csv('examples/tableset/type_error', shared_types=True)
+
+        for table in tableset:
+            self.assertColumnTypes(table, [Text, Text])
+        self.assertEqual(tableset['table2'].rows[0]['number'], '0')
+
+    def test_shared_types_limit(self):
+        tableset = TableSet.from_csv('examples/tableset/type_error', column_types=TypeTester(limit=1),
+                                     shared_types=True)
+
+        for table in tableset:
+            self.assertColumnTypes(table, [Text, Text])
+
+    def test_shared_types_limit_zero(self):
+        dir_path = tempfile.mkdtemp()
+
+        try:
+            for name in ('table1.csv', 'table2.csv'):
+                with open(os.path.join(dir_path, name), 'w') as f:
+                    f.write('1,2\n3,4\n')
+
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+
+                tableset = TableSet.from_csv(dir_path, column_types=TypeTester(limit=0), header=False,
+                                             shared_types=True)
+
+            for table in tableset:
+                self.assertColumnNames(table, ['a', 'b'])
+                self.assertColumnTypes(table, [Text, Text])
+                self.assertRows(table, [('1', '2'), ('3', '4')])
+        finally:
+            shutil.rmtree(dir_path)
+
+    def test_shared_types_workers(self):
+        tableset = TableSet.from_csv('examples/tableset/type_error', shared_types=True, workers=2)
+
+        for table in tableset:
+            self.assertColumnTypes(table, [Text, Text])
+
+    def test_shared_types_sample_rows(self):
+        dir_path = tempfile.mkdtemp()
+
+        try:
+            with open(os.path.join(dir_path, 'table1.csv'), 'w') as f:
+                f.write('letter,number\na,1\nb,2\nc,x\n')
+
+            with self.assertRaises(CastError):
+                TableSet.from_csv(dir_path, shared_types=True, sample_rows=2)
+
+            tableset = TableSet.from_csv(dir_path, shared_types=True, sample_rows=None)
+
+            self.assertColumnTypes(tableset['table1'], [Text, Text])
+        finally:
+            shutil.rmtree(dir_path)
+
+    def test_shared_types_column_names_not_equal(self):
+        dir_path = tempfile.mkdtemp()
+
+        try:
+            shutil.copy('examples/tableset/table1.csv', dir_path)
+
+            with open(os.path.join(dir_path, 'table2.csv'), 'w') as f:
+                f.write('letter,count\na,1\n')
+
+            with self.assertRaises(ValueError):
+                TableSet.from_csv(dir_path, shared_types=True)
+        finally:
+            shutil.rmtree(dir_path)
+
+    def test_compression(self):
+        tableset1 = TableSet.from_csv('examples/tableset')
+
+        tableset1.to_csv('.test-tableset', compression='gzip')
+
+        self.assertTrue(os.path.exists('.test-tableset/table1.csv.gz'))
+
+        tableset2 = TableSet.from_csv('.test-tableset', workers=2)
+
+        self.assertSequenceEqual(sorted(tableset2.keys()), sorted(tableset1.keys()))
+
+        for name in tableset1.keys():
+            self.assertRows(tableset2[name], tableset1[name].rows)
+
+        shutil.rmtree('.test-tableset')
+
+    def test_to_csv_compression(self):
+        tableset = TableSet.from_csv('examples/tableset')
+
+        try:
+            tableset.to_csv('.test-tableset')
+            tableset.to_csv('.test-tableset', compression='gzip')
+
+            for name in tableset.keys():
+                with open('.test-tableset/%s.csv' % name) as f:
+                    contents1 = f.read()
+
+                with gzip.open('.test-tableset/%s.csv.gz' % name, 'rt') as f:
+                    contents2 = f.read()
+
+                self.assertEqual(contents1, contents2)
+        finally:
+            shutil.rmtree('.test-tableset')
+
+    def test_to_json_compression(self):
+        tableset = TableSet.from_csv('examples/tableset')
+
+        tableset.to_json('.test-tableset', compression='lzma')
+
+        table = Table.from_json('.test-tableset/table1.json.xz')
+
+        self.assertRows(table, tableset['table1'].rows)
+
+        tableset.to_json('.test-tableset/nested.json.bz2', nested=True)
+
+        with bz2.open('.test-tableset/nested.json.bz2', 'rt') as f:
+            self.assertEqual(len(json.load(f)['table1']), len(tableset['table1'].rows))
+
+        shutil.rmtree('.test-tableset')
@@ -2,6 +2,7 @@ from collections import OrderedDict
 
 from agate import Table, TableSet
 from agate.aggregations import Count, Sum
+from agate.computations import col
 from agate.data_types import Number, Text
 from agate.testcase import AgateTestCase
 
@@ -50,6 +51,16 @@ class TestHaving(AgateTestCase):
         self.assertIs(new_tableset.values()[0], tableset['table3'])
         self.assertEqual(new_tableset.key_name, 'test')
 
+    def test_having_expression(self):
+        tableset = TableSet(self.tables.values(), self.tables.keys(), key_name='test')
+
+        new_tableset = tableset.having([
+            ('count', Count()),
+            ('number_sum', Sum('number'))
+        ], (col('count') >= 3) & (col('number_sum') > 6))
+
+        self.assertSequenceEqual(new_tableset.keys(), ['table2'])
+
     def test_having_complex(self):
         tableset = TableSet(self.tables.values(), self.tables.keys(), key_name='test')
 
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+
+from agate import Table, TableSet
+from agate.data_types import Number, Text
+from agate.testcase import AgateTestCase
+
+
+class TestMemoryUsage(AgateTestCase):
+    def setUp(self):
+        self.table1 = (
+            ('a', 1),
+            ('a', 3),
+            ('b', 2)
+        )
+
+        self.table2 = (
+            ('b', 0),
+            ('a', 2),
+            ('c', 5)
+        )
+
+        self.text_type = Text()
+        self.number_type = Number()
+
+        self.column_names = ['letter', 'number']
+        self.column_types = [self.text_type, self.number_type]
+
+        self.tables = OrderedDict([
+            ('table1', Table(self.table1, self.column_names, self.column_types)),
+            ('table2', Table(self.table2, self.column_names, self.column_types)),
+        ])
+
+        self.tableset = TableSet(self.tables.values(), self.tables.keys())
+
+    def test_memory_usage(self):
+        usage = self.tableset.memory_usage()
+        table_usages = [table.memory_usage() for table in self.tables.values()]
+
+        for key in ('rows', 'values', 'row_names'):
+            self.assertEqual(usage[key], sum(table_usage[key] for table_usage in table_usages))
+
+        self.assertEqual(list(usage['columns']), self.column_names)
+        self.assertEqual(usage['columns']['number'], sum(u['columns']['number'] for u in table_usages))
+        self.assertEqual(
+            usage['total'],
+            usage['rows'] + usage['values'] + usage['row_names'] + sum(usage['columns'].values())
+        )
+
+    def test_memory_usage_shared(self):
+        tableset = TableSet([self.tables['table1']] * 2, ['x', 'y'])
+
+        self.assertEqual(tableset.memory_usage(), self.tables['table1'].memory_usage())
+
+    def test_memory_usage_nested(self):
+        usage = self.tableset.memory_usage()
+        nested_usage = self.tableset.group_by('letter').memory_usage()
+
+        # The nested tables share rows with these tables
+        self.assertEqual(nested_usage['values'], usage['values'])
+        self.assertEqual(nested_usage['columns'], usage['columns'])
@@ -0,0 +1,36 @@
+import pickle
+
+from agate import Table, TableSet
+from agate.data_types import Number, Text
+from agate.testcase import AgateTestCase
+
+
+class TestPickle(AgateTestCase):
+    def setUp(self):
+        self.rows = (
+            ('a', 1),
+            ('b', 2),
+            ('a', 3),
+        )
+
+        self.column_names = ['letter', 'number']
+        self.column_types = [Text(), Number()]
+
+        self.table = Table(self.rows, self.column_names, self.column_types)
+
+    def test_pickle(self):
+        tableset = self.table.group_by('letter', key_name='group')
+        restored = pickle.loads(pickle.dumps(tableset))
+
+        self.assertIsInstance(restored, TableSet)
+        self.assertSequenceEqual(restored.keys(), ['a', 'b'])
+        self.assertEqual(restored.key_name, 'group')
+        self.assertIsInstance(restored.key_type, Text)
+        self.assertRows(restored['a'], [self.rows[0], self.rows[2]])
+
+    def test_pickle_nested(self):
+        tableset = self.table.group_by('letter').group_by('number')
+        restored = pickle.loads(pickle.dumps(tableset))
+
+        self.assertEqual(restored['a'].key_name, 'number')
+        self.assertRows(restored['a'][1], [self.rows[2]])
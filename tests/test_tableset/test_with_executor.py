@@ -0,0 +1,91 @@
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from agate import Table, TableSet, config
+from agate.aggregations import Count, Sum
+from agate.computations import Formula
+from agate.data_types import Number, Text
+from agate.testcase import AgateTestCase
+
+
+def double(row):
+    return row['number'] * 2
+
+
+def is_big(row):
+    return row['number'] > 1
+
+
+class TestWithExecutor(AgateTestCase):
+    def setUp(self):
+        self.text_type = Text()
+        self.number_type = Number()
+
+        self.column_names = ['letter', 'number']
+        self.column_types = [self.text_type, self.number_type]
+
+        self.tables = OrderedDict([
+            ('table1', Table([('a', 1), ('a', 3), ('b', 2)], self.column_names, self.column_types)),
+            ('table2', Table([('b', 0), ('a', 2), ('c', 5)], self.column_names, self.column_types, 'letter')),
+            ('table3', Table([('a', 1), ('a', 2), ('c', 3)], self.column_names, self.column_types))
+        ])
+
+        self.tableset = TableSet(self.tables.values(), self.tables.keys(), key_name='test')
+
+    def assertTableSetsEqual(self, tableset, expected):
+        self.assertSequenceEqual(tableset.keys(), expected.keys())
+        self.assertEqual(tableset.key_name, expected.key_name)
+
+        for table, expected_table in zip(tableset.values(), expected.values()):
+            self.assertColumnNames(table, expected_table.column_names)
+            self.assertColumnTypes(table, [type(t) for t in expected_table.column_types])
+            self.assertRows(table, [tuple(row) for row in expected_table.rows])
+            self.assertEqual(table.row_names, expected_table.row_names)
+
+    def check(self, executor):
+        tableset = self.tableset.with_executor(executor)
+
+        self.assertIs(tableset._executor, executor)
+
+        computed = tableset.compute([('double', Formula(self.number_type, double))])
+        expected = self.tableset.compute([('double', Formula(self.number_type, double))])
+
+        self.assertIs(computed._executor, executor)
+        self.assertTableSetsEqual(computed, expected)
+        self.assertTableSetsEqual(tableset.where(is_big), self.tableset.where(is_big))
+
+        aggregations = [('count', Count()), ('sum', Sum('number'))]
+
+        self.assertRows(tableset.aggregate(aggregations), self.tableset.aggregate(aggregations).rows)
+
+        grouped = tableset.group_by('letter')
+
+        self.assertRows(grouped.aggregate(aggregations), self.tableset.group_by('letter').aggregate(aggregations).rows)
+
+        having = tableset.having(aggregations, lambda t: t['sum'] > 6)
+
+        self.assertSequenceEqual(having.keys(), ['table2'])
+
+    def test_thread_pool(self):
+        with ThreadPoolExecutor(2) as executor:
+            self.check(executor)
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(2) as executor:
+            self.check(executor)
+
+    def test_no_executor(self):
+        self.check(None)
+
+    def test_option(self):
+        with ThreadPoolExecutor(2) as executor:
+            config.set_option('executor', executor)
+
+            try:
+                self.assertIsNone(self.tableset._executor)
+                self.assertRows(
+                    self.tableset.aggregate([('count', Count())]),
+                    [('table1', 3), ('table2', 3), ('table3', 3)]
+                )
+            finally:
+                config.set_option('executor', None)
@@ -0,0 +1,110 @@
+import io
+import threading
+
+from agate.testcase import AgateTestCase
+from agate.threaded_io import ThreadedReader, ThreadedWriter
+
+
+class FailingReader(io.RawIOBase):
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        raise OSError('broken')
+
+
+class FailingWriter(io.RawIOBase):
+    def writable(self):
+        return True
+
+    def write(self, b):
+        raise OSError('broken')
+
+
+class RecordingWriter(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+
+        self.threads = set()
+        self.contents = None
+
+    def write(self, b):
+        self.threads.add(threading.current_thread())
+
+        return super().write(b)
+
+    def close(self):
+        self.contents = self.getvalue()
+
+        super().close()
+
+
+class TestThreadedReader(AgateTestCase):
+    def test_read(self):
+        data = bytes(range(256)) * 100
+
+        with ThreadedReader(io.BytesIO(data), block_size=100, queue_size=2) as f:
+            self.assertEqual(f.read(), data)
+            self.assertEqual(f.read(), b'')
+
+    def test_close_early(self):
+        source = io.BytesIO(b'x' * 100000)
+
+        f = ThreadedReader(source, block_size=10, queue_size=1)
+        self.assertEqual(f.read(5), b'xxxxx')
+        f.close()
+
+        self.assertTrue(source.closed)
+
+    def test_error(self):
+        with ThreadedReader(FailingReader()) as f:
+            with self.assertRaises(OSError):
+                f.read()
+
+
+class TestThreadedWriter(AgateTestCase):
+    def test_write(self):
+        target = RecordingWriter()
+
+        with ThreadedWriter(target, block_size=100, queue_size=2) as f:
+            for i in range(1000):
+                f.write(b'%i,' % i)
+
+        self.assertTrue(target.closed)
+        self.assertEqual(target.contents, b''.join(b'%i,' % i for i in range(1000)))
+        self.assertNotIn(threading.current_thread(), target.threads)
+
+    def test_flush(self):
+        target = RecordingWriter()
+        f = ThreadedWriter(target, block_size=100)
+
+        f.write(b'abc')
+        self.assertEqual(target.getvalue(), b'')
+
+        f.flush()
+        self.assertEqual(target.getvalue(), b'abc')
+
+        f.close()
+
+    def test_text(self):
+        target = RecordingWriter()
+
+        with io.TextIOWrapper(ThreadedWriter(target), encoding='utf-8') as f:
+            f.write('👍\n')
+
+        self.assertEqual(target.contents, '👍\n'.encode())
+
+    def test_error(self):
+        f = ThreadedWriter(FailingWriter(), block_size=1)
+        f.write(b'a')
+
+        with self.assertRaises(OSError):
+            f.flush()
+
+        with self.assertRaises(OSError):
+            f.write(b'b')
+
+        with self.assertRaises(OSError):
+            f.close()
+
+        self.assertTrue(f._done)
@@ -1,7 +1,8 @@
+import random
 import unittest
 from decimal import Decimal
 
-from agate.utils import Quantiles, letter_name, round_limits
+from agate.utils import NullOrder, Quantiles, argsort, letter_name, nth_smallest, round_limits
 
 
 class TestQuantiles(unittest.TestCase):
@@ -25,6 +26,71 @@ class TestQuantiles(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.quantiles.locate(51)
 
+    def test_locate_duplicates(self):
+        quantiles = Quantiles([0, 10, 10, 10, 20])
+
+        self.assertEqual(quantiles.locate(0), 0)
+        self.assertEqual(quantiles.locate(10), 3)
+        self.assertEqual(quantiles.locate(15), 3)
+        self.assertEqual(quantiles.locate(20), 4)
+
+
+class TestNthSmallest(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+
+        self.values = [Decimal(random.randint(0, 500)) for i in range(1000)]
+        self.sorted = sorted(self.values)
+
+    def test_nth_smallest(self):
+        indices = [499, 500, 0, 999, 250, 250]
+
+        self.assertEqual(nth_smallest(self.values, indices), [self.sorted[i] for i in indices])
+
+    def test_nth_smallest_many(self):
+        indices = list(range(0, 1000, 10))
+
+        self.assertEqual(nth_smallest(self.values, indices), [self.sorted[i] for i in indices])
+
+    def test_nth_smallest_small(self):
+        self.assertEqual(nth_smallest([3, 1, 2], [1]), [2])
+        self.assertEqual(nth_smallest([1], [0]), [1])
+
+    def test_nth_smallest_unchanged(self):
+        values = list(self.values)
+        nth_smallest(values, [500])
+
+        self.assertEqual(values, self.values)
+
+    def test_nth_smallest_out_of_range(self):
+        with self.assertRaises(IndexError):
+            nth_smallest(self.values, [1000])
+
+        with self.assertRaises(IndexError):
+            nth_smallest(self.values, [-1])
+
+
+class TestArgsort(unittest.TestCase):
+    def test_argsort(self):
+        values = [3, None, 1, 3, None, 2]
+
+        self.assertEqual(argsort(values), [2, 5, 0, 3, 1, 4])
+        self.assertEqual(argsort(values, reverse=True), [1, 4, 0, 3, 5, 2])
+        self.assertEqual(argsort([]), [])
+
+    def test_argsort_matches_sorted(self):
+        random.seed(0)
+
+        values = [random.choice([None, 1, 2, 3, 4]) for i in range(100)]
+
+        def key(i):
+            return NullOrder() if values[i] is None else values[i]
+
+        for reverse in (False, True):
+            expected = sorted(range(100), key=key, reverse=reverse)
+
+            self.assertEqual(argsort(values, reverse=reverse), expected)
+
 
 class TestMisc(unittest.TestCase):
     def test_round_limits(self):